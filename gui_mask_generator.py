@@ -1,3 +1,6 @@
+import time
+# Taken first so the time-to-first-frame report includes imports
+startup_started_at = time.perf_counter()
 import pygame, random, sys
 import os
 from PIL import Image
@@ -12,7 +15,7 @@ from rich.panel import Panel
 from rich.text import Text
 from rich.table import Table
 from utils.image_utils import pil_to_pygame_surface, fit_image_to_canvas, grow_binary_mask_pil
-from utils.font_utils import get_cached_font, clear_font_cache, get_system_fonts, get_font
+from utils.font_utils import get_cached_font, clear_font_cache, get_system_fonts, get_font, max_fitting_font_size, scan_font_directory, set_font_coverage, coverage_stats, reset_coverage_stats, font_cache, font_cache_stats, reset_font_cache_stats
 from utils.file_utils import get_images_from_directory
 from utils.modern_ui import (
     ModernUIManager,
@@ -23,13 +26,24 @@ from utils.modern_ui import (
     MultiTemplateSelectionDialog,
     show_modern_batch_save_popup,
 )
-from utils.collision_utils import is_within_canvas, check_padded_collision
+from utils.placement import PlacementEvaluator
 from utils.log_utils import AppLogger
 from utils.sprite_utils import create_arc_sprites, create_normal_sprites, create_asset_sprite
-from utils.config_manager import get_config
-from utils.words_loader import get_words, reload_words
+from utils.save_utils import save_output
+from utils.preview_cache import PreviewCache, RegionLayerCache
+from utils.text_cache import get_text_cache
+from utils.profiler import get_profiler
+from utils.startup import StartupTasks
+from utils.font_index import FontIndex
+from utils.font_warmup import FontWarmup, warmup_size_stages
+from utils.region_compiler import compile_regions, get_region_rule_raster
+from utils.config_manager import get_config, config_manager
+from utils.words_loader import get_words, get_word_index, words_loader
+from utils.word_index import DEFAULT_CHAR_WIDTH
+from utils.word_corpus import WordCorpus, load_word_corpus
 from utils.region_manager import RegionManager
 from utils.region_editor import RegionEditor
+from utils.file_watcher import FileWatcher
 from state import AppState
 
 console = Console()
@@ -42,18 +56,27 @@ app_state = AppState()
 
 # --- Helper ---------------------------------------------------------------
 # Reload configuration at runtime and update the global `config` reference so
-# that other modules pick up the new values automatically.  This mirrors the
-# existing Shift+R behaviour but also refreshes the cached `config` object.
+# that other modules pick up the new values automatically.  Used by Shift+R and
+# by the config.yaml file watcher (see poll_file_changes).
 
 def reload_configuration():
-    """Reload the YAML configuration and update the global `config`."""
+    """
+    Reload the YAML configuration, update the global `config` and apply the settings
+    that changed (see apply_config_changes). Returns True if the canvas should be laid
+    out again; a file that cannot be read keeps the current configuration.
+    """
     global config
 
-    from utils.config_manager import reload_config as _reload_cfg, get_config as _get_cfg
+    from utils.config_manager import reload_config as _reload_cfg, get_config as _get_cfg, diff_configs
 
-    _reload_cfg()
+    previous = config
+    if not _reload_cfg(keep_current_on_error=True):
+        logger.warning("config.yaml could not be read; keeping the current configuration")
+        return False
     config = _get_cfg()
-    logger.success("Configuration reloaded")
+    changed = diff_configs(previous, config)
+    logger.success(f"Configuration reloaded ({len(changed)} setting(s) changed)")
+    return apply_config_changes(changed)
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_IMG_DIR = os.path.join(SCRIPT_DIR, config.paths.default_image_dir)
@@ -85,19 +108,18 @@ toggle_region_button = None
 original_pil_image = None
 current_background_image = None
 current_background_surface = None
-SUPPORTED_IMAGE_EXTENSIONS = set(config.supported_extensions.images)
-DEFAULT_BACKGROUND_COLOR = tuple(config.display.default_background_color)
+# Composed preview and mask layers, rebuilt only when the layout or background changes
+preview_cache = PreviewCache()
+region_layer_cache = RegionLayerCache()
+# Per-phase timings of layout() and save_output(), shown in the info bar and the batch report
+profiler = get_profiler()
 
 zoom_level = 1.0
 pan_offset_x = 0
 pan_offset_y = 0
 is_dragging = False
 last_mouse_pos = (0, 0)
-MIN_ZOOM = config.zoom.min_level
-MAX_ZOOM = config.zoom.max_level
-ZOOM_SPEED = config.zoom.speed
 
-SHOW_FONT_INFO = config.fonts.show_info
 custom_font_paths = []
 
 current_image_directory = []
@@ -110,44 +132,76 @@ FORCE_REGIONS_ONLY = config.debug.force_regions_only
 # --- Active Dialog State ---
 active_dialog = None
 
-if FONT_DIR and os.path.isdir(FONT_DIR):
-    for root, _, files in os.walk(FONT_DIR):
-        for fname in files:
-            if any(fname.lower().endswith(ext) for ext in config.supported_extensions.fonts):
-                custom_font_paths.append(os.path.join(root, fname))
-    logger.success(f"Found {len(custom_font_paths)} custom fonts in '{FONT_DIR}' (recursive search)")
-else:
-    system_fonts = get_system_fonts()
-    logger.warning(f"Custom font directory not found. Using {len(system_fonts)} system fonts.")
+# --- Staged startup ---
+# Fonts, assets, words and the first image are loaded by background tasks (see
+# start_startup_tasks) while the window already shows frames; layout() waits for them.
+startup_complete = False
+first_frame_reported = False
 
 ASSET_DIR = os.path.join(SCRIPT_DIR, "assets")
 ASSET_PATHS = []
-if os.path.isdir(ASSET_DIR):
-    for fname in os.listdir(ASSET_DIR):
-        if fname.lower().endswith('.png'):
-            ASSET_PATHS.append(os.path.join(ASSET_DIR, fname))
-    logger.success(f"Found {len(ASSET_PATHS)} assets in '{ASSET_DIR}'")
-else:
-    logger.warning(f"Asset directory not found at '{ASSET_DIR}'")
-
-WORDS = get_words()
-
-TEXT_TYPES = config.text.types
-TEXT_TYPE_WEIGHTS = config.text.type_weights
-MIN_FONT_SIZE = config.fonts.min_size
-MAX_FONT_SIZE = config.fonts.max_size
 
-MAX_WORDS = config.layout.max_words
-MAX_ATTEMPTS_PER_WORD = config.layout.max_attempts_per_word
-MAX_ATTEMPTS_TOTAL = config.layout.max_attempts_total
-CANVAS_PADDING = config.canvas.padding
-
-PADDING = config.text.normal.padding
-
-ARC_MIN_RADIUS = config.text.arc.min_radius
-ARC_MAX_RADIUS = config.text.arc.max_radius
-ROTATE_LETTERS_ON_ARC = config.fonts.rotate_letters_on_arc
-MAX_ARC_LETTER_ROTATION = config.fonts.max_arc_letter_rotation
+# Validated fonts with their metrics and glyph coverage, kept on disk between runs
+font_index = FontIndex(os.path.join(SCRIPT_DIR, config.paths.cache_dir, "font_index.json"))
+# Background preloading of fonts across the size range (see start_font_warmup)
+font_warmup = None
+font_warmup_reported = True
+
+WORDS = []
+# Words by length for width-aware draws (see pick_word), and the estimated character
+# width (fraction of the font size) of the custom fonts
+WORD_INDEX = None
+WORD_CHAR_WIDTH = DEFAULT_CHAR_WIDTH
+
+def build_padding_kernel(radius):
+    """Circular mask of `radius` used to expand letter masks for collision padding."""
+    kernel_surf = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+    pygame.draw.circle(kernel_surf, (255, 255, 255), (radius, radius), radius)
+    return pygame.mask.from_surface(kernel_surf)
+
+def apply_config_settings():
+    """
+    Copies the configuration into the module-level settings that layout, drawing and
+    export read. Runs at startup and again whenever config.yaml is reloaded.
+    """
+    global TEXT_TYPES, TEXT_TYPE_WEIGHTS, MIN_FONT_SIZE, MAX_FONT_SIZE, MAX_WORDS, MAX_ATTEMPTS_PER_WORD, MAX_ATTEMPTS_TOTAL
+    global CANVAS_PADDING, PADDING, ARC_MIN_RADIUS, ARC_MAX_RADIUS, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION
+    global MASK_GROW_PIXELS, CANDIDATE_BATCH_SIZE, REGION_RASTER_CELL_SIZE, MIN_ZOOM, MAX_ZOOM, ZOOM_SPEED
+    global SHOW_FONT_INFO, SUPPORTED_IMAGE_EXTENSIONS, DEFAULT_BACKGROUND_COLOR
+    TEXT_TYPES = config.text.types
+    TEXT_TYPE_WEIGHTS = config.text.type_weights
+    MIN_FONT_SIZE = config.fonts.min_size
+    MAX_FONT_SIZE = config.fonts.max_size
+
+    MAX_WORDS = config.layout.max_words
+    MAX_ATTEMPTS_PER_WORD = config.layout.max_attempts_per_word
+    MAX_ATTEMPTS_TOTAL = config.layout.max_attempts_total
+    CANVAS_PADDING = config.canvas.padding
+
+    PADDING = config.text.normal.padding
+
+    ARC_MIN_RADIUS = config.text.arc.min_radius
+    ARC_MAX_RADIUS = config.text.arc.max_radius
+    ROTATE_LETTERS_ON_ARC = config.fonts.rotate_letters_on_arc
+    MAX_ARC_LETTER_ROTATION = config.fonts.max_arc_letter_rotation
+
+    MASK_GROW_PIXELS = config.mask.grow_pixels
+    # Candidate positions generated and filtered together per placement step
+    CANDIDATE_BATCH_SIZE = config.layout.candidate_batch_size
+    # Cell size in canvas pixels of the freeform region-rule lookup raster
+    REGION_RASTER_CELL_SIZE = config.layout.region_raster_cell_size
+
+    MIN_ZOOM = config.zoom.min_level
+    MAX_ZOOM = config.zoom.max_level
+    ZOOM_SPEED = config.zoom.speed
+    SHOW_FONT_INFO = config.fonts.show_info
+    SUPPORTED_IMAGE_EXTENSIONS = set(config.supported_extensions.images)
+    DEFAULT_BACKGROUND_COLOR = tuple(config.display.default_background_color)
+    profiler.enabled = config.performance.profile_phases
+
+apply_config_settings()
+# Expands letter masks by config.mask.padding_size for collision checks; rebuilt only when that changes
+padding_kernel_mask = build_padding_kernel(config.mask.padding_size)
 
 RANDOMIZE_TEMPLATES = False
 
@@ -181,11 +235,6 @@ last_layout_time = 0.0
 
 BATCH_PROCESSING_MODE = False
 
-MASK_GROW_PIXELS = config.mask.grow_pixels
-
-padding_kernel_size = config.mask.padding_size
-padding_kernel_mask = pygame.mask.Mask((padding_kernel_size, padding_kernel_size), fill=True)
-
 
 def get_canvas_offsets(image_size):
     """Calculate canvas offsets based on image size."""
@@ -194,26 +243,33 @@ def get_canvas_offsets(image_size):
     offset_y = (MAIN_AREA_HEIGHT - img_height) // 2
     return offset_x, offset_y
 
-def load_background_image(image_path):
-    """Load and process a background image."""
+def decode_background_image(image_path):
+    """Decode an image and fit it to the canvas. Returns (original, fitted); safe to call off the main thread."""
+    pil_image = Image.open(image_path)
+    original = pil_image.copy()
+    return original, fit_image_to_canvas(pil_image, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT)
+
+def apply_background_image(image_path, original, fitted_image):
+    """Make a decoded image the current background."""
     global original_pil_image, current_background_image, current_background_surface
+    original_pil_image = original
+    logger.info(f"🖼️  Loaded image: [bold]{os.path.basename(image_path)}[/bold] ({original.size[0]}x{original.size[1]})")
+    current_background_image = fitted_image
+    
+    if not BATCH_PROCESSING_MODE:
+        current_background_surface = pil_to_pygame_surface(fitted_image)
+    else:
+        current_background_surface = None
+    preview_cache.invalidate()
+    
+    reset_zoom_and_pan()
     
+    logger.info(f"Image fitted to: {fitted_image.size[0]}x{fitted_image.size[1]}")
+
+def load_background_image(image_path):
+    """Load and process a background image."""
     try:
-        pil_image = Image.open(image_path)
-        original_pil_image = pil_image.copy()
-        logger.info(f"🖼️  Loaded image: [bold]{os.path.basename(image_path)}[/bold] ({pil_image.size[0]}x{pil_image.size[1]})")
-        
-        fitted_image = fit_image_to_canvas(pil_image, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT)
-        current_background_image = fitted_image
-        
-        if not BATCH_PROCESSING_MODE:
-            current_background_surface = pil_to_pygame_surface(fitted_image)
-        else:
-            current_background_surface = None
-        
-        reset_zoom_and_pan()
-        
-        logger.info(f"Image fitted to: {fitted_image.size[0]}x{fitted_image.size[1]}")
+        apply_background_image(image_path, *decode_background_image(image_path))
         return True
         
     except Exception as e:
@@ -226,6 +282,7 @@ def clear_background_image():
     original_pil_image = None
     current_background_image = None
     current_background_surface = None
+    preview_cache.invalidate()
     logger.info("🖼️  [yellow]Background image cleared[/]")
 
 
@@ -242,42 +299,193 @@ def reset_zoom_and_pan():
             pygame.display.flip()
 
 
-if IMG_DIR and os.path.isdir(IMG_DIR):
-    current_image_directory = get_images_from_directory(IMG_DIR)
-    if current_image_directory:
-        logger.success(f"Found {len(current_image_directory)} images in '{IMG_DIR}'")
-        # Load first image automatically
-        if load_background_image(current_image_directory[0]):
-            current_image_index = 0
-            logger.info(f"Auto-loaded: [bold]{os.path.basename(current_image_directory[0])}[/bold]")
+def update_font_index(font_dir, words):
+    """
+    Scans `font_dir` and brings the font index up to date, opening only new or changed
+    fonts. Touches no state the layout reads, so it can run on a worker thread; returns
+    (valid fonts, coverage table, average character width) for apply_font_index().
+    """
+    font_paths = scan_font_directory(font_dir, config.supported_extensions.fonts)
+    if font_index.update(font_paths, set(''.join(words))):
+        font_index.save()
+    return font_index.valid_fonts(), font_index.coverage_table(), font_index.char_width() or DEFAULT_CHAR_WIDTH
+
+def apply_font_index(result):
+    """
+    Makes an update_font_index() result current (on the main thread): get_font() then
+    picks per word among the fonts that have all of its glyphs. Returns the valid fonts.
+    """
+    global WORD_CHAR_WIDTH
+    valid_fonts, coverage, char_width = result
+    set_font_coverage(coverage)
+    WORD_CHAR_WIDTH = char_width
+    return valid_fonts
+
+def index_font_directory(font_dir, words):
+    """Updates the font index for `font_dir` and applies it; returns the valid fonts."""
+    return apply_font_index(update_font_index(font_dir, words))
+
+def font_index_summary(words):
+    """What log_font_index() reports about the last font index update; cheap to log on the main thread."""
+    return {
+        'fonts': len(font_index.fonts),
+        'reused': font_index.reused,
+        'checked': font_index.validated + font_index.failed,
+        'broken': font_index.broken_fonts(),
+        'full_coverage': len(font_index.fonts_covering(set(''.join(words)))),
+    }
+
+def log_font_index(font_dir, summary):
+    """Logs a font_index_summary()."""
+    logger.success(f"Found {summary['fonts']} custom fonts in '{font_dir}' (recursive search)")
+    logger.info(f"Font index: {summary['reused']} reused, {summary['checked']} (re)checked; {len(summary['broken'])} broken, {summary['full_coverage']} cover the whole word set")
+    for path, error in summary['broken'].items():
+        logger.warning(f"Skipping broken font '{os.path.basename(path)}': {error}")
+
+def open_word_corpus():
+    """The memory-mapped word corpus set in paths.word_corpus, or None if there is none or it cannot be read."""
+    if not config.paths.word_corpus:
+        return None
+    try:
+        return load_word_corpus(os.path.join(SCRIPT_DIR, config.paths.word_corpus), os.path.join(SCRIPT_DIR, config.paths.cache_dir, "word_corpus"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Word corpus '{config.paths.word_corpus}' could not be opened, using words.json: {e}")
+        return None
+
+def build_word_sampler():
+    """The word corpus if one is configured, otherwise the width-aware index of words.json."""
+    corpus = open_word_corpus()
+    if corpus is not None:
+        return corpus
+    return get_word_index(config.text.category_weights)
+
+def word_charset():
+    """Every character the words can contain (words.json and the word corpus), for the font index."""
+    chars = set(''.join(get_words()))
+    corpus = open_word_corpus()
+    if corpus is not None:
+        chars |= corpus.charset
+    return ''.join(sorted(chars))
+
+def _load_fonts_task():
+    """
+    Startup task: (update_font_index() result, font_index_summary(), 0), or (None, None,
+    system font count) if FONT_DIR is missing. The word charset is gathered here too, so
+    applying the result on the main thread does no work proportional to the words.
+    """
+    if FONT_DIR and os.path.isdir(FONT_DIR):
+        chars = word_charset()
+        return update_font_index(FONT_DIR, chars), font_index_summary(chars), 0
+    return None, None, len(get_system_fonts())
+
+def _load_words_task():
+    """Startup task: the word sampler (corpus or words.json index)."""
+    return build_word_sampler()
+
+def _load_assets_task():
+    """Startup task: PNG asset paths, or None if the asset directory is missing."""
+    if not os.path.isdir(ASSET_DIR):
+        return None
+    return [os.path.join(ASSET_DIR, fname) for fname in os.listdir(ASSET_DIR) if fname.lower().endswith('.png')]
+
+def _load_images_task():
+    """Startup task: the image list of IMG_DIR (or None) and the decoded first image (or None)."""
+    if not (IMG_DIR and os.path.isdir(IMG_DIR)):
+        return None, None
+    image_paths = get_images_from_directory(IMG_DIR)
+    if not image_paths:
+        return image_paths, None
+    try:
+        return image_paths, decode_background_image(image_paths[0])
+    except Exception as e:
+        return image_paths, e
+
+def start_startup_tasks():
+    """Starts loading fonts, assets, words and the first image in the background."""
+    return StartupTasks([
+        ('fonts', _load_fonts_task),
+        ('assets', _load_assets_task),
+        ('words', _load_words_task),
+        ('images', _load_images_task),
+    ]).start()
+
+def apply_startup_result(name, result):
+    """Applies the result of one finished startup task on the main thread."""
+    global custom_font_paths, ASSET_PATHS, WORDS, WORD_INDEX, current_image_directory, current_image_index
+    if name == 'fonts':
+        font_result, summary, system_font_count = result
+        if font_result is not None:
+            custom_font_paths = apply_font_index(font_result)
+            log_font_index(FONT_DIR, summary)
         else:
-            logger.error(f"Failed to load first image")
-            current_image_index = -1
-    else:
-        logger.warning(f"No supported images found in '{IMG_DIR}'")
+            logger.warning(f"Custom font directory not found. Using {system_font_count} system fonts.")
+    elif name == 'assets':
+        if result is not None:
+            ASSET_PATHS = result
+            logger.success(f"Found {len(ASSET_PATHS)} assets in '{ASSET_DIR}'")
+        else:
+            logger.warning(f"Asset directory not found at '{ASSET_DIR}'")
+    elif name == 'words':
+        WORD_INDEX = result
+        WORDS = get_words()
+        if isinstance(result, WordCorpus):
+            logger.success(f"Sampling from {len(result)} words in corpus '{config.paths.word_corpus}'" + (" (index rebuilt)" if result.rebuilt else ""))
+    elif name == 'images':
+        image_paths, first_image = result
+        current_image_directory = image_paths or []
         current_image_index = -1
-else:
-    logger.warning(f"No image directory found. Using solid background.")
-    current_image_directory = []
-    current_image_index = -1
-
-logger.info(f"🚀 [bold green]Initialization complete:[/] {len(current_image_directory)} images loaded, index: {current_image_index}")
+        if image_paths is None:
+            logger.warning(f"No image directory found. Using solid background.")
+        elif not image_paths:
+            logger.warning(f"No supported images found in '{IMG_DIR}'")
+        else:
+            logger.success(f"Found {len(current_image_directory)} images in '{IMG_DIR}'")
+            # Load first image automatically
+            if isinstance(first_image, Exception):
+                logger.error(f"Error loading image [bold]{current_image_directory[0]}[/]: {str(first_image)}")
+                logger.error(f"Failed to load first image")
+            else:
+                apply_background_image(current_image_directory[0], *first_image)
+                current_image_index = 0
+                logger.info(f"Auto-loaded: [bold]{os.path.basename(current_image_directory[0])}[/bold]")
 
-# --- Padding Configuration ---
-PADDING = 5
-# Create a kernel for convolution to expand masks for padding
-padding_kernel_surf = pygame.Surface((PADDING * 2 + 1, PADDING * 2 + 1), pygame.SRCALPHA)
-pygame.draw.circle(padding_kernel_surf, (255, 255, 255), (PADDING, PADDING), PADDING)
-padding_kernel_mask = pygame.mask.from_surface(padding_kernel_surf)
+def finish_startup(block=False):
+    """
+    Applies the startup tasks finished so far (waiting for all of them with `block`).
+    Once everything is in, runs the deferred first layout and builds the UI.
+    """
+    global startup_complete
+    for name, result, seconds in startup_tasks.poll(block=block):
+        profiler.add(f'startup_{name}', seconds)
+        if isinstance(result, Exception):
+            logger.error(f"Startup task '{name}' failed: {result}")
+            continue
+        apply_startup_result(name, result)
+
+    if startup_tasks.done and not startup_complete:
+        startup_complete = True
+        logger.info(f"🚀 [bold green]Initialization complete:[/] {len(current_image_directory)} images loaded, index: {current_image_index}")
+        layout()                                            # draw once; call again if you want a new arrangement
+        setup_ui_elements()
+        log_controls()
+        start_font_warmup(export_scale_factors())
+        ready_time = time.perf_counter() - startup_started_at
+        profiler.add('startup_ready', ready_time)
+        logger.info(f"⏱️  Ready with the first layout after {ready_time * 1000:.0f} ms")
+        start_file_watcher()
 
 # --- Placement Configuration ---
-CANVAS_PADDING = 10
-
 USE_RANDOM_COLORS = True
 MIN_COLOR_VALUE = 50  # Avoid too dark colors for visibility
 MAX_COLOR_VALUE = 255
 
 MAX_PLACEMENT_TRIES = 800
+# Words are never shrunk below this size to fit a region; they are skipped instead
+MIN_FIT_FONT_SIZE = 6
+# Words drawn when the canvas is saturated; the shortest one is used
+SATURATED_WORD_DRAWS = 3
+# Placement statistics of the most recent layout (see PlacementEvaluator.stats)
+last_placement_stats = {}
 
 master_letter_sprites = pygame.sprite.Group()
 placed_sprites_cache = []
@@ -286,6 +494,50 @@ BATCH_PROCESSING_MODE = False
 
 import math
 
+def pick_word(prefer_short=False, max_width=None, size=None):
+    """
+    A random word, drawn among those estimated to fit `max_width` pixels at font `size`
+    (any word without a budget); when the canvas is saturated, the shortest of a few draws.
+    None if no word can be drawn (e.g. all fitting words have a zero category weight).
+    """
+    max_chars = WORD_INDEX.max_chars(max_width, size, WORD_CHAR_WIDTH) if max_width is not None else None
+    if not prefer_short:
+        return WORD_INDEX.sample(random, max_chars)
+    draws = (WORD_INDEX.sample(random, max_chars) for _ in range(SATURATED_WORD_DRAWS))
+    return min((word for word in draws if word is not None), key=len, default=None)
+
+def format_placement_stats(stats):
+    """One-line summary of a layout's placement statistics."""
+    return (
+        f"Attempts: {stats['attempts_used']} used, {stats['wasted_attempts']} wasted on {stats['words_failed']} failed word(s), "
+        f"{stats['attempts_saved']} saved by adaptive budgets | free area {stats['free_area_ratio']:.0%}"
+        + (f" | stopped early ({stats['early_stops']}x)" if stats['early_stops'] else "")
+    )
+
+def create_word_sprites(word, text_type, font, color, font_identifier, size, asset_path=None):
+    """Generates the sprites and bbox of a word for its text type; ([], None) if it cannot be built."""
+    with profiler.phase('sprite_creation'):
+        if text_type == "normal":
+            return create_normal_sprites(word, font, color, font_identifier, size, PADDING, padding_kernel_mask, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION)
+        elif text_type == "arc":
+            return create_arc_sprites(word, font, color, font_identifier, size, ARC_MIN_RADIUS, ARC_MAX_RADIUS, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION, padding_kernel_mask)
+        elif text_type == "asset" and asset_path:
+            return create_asset_sprite(asset_path, size, padding_kernel_mask)
+        return [], None
+
+def try_place_word(placement_evaluator, new_sprites, word_bbox, xs, ys, all_sprites_to_draw):
+    """Commits the word at the first free candidate center (arrays `xs`, `ys`). Returns True if placed."""
+    with profiler.phase('collision_checks'):
+        center = placement_evaluator.find_free_position(new_sprites, word_bbox, xs, ys)
+    if center is None:
+        return False
+    with profiler.phase('commit'):
+        placement_evaluator.commit(new_sprites, center, word_bbox)
+    master_letter_sprites.add(new_sprites)
+    all_sprites_to_draw.extend(new_sprites)
+    placed_points_cache.append(center)
+    return True
+
 def get_random_color():
     """Generate a random RGB color"""
     if USE_RANDOM_COLORS:
@@ -297,30 +549,51 @@ def get_random_color():
     else:
         return (255, 255, 255)  # Default white
 
-def point_in_polygon(x, y, poly):
-    """
-    Checks if a point (x, y) is inside a polygon `poly`.
-    `poly` is a list of (x, y) vertices.
-    Uses the Ray-Casting algorithm.
-    """
-    n = len(poly)
-    if n < 3: # A polygon must have at least 3 vertices
-        return False
-        
-    inside = False
-    p1x, p1y = poly[0]
-    for i in range(n + 1):
-        p2x, p2y = poly[i % n]
-        if y > min(p1y, p2y):
-            if y <= max(p1y, p2y):
-                if x <= max(p1x, p2x):
-                    if p1y != p2y:
-                        xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                    if p1x == p2x or x <= xinters:
-                        inside = not inside
-        p1x, p1y = p2x, p2y
-    return inside
+def build_preview_mask_surface(placed_sprites, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT, current_background_surface, original_pil_image, MASK_GROW_PIXELS, grow_binary_mask_pil):
+    """Builds the black and white (grown) mask of the layout at preview resolution, sized to the image."""
+    img_rect = current_background_surface.get_rect()
+    mask_surface = pygame.Surface((img_rect.width, img_rect.height))
+    mask_surface.fill((0, 0, 0))  # Black background
 
+    # Calculate base position (centered) - MUST be calculated before using it
+    base_img_x = (MAIN_AREA_WIDTH - img_rect.width) // 2
+    base_img_y = (MAIN_AREA_HEIGHT - img_rect.height) // 2
+
+    # Draw all the letter masks (as white) onto the mask surface at their original positions
+    for sprite in placed_sprites:
+        # Calculate sprite position relative to the image (not the full canvas)
+        sprite_x = sprite.rect.x - base_img_x
+        sprite_y = sprite.rect.y - base_img_y
+        mask_surf = sprite.mask.to_surface(setcolor=(255, 255, 255), unsetcolor=(0, 0, 0, 0))
+        mask_surf.set_colorkey((0, 0, 0))
+        mask_surface.blit(mask_surf, (sprite_x, sprite_y))
+
+    # Apply mask growing if enabled (scaled for preview resolution)
+    if MASK_GROW_PIXELS > 0:
+        try:
+            # Calculate scaled growth amount for preview
+            # If we have the original image, scale the growth proportionally
+            if original_pil_image:
+                original_width, original_height = original_pil_image.size
+                preview_width, preview_height = img_rect.width, img_rect.height
+                scale_factor = min(preview_width / original_width, preview_height / original_height)
+                scaled_growth = max(1, int(MASK_GROW_PIXELS * scale_factor))
+            else:
+                scaled_growth = MASK_GROW_PIXELS
+
+            mask_surface = grow_binary_mask_pil(mask_surface, scaled_growth)
+        except Exception as e:
+            logger.warning(f"Failed to grow mask in preview. Reason: {e}")
+
+    return mask_surface
+
+def get_clipped_preview_mask(placed_sprites, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT, current_background_surface, original_pil_image, MASK_GROW_PIXELS, grow_binary_mask_pil, zoom_level, origin, viewport):
+    """Returns (surface, position) of the zoomed preview mask clipped to `viewport`, built once per layout."""
+    return preview_cache.get_clipped(
+        'mask',
+        lambda: build_preview_mask_surface(placed_sprites, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT, current_background_surface, original_pil_image, MASK_GROW_PIXELS, grow_binary_mask_pil),
+        zoom_level, origin, viewport,
+    )
 
 def draw_mask_panel(screen, placed_sprites, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT, current_background_surface, original_pil_image, MASK_GROW_PIXELS, grow_binary_mask_pil, zoom_level, pan_offset_x, pan_offset_y):
     """Draws a 1:1 black and white mask representation on the right side of the screen."""
@@ -331,49 +604,14 @@ def draw_mask_panel(screen, placed_sprites, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT, c
     mask_panel_surface.fill((50, 50, 50)) # Gray background for the whole panel
 
     if current_background_surface:
-        # Create a combined mask surface with background + text masks as one unit
         img_rect = current_background_surface.get_rect()
-        mask_surface = pygame.Surface((img_rect.width, img_rect.height))
-        mask_surface.fill((0, 0, 0))  # Black background
-        
-        # Calculate base position (centered) - MUST be calculated before using it
         base_img_x = (MAIN_AREA_WIDTH - img_rect.width) // 2
         base_img_y = (MAIN_AREA_HEIGHT - img_rect.height) // 2
-        
-        # Draw all the letter masks (as white) onto the mask surface at their original positions
-        for sprite in placed_sprites:
-            # Calculate sprite position relative to the image (not the full canvas)
-            sprite_x = sprite.rect.x - base_img_x
-            sprite_y = sprite.rect.y - base_img_y
-            mask_surf = sprite.mask.to_surface(setcolor=(255, 255, 255), unsetcolor=(0, 0, 0, 0))
-            mask_surf.set_colorkey((0, 0, 0))
-            mask_surface.blit(mask_surf, (sprite_x, sprite_y))
-        
-        # Apply mask growing if enabled (scaled for preview resolution)
-        if MASK_GROW_PIXELS > 0:
-            try:
-                # Calculate scaled growth amount for preview
-                # If we have the original image, scale the growth proportionally
-                if original_pil_image:
-                    original_width, original_height = original_pil_image.size
-                    preview_width, preview_height = img_rect.width, img_rect.height
-                    scale_factor = min(preview_width / original_width, preview_height / original_height)
-                    scaled_growth = max(1, int(MASK_GROW_PIXELS * scale_factor))
-                else:
-                    scaled_growth = MASK_GROW_PIXELS
-                
-                mask_surface = grow_binary_mask_pil(mask_surface, scaled_growth)
-            except Exception as e:
-                logger.warning(f"Failed to grow mask in preview. Reason: {e}")
-        
-        # Apply zoom and pan to the entire mask surface
-        if abs(zoom_level - 1.0) > 0.01:
-            scaled_width = int(img_rect.width * zoom_level)
-            scaled_height = int(img_rect.height * zoom_level)
-            scaled_mask = pygame.transform.scale(mask_surface, (scaled_width, scaled_height))
-            mask_panel_surface.blit(scaled_mask, (base_img_x + pan_offset_x, base_img_y + pan_offset_y))
-        else:
-            mask_panel_surface.blit(mask_surface, (base_img_x + pan_offset_x, base_img_y + pan_offset_y))
+
+        # Zoomed mask comes from the cache and only its visible part is scaled
+        scaled_mask, mask_pos = get_clipped_preview_mask(placed_sprites, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT, current_background_surface, original_pil_image, MASK_GROW_PIXELS, grow_binary_mask_pil, zoom_level, (base_img_x + pan_offset_x, base_img_y + pan_offset_y), mask_panel_surface.get_rect())
+        if scaled_mask:
+            mask_panel_surface.blit(scaled_mask, mask_pos)
     else:
         # If no image, draw masks directly
         for sprite in placed_sprites:
@@ -389,53 +627,18 @@ def draw_mask_overlay(screen, placed_sprites, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT,
     if not current_background_surface:
         return
     
-    # Create a combined mask surface with background + text masks as one unit
     img_rect = current_background_surface.get_rect()
-    mask_surface = pygame.Surface((img_rect.width, img_rect.height))
-    mask_surface.fill((0, 0, 0))  # Pure black background
-
-    # Calculate base position (centered) - MUST be calculated before using it
     base_img_x = (MAIN_AREA_WIDTH - img_rect.width) // 2
     base_img_y = (MAIN_AREA_HEIGHT - img_rect.height) // 2
-    
-    # Draw all letter masks onto this surface as pure white at their original positions
-    for sprite in placed_sprites:
-        # Calculate sprite position relative to the image (not the full canvas)
-        sprite_x = sprite.rect.x - base_img_x
-        sprite_y = sprite.rect.y - base_img_y
-        mask_surf = sprite.mask.to_surface(setcolor=(255, 255, 255), unsetcolor=(0, 0, 0, 0))
-        mask_surf.set_colorkey((0, 0, 0))
-        mask_surface.blit(mask_surf, (sprite_x, sprite_y))
-    
-    # Apply mask growing if enabled (scaled for preview resolution)
-    if MASK_GROW_PIXELS > 0:
-        try:
-            # Calculate scaled growth amount for preview
-            # If we have the original image, scale the growth proportionally
-            if original_pil_image:
-                original_width, original_height = original_pil_image.size
-                preview_width, preview_height = img_rect.width, img_rect.height
-                scale_factor = min(preview_width / original_width, preview_height / original_height)
-                scaled_growth = max(1, int(MASK_GROW_PIXELS * scale_factor))
-            else:
-                scaled_growth = MASK_GROW_PIXELS
-            
-            mask_surface = grow_binary_mask_pil(mask_surface, scaled_growth)
-        except Exception as e:
-            logger.warning(f"Failed to grow mask in overlay. Reason: {e}")
-    
-    # Set the entire mask's opacity to 70%
-    mask_surface.set_alpha(int(255 * 0.7))
-    
-    # Apply zoom and pan to the entire mask surface and blit it on top of the existing view
+
+    # Blit the cached, zoomed mask on top of the existing view at 70% opacity
     # (which already has the image + text from redraw_layout)
-    if abs(zoom_level - 1.0) > 0.01:
-        scaled_width = int(img_rect.width * zoom_level)
-        scaled_height = int(img_rect.height * zoom_level)
-        scaled_mask = pygame.transform.scale(mask_surface, (scaled_width, scaled_height))
-        screen.blit(scaled_mask, (base_img_x + pan_offset_x, base_img_y + pan_offset_y))
-    else:
-        screen.blit(mask_surface, (base_img_x + pan_offset_x, base_img_y + pan_offset_y))
+    scaled_mask, mask_pos = get_clipped_preview_mask(placed_sprites, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT, current_background_surface, original_pil_image, MASK_GROW_PIXELS, grow_binary_mask_pil, zoom_level, (base_img_x + pan_offset_x, base_img_y + pan_offset_y), pygame.Rect(0, 0, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT))
+    if not scaled_mask:
+        return
+    scaled_mask.set_alpha(int(255 * 0.7))
+    screen.blit(scaled_mask, mask_pos)
+    scaled_mask.set_alpha(None)
 
 def create_final_mask_surface(placed_sprites, canvas_width, canvas_height, canvas_offset_x, canvas_offset_y):
     """Creates a clean, black and white surface of the mask, perfectly sized to the canvas."""
@@ -455,220 +658,6 @@ def create_final_mask_surface(placed_sprites, canvas_width, canvas_height, canva
 
 
 
-def render_high_quality_layout(original_image, placed_sprites, preview_canvas_size, preview_canvas_offsets):
-    """Renders the final layout at full resolution onto a new surface with font caching and word-level rendering."""
-    
-    original_width, original_height = original_image.size
-    preview_width, preview_height = preview_canvas_size
-    preview_offset_x, preview_offset_y = preview_canvas_offsets
-
-    # Use width for scaling factor to handle different aspect ratios consistently
-    scale_factor = original_width / preview_width
-
-    # Create new, large surfaces for drawing the high-res output
-    overlay_surface = pygame.Surface(original_image.size, pygame.SRCALPHA)
-    mask_surface = pygame.Surface(original_image.size)
-    mask_surface.fill((0, 0, 0))
-
-    # Group sprites by word for more efficient rendering, and separate assets
-    word_groups = {}
-    asset_sprites = []
-    for sprite in placed_sprites:
-        if sprite.text_type == 'asset':
-            asset_sprites.append(sprite)
-            continue
-            
-        # Create a word identifier based on position and properties
-        word_key = (sprite.font_path, sprite.font_size, sprite.color, sprite.text_type)
-        if word_key not in word_groups:
-            word_groups[word_key] = []
-        word_groups[word_key].append(sprite)
-
-    # Render each word group
-    for word_key, sprites in word_groups.items():
-        font_path, font_size, color, text_type = word_key
-        
-        # Load font once for the entire word
-        high_res_font_size = int(font_size * scale_factor)
-        if high_res_font_size < 1: 
-            high_res_font_size = 1
-        
-        high_res_font = get_cached_font(font_path, high_res_font_size)
-        
-        # Render each character in the word
-        for sprite in sprites:
-            try:
-                # 3. Render the character for both overlay and mask
-                overlay_char_surf = high_res_font.render(sprite.char, True, color)
-                mask_char_surf = high_res_font.render(sprite.char, True, (255, 255, 255))
-                
-                # 4. Scale position and apply rotation if it's an arc letter
-                relative_center_x = sprite.rect.centerx - preview_offset_x
-                relative_center_y = sprite.rect.centery - preview_offset_y
-                
-                high_res_center_x = int(relative_center_x * scale_factor)
-                high_res_center_y = int(relative_center_y * scale_factor)
-
-                # Get the rect of the newly rendered high-res character, centered on the new scaled position
-                high_res_rect = overlay_char_surf.get_rect(center=(high_res_center_x, high_res_center_y))
-
-                final_overlay_surf = overlay_char_surf
-                final_mask_surf = mask_char_surf
-
-                # Re-apply rotation for arc letters at high resolution
-                if sprite.text_type == 'arc' and ROTATE_LETTERS_ON_ARC:
-                    rotation_deg = -math.degrees(sprite.angle_rad) - 90
-                    normalized_rotation = (rotation_deg + 180) % 360 - 180
-                    clamped_rotation = max(-MAX_ARC_LETTER_ROTATION, min(MAX_ARC_LETTER_ROTATION, normalized_rotation))
-                    
-                    # Rotate the high-res surfaces
-                    final_overlay_surf = pygame.transform.rotate(overlay_char_surf, clamped_rotation)
-                    final_mask_surf = pygame.transform.rotate(mask_char_surf, clamped_rotation)
-                    
-                    # Update rect to keep it centered after rotation
-                    high_res_rect = final_overlay_surf.get_rect(center=high_res_rect.center)
-
-                # 5. Blit the final character onto the large surfaces
-                overlay_surface.blit(final_overlay_surf, high_res_rect)
-                mask_surface.blit(final_mask_surf, high_res_rect)
-
-            except Exception as e:
-                logger.warning(f"Could not render high-res char '{sprite.char}' from font {sprite.font_path}. Reason: {e}")
-
-    # --- New: Render asset sprites ---
-    for sprite in asset_sprites:
-        try:
-            # 1. Load original asset
-            asset_image = pygame.image.load(sprite.font_path).convert_alpha()
-
-            # 2. Scale it to high resolution based on the preview size
-            high_res_height = int(sprite.font_size * scale_factor)
-            original_asset_width, original_asset_height = asset_image.get_size()
-            
-            if original_asset_height == 0: continue
-            
-            asset_scale_factor = high_res_height / original_asset_height
-            high_res_width = int(original_asset_width * asset_scale_factor)
-
-            scaled_asset = pygame.transform.smoothscale(asset_image, (high_res_width, high_res_height))
-
-            # 3. Calculate high-res position
-            relative_center_x = sprite.rect.centerx - preview_offset_x
-            relative_center_y = sprite.rect.centery - preview_offset_y
-            
-            high_res_center_x = int(relative_center_x * scale_factor)
-            high_res_center_y = int(relative_center_y * scale_factor)
-
-            high_res_rect = scaled_asset.get_rect(center=(high_res_center_x, high_res_center_y))
-
-            # 4. Blit to overlay and mask surfaces
-            overlay_surface.blit(scaled_asset, high_res_rect)
-            
-            # For the mask, we create a white version of the asset
-            asset_mask = pygame.mask.from_surface(scaled_asset, 127)
-            mask_surf_for_asset = asset_mask.to_surface(setcolor=(255, 255, 255), unsetcolor=(0,0,0,0))
-            mask_surf_for_asset.set_colorkey((0, 0, 0))
-            mask_surface.blit(mask_surf_for_asset, high_res_rect)
-
-        except Exception as e:
-            logger.warning(f"Could not render high-res asset '{sprite.font_path}'. Reason: {e}")
-
-    return overlay_surface, mask_surface
-
-def save_output(placed_sprites, script_dir, current_background_image, current_image_index, current_image_directory, original_pil_image, get_canvas_dimensions, get_canvas_offsets, pil_to_pygame_surface, mask_grow_pixels, grow_binary_mask_pil, create_final_mask_surface, get_cached_font, rotate_letters_on_arc, max_arc_letter_rotation, screen, main_area_width, main_area_height, image_index=None):
-    """Saves the current text overlay, mask, and a debug overlay to the 'out' directory with optimizations."""
-    if not placed_sprites:
-        # Don't save if there's nothing to save
-        return False
-
-    try:
-        # 1. Define and create output directories
-        out_dir = os.path.join(script_dir, "out")
-        before_dir = os.path.join(out_dir, "before")
-        after_dir = os.path.join(out_dir, "after")
-        debug_dir = os.path.join(out_dir, "debug")
-        os.makedirs(before_dir, exist_ok=True)
-        os.makedirs(after_dir, exist_ok=True)
-        os.makedirs(debug_dir, exist_ok=True)
-
-        # 2. Determine a base filename with a shared timestamp
-        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        if current_background_image and current_image_index != -1:
-            image_part = os.path.splitext(os.path.basename(current_image_directory[current_image_index]))[0]
-        else:
-            image_part = "layout"
-        
-        # Add image index if provided for batch processing
-        if image_index is not None:
-            base_name = f"{timestamp}_{image_part}_{image_index:03d}"
-        else:
-            base_name = f"{timestamp}_{image_part}"
-
-        # --- High-Resolution Saving ---
-        if original_pil_image:
-            # 1. Render the high-quality layout using optimized function
-            preview_canvas_size = get_canvas_dimensions()
-            
-            # Use the helper function to get offsets
-            if current_background_image:
-                canvas_offset_x, canvas_offset_y = get_canvas_offsets(current_background_image.size)
-            else:
-                canvas_offset_x, canvas_offset_y = 0, 0
-
-            overlay_surf, mask_surf = render_high_quality_layout(original_pil_image, placed_sprites, preview_canvas_size, (canvas_offset_x, canvas_offset_y))
-
-            # --- Grow the mask if requested ---
-            if mask_grow_pixels > 0:
-                try:
-                    mask_surf = grow_binary_mask_pil(mask_surf, mask_grow_pixels)
-                except Exception as e:
-                    logger.warning(f"Failed to grow mask. Reason: {e}")
-
-            # 2. Save the "after" mask (black and white)
-            after_path = os.path.join(after_dir, f"{base_name}.png")
-            pygame.image.save(mask_surf, after_path)
-
-            # 3. Composite and save the "before" image (original with text overlay)
-            base_image_surf = pil_to_pygame_surface(original_pil_image.copy())
-            base_image_surf.blit(overlay_surf, (0, 0)) # Blit high-res text on top
-            before_path = os.path.join(before_dir, f"{base_name}.png")
-            pygame.image.save(base_image_surf, before_path)
-
-            # 4. Composite and save the "debug" image (image with text + semi-transparent B&W mask overlay)
-            debug_image_surf = base_image_surf.copy()
-            debug_mask_overlay = mask_surf.copy()
-            debug_mask_overlay.set_alpha(int(255 * 0.7)) # Set uniform 70% opacity
-            debug_image_surf.blit(debug_mask_overlay, (0, 0))
-            debug_path = os.path.join(debug_dir, f"{base_name}.png")
-            pygame.image.save(debug_image_surf, debug_path)
-
-            return True
-
-        # --- Fallback to Low-Resolution Saving (if no background image) ---
-        # 3. Save the "before" image (main canvas with text overlay)
-        before_path = os.path.join(before_dir, f"{base_name}.png")
-        main_area_surf = screen.subsurface(pygame.Rect(0, 0, main_area_width, main_area_height))
-        pygame.image.save(main_area_surf, before_path)
-
-        # 4. Save the "after" image (black and white mask)
-        after_path = os.path.join(after_dir, f"{base_name}.png")
-        canvas_width, canvas_height = get_canvas_dimensions()
-        
-        # Use the helper function to get offsets
-        if current_background_image:
-            canvas_offset_x, canvas_offset_y = get_canvas_offsets(current_background_image.size)
-        else:
-            canvas_offset_x, canvas_offset_y = 0, 0
-
-        mask_to_save = create_final_mask_surface(placed_sprites, canvas_width, canvas_height, canvas_offset_x, canvas_offset_y)
-        pygame.image.save(mask_to_save, after_path)
-        
-        return True
-
-    except Exception as e:
-        logger.error(f"Failed to save output: {e}")
-        return False
-
 def process_single_image(image_index, total_images, megapixels=None):
     """Process a single image in the batch - designed for parallel execution."""
     global current_image_index, current_background_image, current_background_surface, original_pil_image
@@ -693,7 +682,8 @@ def process_single_image(image_index, total_images, megapixels=None):
                 # Generate layout without redrawing
                 layout(auto_advance_image=False, skip_redraw=True)
                 # Save the output
-                success = save_output(placed_sprites_cache, SCRIPT_DIR, current_background_image, current_image_index, current_image_directory, original_pil_image, get_canvas_dimensions, get_canvas_offsets, pil_to_pygame_surface, MASK_GROW_PIXELS, grow_binary_mask_pil, create_final_mask_surface, get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION, screen, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT, image_index=image_index)
+                with profiler.phase('save'):
+                    success = save_output(placed_sprites_cache, SCRIPT_DIR, current_background_image, current_image_index, current_image_directory, original_pil_image, get_canvas_dimensions, get_canvas_offsets, pil_to_pygame_surface, MASK_GROW_PIXELS, grow_binary_mask_pil, create_final_mask_surface, get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION, screen, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT, image_index=image_index, export_config=config.export)
                 return success, f"Image {image_index + 1}/{total_images}: {os.path.basename(image_path)}"
             else:
                 return False, f"Image {image_index + 1}/{total_images}: Failed to load {os.path.basename(image_path)}"
@@ -738,6 +728,13 @@ def batch_save():
     
     # Clear font cache before starting to ensure fresh state
     clear_font_cache()
+    # Phase timings, font coverage and font cache counters for this batch only; the
+    # interactive phase timings (shown in the info bar) come back once the batch is done
+    interactive_phases = profiler.reset()
+    reset_coverage_stats()
+    reset_font_cache_stats()
+    # Reload the cleared fonts for the layout range and the batch's export sizes while the first images load
+    start_font_warmup(export_scale_factors(selected_megapixels))
     
     # Use sequential processing to avoid pygame threading issues
     # pygame font rendering is not thread-safe, so we process one image at a time
@@ -759,8 +756,9 @@ def batch_save():
     popup_surface.fill((240, 240, 240))
     pygame.draw.rect(popup_surface, (100, 100, 100), (0, 0, popup_width, popup_height), 3)
     
-    title_font = pygame.font.Font(None, 32)
-    text_font = pygame.font.Font(None, 24)
+    # Through the font cache: the warm-up started above may be opening fonts right now
+    title_font = get_cached_font(None, 32)
+    text_font = get_cached_font(None, 24)
     
     # Process images sequentially to avoid pygame threading issues
     for i in range(num_images):
@@ -835,6 +833,11 @@ def batch_save():
     logger.info(f"❌ Failed: {failed_saves}")
     logger.info(f"Total: {num_images}")
     logger.info("=" * 40)
+    log_phase_report("Batch Phase Timings")
+    profiler.restore(interactive_phases)
+    logger.info(format_coverage_stats())
+    logger.info(format_font_cache_stats())
+    poll_font_warmup()
 
 def draw_debug_regions(screen, W, H, PLACEMENT_REGIONS, current_background_surface, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT, zoom_level, pan_offset_x, pan_offset_y, placed_points_cache):
     """Draws semi-transparent polygons and placement anchors for debugging with zoom and pan support."""
@@ -842,14 +845,13 @@ def draw_debug_regions(screen, W, H, PLACEMENT_REGIONS, current_background_surfa
         return
     
     # Debug info: Show which template is being displayed
-    debug_font = pygame.font.Font(None, 16)
     debug_text = f"Debug: {len(PLACEMENT_REGIONS)} regions"
     if RANDOMIZE_TEMPLATES:
         debug_text += f" (Random: {CURRENT_RANDOM_TEMPLATE_NAME})"
     else:
         debug_text += f" (All: {CURRENT_RANDOM_TEMPLATE_NAME})"
     
-    debug_surf = debug_font.render(debug_text, True, (255, 255, 0))
+    debug_surf = get_text_cache().render(debug_text, (255, 255, 0), 16)
     screen.blit(debug_surf, (10, 10))
     
     # Get the image dimensions and base position
@@ -857,60 +859,10 @@ def draw_debug_regions(screen, W, H, PLACEMENT_REGIONS, current_background_surfa
     base_img_x = (MAIN_AREA_WIDTH - img_rect.width) // 2
     base_img_y = (MAIN_AREA_HEIGHT - img_rect.height) // 2
     
-    # Calculate the actual image area dimensions (for 'fit' mode calculations)
-    design_canvas_size = min(img_rect.width, img_rect.height)
-    design_canvas_offset_x = (img_rect.width - design_canvas_size) // 2
-    design_canvas_offset_y = (img_rect.height - design_canvas_size) // 2
-
-    for region in PLACEMENT_REGIONS:
-        mode = region.get('rules', {}).get('placement_mode', 'stretch')
-
-        # Convert relative points to coordinates relative to the image
-        image_relative_points = []
-        for rel_x, rel_y in region['shape']:
-            if mode == 'fit':
-                # For 'fit' mode, use the design canvas within the image
-                img_x = int(rel_x * design_canvas_size + design_canvas_offset_x)
-                img_y = int(rel_y * design_canvas_size + design_canvas_offset_y)
-            else: # stretch
-                # For 'stretch' mode, use the full image dimensions
-                img_x = int(rel_x * img_rect.width)
-                img_y = int(rel_y * img_rect.height)
-            image_relative_points.append((img_x, img_y))
-
-        if len(image_relative_points) > 2:
-            # Apply zoom and pan transformations to get screen coordinates
-            screen_points = []
-            for img_x, img_y in image_relative_points:
-                # Apply zoom
-                zoomed_x = int(img_x * zoom_level)
-                zoomed_y = int(img_y * zoom_level)
-                # Apply pan and base position
-                screen_x = zoomed_x + pan_offset_x + base_img_x
-                screen_y = zoomed_y + pan_offset_y + base_img_y
-                screen_points.append((screen_x, screen_y))
-
-            # Create a temporary surface for transparency
-            region_surface = pygame.Surface((W, H), pygame.SRCALPHA)
-            
-            # Draw the filled polygon with alpha
-            region_color_fill = (255, 255, 0, 50) # Yellow, semi-transparent
-            pygame.draw.polygon(region_surface, region_color_fill, screen_points)
-            
-            # Draw the outline
-            region_color_outline = (255, 255, 0, 200) # Yellow, more opaque
-            pygame.draw.polygon(region_surface, region_color_outline, screen_points, 2) # 2px width
-
-            screen.blit(region_surface, (0, 0))
-
-            # Draw region name
-            info_font = pygame.font.Font(None, 20)
-            text_surf = info_font.render(region['name'], True, (255, 255, 255))
-            # Find rough center of polygon to place text
-            avg_x = sum(p[0] for p in screen_points) / len(screen_points)
-            avg_y = sum(p[1] for p in screen_points) / len(screen_points)
-            text_rect = text_surf.get_rect(center=(avg_x, avg_y))
-            screen.blit(text_surf, text_rect)
+    # Polygons and labels are rasterized once per template/zoom onto a single cached layer
+    viewport_rect = pygame.Rect(0, 0, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT)
+    region_layer, layer_pos = region_layer_cache.get_layer(PLACEMENT_REGIONS, img_rect.size, zoom_level, (base_img_x + pan_offset_x, base_img_y + pan_offset_y), viewport_rect)
+    screen.blit(region_layer, layer_pos)
 
     # Draw the anchor points for successfully placed words with zoom and pan
     if 'placed_points_cache' in globals() and placed_points_cache:
@@ -927,14 +879,44 @@ def draw_debug_regions(screen, W, H, PLACEMENT_REGIONS, current_background_surfa
             screen_y = zoomed_y + pan_offset_y + base_img_y
             pygame.draw.circle(screen, (255, 0, 0), (screen_x, screen_y), 5) # Red, 5px radius
 
+def format_coverage_stats():
+    """One-line summary of how often glyph coverage steered font selection (since startup or the batch start)."""
+    return (
+        f"Font coverage: {coverage_stats['misses_avoided']} of {coverage_stats['picks']} picks redirected away from fonts "
+        f"missing glyphs, {coverage_stats['uncovered_words']} word(s) skipped without a covering font"
+    )
+
+def format_font_cache_stats():
+    """One-line summary of font cache lookups and of the time spent waiting for the font loading lock."""
+    return (
+        f"Font cache: {len(font_cache)} fonts, {font_cache_stats['hits']} hits, {font_cache_stats['misses']} misses, "
+        f"{font_cache_stats['lock_waits']} lock waits ({font_cache_stats['lock_wait_seconds'] * 1000:.1f}ms)"
+    )
+
+def log_phase_report(title):
+    """Logs the profiler's per-phase counts and timings as a table."""
+    phases = profiler.summary()
+    if not phases:
+        return
+    table = Table(title=title, title_style="bold magenta")
+    table.add_column("Phase", style="cyan")
+    for column in ("Calls", "Total (ms)", "Mean (ms)", "p50 (ms)", "p95 (ms)", "Max (ms)"):
+        table.add_column(column, justify="right")
+    for name, stats in phases.items():
+        table.add_row(
+            name, str(stats['count']), f"{stats['total'] * 1000:.1f}", f"{stats['mean'] * 1000:.2f}",
+            f"{stats['p50'] * 1000:.2f}", f"{stats['p95'] * 1000:.2f}", f"{stats['max'] * 1000:.2f}",
+        )
+    logger.info(table)
+
 def draw_info_bar(screen, W, MAIN_AREA_HEIGHT, INFO_BAR_HEIGHT, FORCE_REGIONS_ONLY, current_background_image, current_image_index, current_image_directory, layout_generation_count, last_layout_time):
     """Draw the info bar at the bottom of the screen."""
     info_bar_rect = pygame.Rect(0, MAIN_AREA_HEIGHT, W, INFO_BAR_HEIGHT)
     pygame.draw.rect(screen, (40, 40, 40), info_bar_rect)  # Dark background
     pygame.draw.line(screen, (100, 100, 100), (0, MAIN_AREA_HEIGHT), (W, MAIN_AREA_HEIGHT), 1)  # Top border
     
-    info_font = pygame.font.Font(None, 20)
-    small_font = pygame.font.Font(None, 18)  # Slightly larger font for hints
+    # Fonts and rendered strings are cached; a label is only re-rendered when its text changes
+    text_cache = get_text_cache()
     
     # --- Left Side: Image Status ---
     if current_background_image:
@@ -945,13 +927,13 @@ def draw_info_bar(screen, W, MAIN_AREA_HEIGHT, INFO_BAR_HEIGHT, FORCE_REGIONS_ON
             status_text = "Image: Single image loaded"
     else:
         status_text = "Background: Solid color"
-    status_surf = info_font.render(status_text, True, (200, 200, 200))
+    status_surf = text_cache.render(status_text, (200, 200, 200), 20)
     text_y = MAIN_AREA_HEIGHT + (INFO_BAR_HEIGHT - status_surf.get_height()) // 2
     screen.blit(status_surf, (10, text_y))
 
     # --- Center: Hints ---
     hint_text = "Press H for controls | F for fonts | Scroll to zoom | Drag to pan"
-    hint_surf = small_font.render(hint_text, True, (255, 215, 0))  # Gold color
+    hint_surf = text_cache.render(hint_text, (255, 215, 0), 18)  # Gold color
     hint_x = (W - hint_surf.get_width()) // 2
     hint_y = MAIN_AREA_HEIGHT + (INFO_BAR_HEIGHT - hint_surf.get_height()) // 2
     screen.blit(hint_surf, (hint_x, hint_y))
@@ -962,14 +944,14 @@ def draw_info_bar(screen, W, MAIN_AREA_HEIGHT, INFO_BAR_HEIGHT, FORCE_REGIONS_ON
     # Display Image Count
     if current_image_directory:
         total_images_text = f"Total: {len(current_image_directory)} images"
-        total_surf = info_font.render(total_images_text, True, (150, 150, 150))
+        total_surf = text_cache.render(total_images_text, (150, 150, 150), 20)
         right_x_pos -= total_surf.get_width()
         screen.blit(total_surf, (right_x_pos, text_y))
         right_x_pos -= 20 # Add some padding
 
     # Display Placement Mode
     mode_text = "Mode: Regions Only" if FORCE_REGIONS_ONLY else "Mode: All Random"
-    mode_surf = info_font.render(mode_text, True, (200, 200, 200)) # Use a bright color
+    mode_surf = text_cache.render(mode_text, (200, 200, 200), 20) # Use a bright color
     right_x_pos -= mode_surf.get_width()
     screen.blit(mode_surf, (right_x_pos, text_y))
     right_x_pos -= 20 # Add some padding
@@ -979,17 +961,22 @@ def draw_info_bar(screen, W, MAIN_AREA_HEIGHT, INFO_BAR_HEIGHT, FORCE_REGIONS_ON
         template_text = f"Template: {CURRENT_RANDOM_TEMPLATE_NAME} (rand)"
     else:
         template_text = f"Template: {', '.join(ACTIVE_TEMPLATE_NAMES)}"
-    template_surf = info_font.render(template_text, True, (150, 200, 255)) # Blue color for template
+    template_surf = text_cache.render(template_text, (150, 200, 255), 20) # Blue color for template
     right_x_pos -= template_surf.get_width()
     screen.blit(template_surf, (right_x_pos, text_y))
     
     # Display Performance Stats (if available)
-    if layout_generation_count > 0:
-        avg_time = last_layout_time if layout_generation_count == 1 else "N/A"
-        perf_text = f"Layouts: {layout_generation_count}, Avg: {avg_time:.3f}s" if isinstance(avg_time, float) else f"Layouts: {layout_generation_count}"
+    layout_stats = profiler.get('layout')
+    if layout_generation_count > 0 and layout_stats:
+        # Rolling over the most recent layouts
+        perf_text = f"Layouts: {layout_generation_count}, Avg: {layout_stats['mean']:.3f}s, p95: {layout_stats['p95']:.3f}s"
+    elif layout_generation_count > 0:
+        perf_text = f"Layouts: {layout_generation_count}, Last: {last_layout_time:.3f}s"
     else:
         perf_text = "No layouts generated"
-    perf_surf = small_font.render(perf_text, True, (150, 255, 150))  # Green color for performance
+    if font_warmup is not None and not font_warmup.finished:
+        perf_text += f" | Warming fonts: {font_warmup.done}/{font_warmup.total}"
+    perf_surf = text_cache.render(perf_text, (150, 255, 150), 18)  # Green color for performance
     right_x_pos -= perf_surf.get_width() + 10  # Add some padding
     screen.blit(perf_surf, (right_x_pos, text_y))
 
@@ -997,15 +984,16 @@ def draw_info_bar(screen, W, MAIN_AREA_HEIGHT, INFO_BAR_HEIGHT, FORCE_REGIONS_ON
 def set_font_directory(font_dir_path):
     """Set the font directory and reload custom fonts."""
     global FONT_DIR, custom_font_paths
+    # A word reload may be re-checking the font index on its worker
+    wait_for_word_reload()
     FONT_DIR = font_dir_path
     custom_font_paths = []
     
     if FONT_DIR and os.path.isdir(FONT_DIR):
-        for root, _, files in os.walk(FONT_DIR):
-            for fname in files:
-                if any(fname.lower().endswith(ext) for ext in config.supported_extensions.fonts):
-                    custom_font_paths.append(os.path.join(root, fname))
-        logger.info(f"💡 [cyan]INFO:[/] Font directory set. Found {len(custom_font_paths)} custom fonts in '{FONT_DIR}'")
+        chars = word_charset()
+        custom_font_paths = index_font_directory(FONT_DIR, chars)
+        logger.info(f"💡 [cyan]INFO:[/] Font directory set.")
+        log_font_index(FONT_DIR, font_index_summary(chars))
     else:
         if font_dir_path is None:
             # This is an intentional switch to system fonts
@@ -1036,13 +1024,155 @@ def set_image_directory(img_dir_path):
         clear_background_image()
 
 def reload_words():
-    """Reload words from files."""
-    global WORDS
-    from utils.words_loader import WordsLoader
-    loader = WordsLoader(WORDS_DIR)
-    loader.reload_cache()
-    WORDS = loader.load_all_words(config.text.fallback_words)
-    logger.info(f"💡 [cyan]INFO:[/] Reloaded {len(WORDS)} words from files")
+    """Reload words from files in the background and lay out again once they are in."""
+    logger.info("💡 [cyan]INFO:[/] Reloading words in the background...")
+    start_word_reload(relayout=True)
+
+# --- Hot reload -------------------------------------------------------------
+# Settings read only while the window is set up; changing them needs a restart
+RESTART_SETTINGS = {
+    'display.window_width', 'display.window_height', 'display.info_bar_height', 'canvas.main_area_ratio',
+    'paths.default_image_dir', 'paths.default_font_dir', 'paths.cache_dir', 'logging.level',
+}
+# Prefixes of the settings that change which words are drawn, how big and where; the canvas is laid out again
+RELAYOUT_SETTINGS = (
+    'text.', 'layout.', 'canvas.padding', 'fonts.min_size', 'fonts.max_size',
+    'fonts.rotate_letters_on_arc', 'fonts.max_arc_letter_rotation', 'mask.padding_size',
+)
+# Settings the word sampler is built from
+WORD_SETTINGS = {'text.category_weights', 'text.fallback_words', 'paths.word_corpus'}
+
+file_watcher = None
+word_reload = None
+word_reload_again = False
+# Lay out again once the running word reload is applied (it was asked for with W)
+word_reload_relayout = False
+
+def apply_config_changes(changed):
+    """
+    Applies a reloaded configuration, rebuilding only what depends on the `changed`
+    settings (see diff_configs). Returns True if the canvas should be laid out again.
+    """
+    global padding_kernel_mask
+    apply_config_settings()
+    if 'mask.padding_size' in changed:
+        padding_kernel_mask = build_padding_kernel(config.mask.padding_size)
+    # Cached preview layers built from a changed setting (e.g. the grown mask) are redrawn
+    preview_cache.invalidate_settings(changed)
+    if changed & WORD_SETTINGS:
+        start_word_reload()
+    if 'paths.word_corpus' in changed or any(name.startswith('performance.hot_reload') for name in changed):
+        start_file_watcher()
+    if startup_complete and any(name.startswith(('fonts.min_size', 'fonts.max_size', 'fonts.prewarm')) for name in changed):
+        start_font_warmup(export_scale_factors())
+    needs_restart = sorted(changed & RESTART_SETTINGS)
+    if needs_restart:
+        logger.warning(f"Restart to apply: {', '.join(needs_restart)}")
+    return any(name.startswith(RELAYOUT_SETTINGS) for name in changed)
+
+def _reload_words_task():
+    """
+    Background task: words.json re-read and the word sampler rebuilt; the font index is
+    re-checked for new characters. Returns (sampler, update_font_index() result or None),
+    applied on the main thread by poll_word_reload().
+    """
+    words_loader.reload_words(config.text.fallback_words)
+    font_result = None
+    if FONT_DIR and os.path.isdir(FONT_DIR):
+        font_result = update_font_index(FONT_DIR, word_charset())
+    return build_word_sampler(), font_result
+
+def start_word_reload(relayout=False):
+    """
+    Rebuilds the word sampler in the background (once more after the running rebuild, if
+    there is one). With `relayout`, the canvas is laid out again with the new words.
+    """
+    global word_reload, word_reload_again, word_reload_relayout
+    word_reload_relayout = word_reload_relayout or relayout
+    if word_reload is not None:
+        word_reload_again = True
+        return
+    word_reload = StartupTasks([('words', _reload_words_task)]).start()
+
+def poll_word_reload(block=False):
+    """Swaps in the rebuilt word sampler and font coverage once they are ready (waiting for them with `block`)."""
+    global word_reload, word_reload_again, word_reload_relayout, WORDS, WORD_INDEX
+    if word_reload is None:
+        return
+    for _, result, seconds in word_reload.poll(block=block):
+        if isinstance(result, Exception):
+            logger.error(f"Reloading words failed: {result}")
+            continue
+        WORD_INDEX, font_result = result
+        WORDS = get_words()
+        if font_result is not None:
+            apply_font_index(font_result)
+        logger.info(f"💡 [cyan]INFO:[/] Reloaded {len(WORD_INDEX)} words in {seconds * 1000:.0f} ms")
+    if not word_reload.done:
+        return
+    word_reload = None
+    if word_reload_again:
+        # Files changed again while reloading; the words just applied may be stale already
+        word_reload_again = False
+        start_word_reload()
+    elif word_reload_relayout:
+        word_reload_relayout = False
+        layout()
+
+def wait_for_word_reload():
+    """Finishes and applies the running word reload(s), so nothing else updates the font index meanwhile."""
+    while word_reload is not None:
+        poll_word_reload(block=True)
+
+def reload_region_templates():
+    """Re-reads region_templates.json; returns True if the active regions may have changed."""
+    global ACTIVE_TEMPLATE_NAMES
+    if not region_manager.reload_templates():
+        return False
+    # Templates removed from the file drop out of the selection
+    ACTIVE_TEMPLATE_NAMES = [name for name in ACTIVE_TEMPLATE_NAMES if name in region_manager.templates] or ["Default"]
+    _refresh_placement_regions()
+    return True
+
+def watched_files():
+    """Absolute paths of config.yaml, words.json, region_templates.json and the word corpus (if any)."""
+    paths = [config_manager.config_path, words_loader.filepath, region_manager.templates_file]
+    if config.paths.word_corpus:
+        paths.append(os.path.join(SCRIPT_DIR, config.paths.word_corpus))
+    return [os.path.abspath(path) for path in paths]
+
+def start_file_watcher():
+    """(Re)starts watching the files applied by poll_file_changes, if performance.hot_reload is on."""
+    global file_watcher
+    if file_watcher is not None:
+        file_watcher.stop()
+        file_watcher = None
+    if config.performance.hot_reload:
+        file_watcher = FileWatcher(watched_files(), config.performance.hot_reload_interval).start()
+
+def poll_file_changes():
+    """
+    Applies edits to the watched files: each rebuilds only what depends on it, and the
+    canvas is laid out again only when the words' placement depends on the change.
+    """
+    if file_watcher is None:
+        return
+    changed = file_watcher.poll()
+    if not changed:
+        return
+    config_file = os.path.abspath(config_manager.config_path)
+    templates_file = os.path.abspath(region_manager.templates_file)
+    relayout = False
+    for path in changed:
+        logger.info(f"💡 [cyan]INFO:[/] '{os.path.basename(path)}' changed on disk")
+        if path == config_file:
+            relayout |= reload_configuration()
+        elif path == templates_file:
+            relayout |= reload_region_templates()
+        else:
+            start_word_reload()  # words.json or the word corpus
+    if relayout and not BATCH_PROCESSING_MODE:
+        layout()
 
 def toggle_mask_overlay():
     """Toggle the mask overlay debug mode."""
@@ -1158,6 +1288,19 @@ def handle_pan(mouse_pos):
     redraw_layout()
     pygame.display.flip()
 
+def build_preview_surface(base_img_x, base_img_y):
+    """Composes the background image and all text sprites into one preview surface."""
+    img_rect = current_background_surface.get_rect()
+    preview_surface = pygame.Surface((img_rect.width, img_rect.height), pygame.SRCALPHA)
+    preview_surface.blit(current_background_surface, (0, 0))
+
+    # Always draw text sprites (both for normal view and mask overlay view)
+    if 'placed_sprites_cache' in globals() and placed_sprites_cache:
+        for sprite in placed_sprites_cache:
+            # The sprites are positioned relative to the canvas, but we need them relative to the image
+            preview_surface.blit(sprite.image, (sprite.rect.x - base_img_x, sprite.rect.y - base_img_y))
+    return preview_surface
+
 def redraw_layout():
     """Redraws the screen with the cached layout, without regenerating."""
     # 1. Draw background
@@ -1165,35 +1308,17 @@ def redraw_layout():
     pygame.draw.rect(screen, DEFAULT_BACKGROUND_COLOR, main_area_rect)
 
     if current_background_surface:
-        # Create a combined preview surface with image + text as one unit
         img_rect = current_background_surface.get_rect()
-        preview_surface = pygame.Surface((img_rect.width, img_rect.height), pygame.SRCALPHA)
-        
-        # Draw the background image onto the preview surface
-        preview_surface.blit(current_background_surface, (0, 0))
-        
+
         # Calculate base position (centered) - MUST be calculated before using it
         base_img_x = (MAIN_AREA_WIDTH - img_rect.width) // 2
         base_img_y = (MAIN_AREA_HEIGHT - img_rect.height) // 2
-        
-        # Draw all text sprites onto the preview surface at their original positions
-        # Always draw text sprites (both for normal view and mask overlay view)
-        if 'placed_sprites_cache' in globals() and placed_sprites_cache:
-            for sprite in placed_sprites_cache:
-                # Calculate sprite position relative to the image (not the full canvas)
-                # The sprites are positioned relative to the canvas, but we need them relative to the image
-                sprite_x = sprite.rect.x - base_img_x
-                sprite_y = sprite.rect.y - base_img_y
-                preview_surface.blit(sprite.image, (sprite_x, sprite_y))
-        
-        # Apply zoom and pan to the entire preview surface
-        if abs(zoom_level - 1.0) > 0.01:
-            scaled_width = int(img_rect.width * zoom_level)
-            scaled_height = int(img_rect.height * zoom_level)
-            scaled_preview = pygame.transform.scale(preview_surface, (scaled_width, scaled_height))
-            screen.blit(scaled_preview, (base_img_x + pan_offset_x, base_img_y + pan_offset_y))
-        else:
-            screen.blit(preview_surface, (base_img_x + pan_offset_x, base_img_y + pan_offset_y))
+
+        # The composed image + text preview is built once per layout. Zoomed-out views come from
+        # its pyramid; zoomed-in views only scale the part that falls inside the main area
+        scaled_preview, preview_pos = preview_cache.get_clipped('preview', lambda: build_preview_surface(base_img_x, base_img_y), zoom_level, (base_img_x + pan_offset_x, base_img_y + pan_offset_y), main_area_rect)
+        if scaled_preview:
+            screen.blit(scaled_preview, preview_pos)
         
         # Store canvas offset for other functions
         canvas_offset_x = base_img_x + pan_offset_x
@@ -1225,6 +1350,11 @@ def redraw_layout():
         screen.blit(mask_panel_surface, (mask_area_x, 0))
         pygame.draw.line(screen, (100, 100, 100), (mask_area_x, 0), (mask_area_x, MAIN_AREA_HEIGHT), 2)
     
+    # 4. Startup is still loading fonts, words or the first image
+    if not startup_complete:
+        loading_surf = get_text_cache().render("Loading fonts, words and images...", (220, 220, 220), 28)
+        screen.blit(loading_surf, loading_surf.get_rect(center=main_area_rect.center))
+
     draw_info_bar(screen, W, MAIN_AREA_HEIGHT, INFO_BAR_HEIGHT, FORCE_REGIONS_ONLY, current_background_image, current_image_index, current_image_directory, layout_generation_count, last_layout_time)
 
 def setup_ui_elements():
@@ -1257,11 +1387,14 @@ def update_toggle_region_button_text():
 
 
 def layout(auto_advance_image=False, skip_redraw=False):
-    global placed_sprites_cache, placed_points_cache, current_image_index, current_image_directory, current_background_image, current_background_surface, show_mask_overlay, layout_generation_count, last_layout_time, PLACEMENT_REGIONS
+    global placed_sprites_cache, placed_points_cache, last_placement_stats, current_image_index, current_image_directory, current_background_image, current_background_surface, show_mask_overlay, layout_generation_count, last_layout_time, PLACEMENT_REGIONS
     
+    # Fonts, words and the first image are still loading; finish_startup() lays out once they are in
+    if not startup_complete:
+        return
+
     # Performance monitoring
-    import time
-    start_time = time.time()
+    start_time = time.perf_counter()
     layout_generation_count += 1
     
     # Auto-advance to next image if directory is loaded and requested
@@ -1269,7 +1402,8 @@ def layout(auto_advance_image=False, skip_redraw=False):
         advance_to_next_image()
     
     # Reload the active template in case it was changed externally or needs resetting
-    _refresh_placement_regions()
+    with profiler.phase('template_refresh'):
+        _refresh_placement_regions()
     
     master_letter_sprites.empty()
     all_sprites_to_draw = []
@@ -1283,21 +1417,31 @@ def layout(auto_advance_image=False, skip_redraw=False):
     else:
         canvas_offset_x, canvas_offset_y = 0, 0
     
-    # --- Define dimensions for both 'fit' and 'stretch' modes ---
-    fit_canvas_size = min(canvas_width, canvas_height)
-    fit_canvas_offset_x = canvas_offset_x + (canvas_width - fit_canvas_size) // 2
-    fit_canvas_offset_y = canvas_offset_y + (canvas_height - fit_canvas_size) // 2
-    
+    # Resolve every region to canvas pixels ('fit' or 'stretch') and triangulate it once for this layout
+    compiled_regions = compile_regions(PLACEMENT_REGIONS, canvas_width, canvas_height, canvas_offset_x, canvas_offset_y)
+    # Vectorized candidate generation, seeded from `random` so seeding it still reproduces layouts
+    np_rng = np.random.default_rng(random.getrandbits(64))
+    # Bounds and collision checks for whole candidate batches against an occupancy mask
+    placement_evaluator = PlacementEvaluator(canvas_width, canvas_height, canvas_offset_x, canvas_offset_y, CANVAS_PADDING, adaptive=config.layout.adaptive_attempts, stop_after_failures=config.layout.saturation_stop_failures)
+
+    # Freeform rule lookups; rebuilt only when the canvas or template changes
+    if not FORCE_REGIONS_ONLY:
+        rule_raster = get_region_rule_raster(compiled_regions, canvas_width, canvas_height, canvas_offset_x, canvas_offset_y, REGION_RASTER_CELL_SIZE)
+
     if FORCE_REGIONS_ONLY:
         # --- Region-driven layout composition ---
         # Here we iterate through regions and populate them based on their rules
         total_placed_count = 0
         total_words_attempted = 0
+        # Words resized by the sizing stage, and words too large for their region at any usable size
+        sizing_shrunk = 0
+        sizing_skipped = 0
         if not BATCH_PROCESSING_MODE:
             console.print("\n--- Region Placement Report ---", style="bold magenta")
 
-        for region in PLACEMENT_REGIONS:
-            rules = region.get('rules', {})
+        for compiled_region in compiled_regions:
+            region = compiled_region.region
+            rules = compiled_region.rules
             if 'word_count_range' not in rules:
                 continue
             
@@ -1306,14 +1450,31 @@ def layout(auto_advance_image=False, skip_redraw=False):
             num_words_to_place = random.randint(min_words, max_words)
             total_words_attempted += num_words_to_place
             
+            # Largest word the region can hold: its own extent if words must stay inside it,
+            # otherwise the padded canvas (only the center has to be in the region)
+            if rules.get('enforce_boundaries', False):
+                max_word_width, max_word_height = compiled_region.bbox.width, compiled_region.bbox.height
+            else:
+                max_word_width, max_word_height = canvas_width - 2 * CANVAS_PADDING, canvas_height - 2 * CANVAS_PADDING
+
             placed_in_this_region = 0
+            placement_evaluator.begin_group()
             for _ in range(num_words_to_place):
-                word = random.choice(WORDS)
+                # Stop filling this region once it is saturated
+                if placement_evaluator.should_stop():
+                    break
+                saturated = placement_evaluator.saturated
 
                 # Generate word properties based on region rules
                 min_size, max_size = rules.get('size_range', (MIN_FONT_SIZE, MAX_FONT_SIZE))
                 if min_size > max_size: min_size = max_size # Safety check
                 size = random.randint(min_size, max_size)
+                if saturated:
+                    size = random.randint(min_size, size) # Skip to smaller sizes
+                # Draw among the words estimated to fit the region at this size
+                word = pick_word(prefer_short=saturated, max_width=max_word_width, size=size)
+                if word is None:
+                    continue
                 
                 text_type_rule = rules.get('text_type', 'any')
                 if text_type_rule == 'any':
@@ -1321,114 +1482,83 @@ def layout(auto_advance_image=False, skip_redraw=False):
                 else:
                     text_type = text_type_rule
 
-                font, font_identifier, font_display_name = get_font(size, custom_font_paths)
+                font, font_identifier, font_display_name = get_font(size, custom_font_paths, word)
+                if font is None:
+                    continue # No font has glyphs for this word
                 color = get_random_color()
-                
-                # Generate sprites for the word
+                asset_path = random.choice(ASSET_PATHS) if text_type == "asset" and ASSET_PATHS else None
+
+                # Sizing stage: for straight text, the glyph widths of the chosen face give the largest
+                # size that fits, so an oversized word is resized instead of burning its tries
+                shrunk = False
                 if text_type == "normal":
-                    new_sprites, word_bbox = create_normal_sprites(word, font, color, font_identifier, size, PADDING, padding_kernel_mask, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION)
-                elif text_type == "arc": # arc
-                    new_sprites, word_bbox = create_arc_sprites(word, font, color, font_identifier, size, ARC_MIN_RADIUS, ARC_MAX_RADIUS, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION, padding_kernel_mask)
-                elif text_type == "asset":
-                    if not ASSET_PATHS:
-                        new_sprites, word_bbox = [], None
-                    else:
-                        asset_path = random.choice(ASSET_PATHS)
-                        new_sprites, word_bbox = create_asset_sprite(asset_path, size, padding_kernel_mask)
-                else:
-                    new_sprites, word_bbox = [], None
+                    fitting_size = max_fitting_font_size(font, word, size, max_word_width, PADDING)
+                    if fitting_size < size:
+                        # Stay within the rule's range if possible, otherwise shrink below it
+                        size = random.randint(min_size, fitting_size) if fitting_size >= min_size else fitting_size
+                        if size < MIN_FIT_FONT_SIZE:
+                            sizing_skipped += 1
+                            continue
+                        font = get_cached_font(font_identifier, size)
+                        shrunk = True
 
+                # Generate sprites for the word
+                new_sprites, word_bbox = create_word_sprites(word, text_type, font, color, font_identifier, size, asset_path)
                 if not new_sprites:
                     continue
 
-                # Try to place the word inside the CURRENT region
-                for _ in range(MAX_PLACEMENT_TRIES):
-                    # 1. Get a test center position inside the region, respecting its placement mode
-                    test_pos_center = None
-                    placement_mode = region.get('rules', {}).get('placement_mode', 'stretch')
-                    all_x = [p[0] for p in region['shape']]
-                    all_y = [p[1] for p in region['shape']]
-                    
-                    for _ in range(10): # Try 10 times to find a point
-                        rand_rel_x = random.uniform(min(all_x), max(all_x))
-                        rand_rel_y = random.uniform(min(all_y), max(all_y))
-                        
-                        if point_in_polygon(rand_rel_x, rand_rel_y, region['shape']):
-                            if placement_mode == 'fit':
-                                center_x = rand_rel_x * fit_canvas_size + fit_canvas_offset_x
-                                center_y = rand_rel_y * fit_canvas_size + fit_canvas_offset_y
-                            else: # stretch
-                                center_x = rand_rel_x * canvas_width + canvas_offset_x
-                                center_y = rand_rel_y * canvas_height + canvas_offset_y
-                            test_pos_center = (int(center_x), int(center_y))
-                            break
-                    
-                    if not test_pos_center:
+                # The rendered bbox is authoritative (and covers arcs and assets): shrink once more if needed
+                if word_bbox.width > max_word_width or word_bbox.height > max_word_height:
+                    scale = min(max_word_width / max(1, word_bbox.width), max_word_height / max(1, word_bbox.height))
+                    size = int(size * scale)
+                    if size < MIN_FIT_FONT_SIZE:
+                        sizing_skipped += 1
                         continue
-
-                    # 2. Validate the Proposed Position
-                    is_valid_pos = True
-                    word_rect = word_bbox.copy()
-                    word_rect.center = test_pos_center
-                    top_left_offset = word_rect.topleft
-
-                    # New: Check if word is fully inside the polygon if rule is enabled
-                    enforce_boundaries = rules.get('enforce_boundaries', False)
-                    if enforce_boundaries:
-                        # Get all four corners of the word's bounding box
-                        corners = [
-                            word_rect.topleft,
-                            word_rect.topright,
-                            word_rect.bottomleft,
-                            word_rect.bottomright
-                        ]
-                        
-                        # Convert each corner to relative coordinates and check if it's in the polygon
-                        for corner_x, corner_y in corners:
-                            # Convert absolute corner coordinates to relative coordinates for the check
-                            if placement_mode == 'fit':
-                                if fit_canvas_size == 0:
-                                    is_valid_pos = False; break
-                                rel_corner_x = (corner_x - fit_canvas_offset_x) / fit_canvas_size
-                                rel_corner_y = (corner_y - fit_canvas_offset_y) / fit_canvas_size
-                            else: # stretch
-                                if canvas_width == 0 or canvas_height == 0:
-                                    is_valid_pos = False; break
-                                rel_corner_x = (corner_x - canvas_offset_x) / canvas_width
-                                rel_corner_y = (corner_y - canvas_offset_y) / canvas_height
-                            
-                            if not point_in_polygon(rel_corner_x, rel_corner_y, region['shape']):
-                                is_valid_pos = False
-                                break # One corner out is enough to invalidate
-                        if not is_valid_pos:
-                            continue # Try a new random point
-
-                    # Check canvas boundaries
-                    if not is_within_canvas(word_rect, canvas_width, canvas_height, CANVAS_PADDING, canvas_offset_x, canvas_offset_y):
-                        is_valid_pos = False
-                    
-                    if not is_valid_pos:
+                    font = get_cached_font(font_identifier, size)
+                    new_sprites, word_bbox = create_word_sprites(word, text_type, font, color, font_identifier, size, asset_path)
+                    if not new_sprites or word_bbox.width > max_word_width or word_bbox.height > max_word_height:
+                        sizing_skipped += 1
                         continue
+                    shrunk = True
+                sizing_shrunk += shrunk
 
-                    # Check collision with existing letters
-                    proposed_rects = [s.rect.move(top_left_offset) for s in new_sprites]
-                    for i, sprite in enumerate(new_sprites):
-                        original_rect = sprite.rect
-                        sprite.rect = proposed_rects[i]
-                        if pygame.sprite.spritecollide(sprite, master_letter_sprites, False, check_padded_collision):
-                            is_valid_pos = False
-                        sprite.rect = original_rect
-                        if not is_valid_pos: break
-                    
-                    if is_valid_pos:
-                        for i, sprite in enumerate(new_sprites):
-                            sprite.rect = proposed_rects[i]
-                        master_letter_sprites.add(new_sprites)
-                        all_sprites_to_draw.extend(new_sprites)
+                # Try to place the word inside the CURRENT region (degenerate regions cannot hold anything)
+                if compiled_region.area == 0:
+                    continue
+                enforce_boundaries = rules.get('enforce_boundaries', False)
+                half_w, half_h = word_bbox.width // 2, word_bbox.height // 2
+                budget = placement_evaluator.attempt_budget(MAX_PLACEMENT_TRIES)
+                tries_left = budget
+                placed = False
+                while tries_left > 0:
+                    # 1. Draw a batch of uniformly sampled test center positions inside the region
+                    batch_size = min(CANDIDATE_BATCH_SIZE, tries_left)
+                    tries_left -= batch_size
+                    with profiler.phase('candidate_sampling'):
+                        candidates = [p for p in (compiled_region.sample_point() for _ in range(batch_size)) if p]
+                        if not candidates:
+                            continue
+                        centers = np.array(candidates)
+
+                        # 2. If the rule is enabled, keep only candidates whose word bbox corners are all
+                        #    inside the polygon, testing every corner of the batch at once
+                        if enforce_boundaries:
+                            left = centers[:, 0] - half_w
+                            top = centers[:, 1] - half_h
+                            right = left + word_bbox.width
+                            bottom = top + word_bbox.height
+                            corners_inside = compiled_region.contains_points(
+                                np.stack([left, right, left, right]), np.stack([top, top, bottom, bottom])
+                            )
+                            centers = centers[corners_inside.all(axis=0)]
+
+                    # 3. Canvas boundaries and collisions for the survivors; commit the first valid one
+                    if try_place_word(placement_evaluator, new_sprites, word_bbox, centers[:, 0], centers[:, 1], all_sprites_to_draw):
                         used_fonts.append(f"{word} ({font_display_name}, {size}px)")
                         placed_in_this_region += 1
-                        placed_points_cache.append(test_pos_center)
+                        placed = True
                         break # Successfully placed, move to next word
+                placement_evaluator.record_word(placed, budget - tries_left, budget, MAX_PLACEMENT_TRIES)
             
             # Log the result for the current region
             total_placed_count += placed_in_this_region
@@ -1438,6 +1568,11 @@ def layout(auto_advance_image=False, skip_redraw=False):
         if not BATCH_PROCESSING_MODE:
             console.print("---------------------------------", style="bold magenta")
             console.print(f"Total: Placed {total_placed_count} out of {total_words_attempted} attempted words across all regions.")
+            if sizing_shrunk or sizing_skipped:
+                # Each of these words was too large for its region and would have used its whole try budget
+                saved_tries = (sizing_shrunk + sizing_skipped) * MAX_PLACEMENT_TRIES
+                console.print(f"Sizing: {sizing_shrunk} word(s) shrunk to fit, {sizing_skipped} skipped as too large (saved up to {saved_tries} placement tries).")
+            console.print(format_placement_stats(placement_evaluator.stats()))
 
     else:
         # --- Freeform layout generation ---
@@ -1448,117 +1583,84 @@ def layout(auto_advance_image=False, skip_redraw=False):
         for _ in range(MAX_ATTEMPTS_TOTAL):
             if placed_words_count >= num_words:
                 break
+            # Stop the layout early once the canvas is saturated
+            if placement_evaluator.should_stop():
+                break
             
             total_attempts += 1
-            word = random.choice(WORDS)
+            saturated = placement_evaluator.saturated
             
             # --- Hotspot/Random generation (original logic) ---
             size = random.randint(MIN_FONT_SIZE, MAX_FONT_SIZE)
+            if saturated:
+                size = random.randint(MIN_FONT_SIZE, size) # Skip to smaller sizes
+            # Draw among the words estimated to fit the padded canvas at this size
+            word = pick_word(prefer_short=saturated, max_width=canvas_width - 2 * CANVAS_PADDING, size=size)
+            if word is None:
+                continue
             text_type = random.choices(TEXT_TYPES, weights=TEXT_TYPE_WEIGHTS, k=1)[0]
             
-            font, font_identifier, font_display_name = get_font(size, custom_font_paths)
+            font, font_identifier, font_display_name = get_font(size, custom_font_paths, word)
+            if font is None:
+                continue # No font has glyphs for this word
             color = get_random_color()
             
-            if text_type == "normal":
-                new_sprites, word_bbox = create_normal_sprites(word, font, color, font_identifier, size, PADDING, padding_kernel_mask, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION)
-            elif text_type == "arc": # arc
-                new_sprites, word_bbox = create_arc_sprites(word, font, color, font_identifier, size, ARC_MIN_RADIUS, ARC_MAX_RADIUS, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION, padding_kernel_mask)
-            elif text_type == "asset":
-                if not ASSET_PATHS:
-                    new_sprites, word_bbox = [], None
-                else:
-                    asset_path = random.choice(ASSET_PATHS)
-                    new_sprites, word_bbox = create_asset_sprite(asset_path, size, padding_kernel_mask)
-            else:
-                new_sprites, word_bbox = [], None
+            asset_path = random.choice(ASSET_PATHS) if text_type == "asset" and ASSET_PATHS else None
+            new_sprites, word_bbox = create_word_sprites(word, text_type, font, color, font_identifier, size, asset_path)
 
             if not new_sprites:
                 continue
 
+            # Cells where the region rules allow this word; if there are none, no try can succeed
+            allowed_cells = rule_raster.allowed_cells(text_type, size, (MIN_FONT_SIZE, MAX_FONT_SIZE))
+
             # Find a valid position for the entire word on the canvas
-            for _ in range(MAX_ATTEMPTS_PER_WORD):
-                # 1. Determine Placement Strategy & Get a Test Center Position
-                half_w, half_h = word_bbox.width // 2, word_bbox.height // 2
-                rand_x_min = CANVAS_PADDING + half_w
-                rand_x_max = canvas_width - CANVAS_PADDING - half_w
-                rand_y_min = CANVAS_PADDING + half_h
-                rand_y_max = canvas_height - CANVAS_PADDING - half_h
-                
-                if rand_x_min >= rand_x_max or rand_y_min >= rand_y_max:
-                    break
+            half_w, half_h = word_bbox.width // 2, word_bbox.height // 2
+            rand_x_min = CANVAS_PADDING + half_w
+            rand_x_max = canvas_width - CANVAS_PADDING - half_w
+            rand_y_min = CANVAS_PADDING + half_h
+            rand_y_max = canvas_height - CANVAS_PADDING - half_h
+            if rand_x_min >= rand_x_max or rand_y_min >= rand_y_max:
+                continue
 
-                test_pos_center = (
-                    random.randint(rand_x_min, rand_x_max) + canvas_offset_x,
-                    random.randint(rand_y_min, rand_y_max) + canvas_offset_y
-                )
-
-                # 2. Validate the Proposed Position
-                is_valid_pos = True
-                word_rect = word_bbox.copy()
-                word_rect.center = test_pos_center
-                top_left_offset = word_rect.topleft
-
-                # Region Rule Enforcement - must check all regions, respecting their individual modes
-                for check_region in PLACEMENT_REGIONS:
-                    check_mode = check_region.get('rules', {}).get('placement_mode', 'stretch')
-                    
-                    # Convert absolute center to relative coords for the region being checked
-                    if check_mode == 'fit':
-                        if fit_canvas_size == 0: continue # Avoid division by zero
-                        relative_center_x = (test_pos_center[0] - fit_canvas_offset_x) / fit_canvas_size
-                        relative_center_y = (test_pos_center[1] - fit_canvas_offset_y) / fit_canvas_size
-                    else: # stretch
-                        if canvas_width == 0 or canvas_height == 0: continue # Avoid division by zero
-                        relative_center_x = (test_pos_center[0] - canvas_offset_x) / canvas_width
-                        relative_center_y = (test_pos_center[1] - canvas_offset_y) / canvas_height
-
-                    # Only check rules if the point is within the region's shape
-                    if 0 <= relative_center_x <= 1 and 0 <= relative_center_y <= 1:
-                        if point_in_polygon(relative_center_x, relative_center_y, check_region['shape']):
-                            rules = check_region['rules']
-                            
-                            # Check text type
-                            allowed_text_types = rules.get('text_types', ['any'])
-                            if 'any' not in allowed_text_types and text_type not in allowed_text_types:
-                                is_valid_pos = False; break
-                                
-                            # Check font size
-                            min_size_rule, max_size_rule = rules.get('font_size_range', (MIN_FONT_SIZE, MAX_FONT_SIZE))
-                            if not (min_size_rule <= size <= max_size_rule):
-                                is_valid_pos = False; break
-                if not is_valid_pos: continue
-
-                # Canvas boundaries
-                if not is_within_canvas(word_rect, canvas_width, canvas_height, CANVAS_PADDING, canvas_offset_x, canvas_offset_y):
-                    is_valid_pos = False
-                if not is_valid_pos: continue
-
-                # Collision with existing letters
-                proposed_rects = [s.rect.move(top_left_offset) for s in new_sprites]
-                for i, sprite in enumerate(new_sprites):
-                    original_rect = sprite.rect
-                    sprite.rect = proposed_rects[i]
-                    if pygame.sprite.spritecollide(sprite, master_letter_sprites, False, check_padded_collision):
-                        is_valid_pos = False
-                    sprite.rect = original_rect
-                    if not is_valid_pos: break
-                
-                # 3. Success! Commit the placement
-                if is_valid_pos:
-                    for i, sprite in enumerate(new_sprites):
-                        sprite.rect = proposed_rects[i]
-                    master_letter_sprites.add(new_sprites)
-                    all_sprites_to_draw.extend(new_sprites)
+            budget = placement_evaluator.attempt_budget(MAX_ATTEMPTS_PER_WORD)
+            tries_left = budget
+            placed = False
+            while tries_left > 0:
+                # 1. Generate a batch of test center positions, only in cells the rules allow
+                batch_size = min(CANDIDATE_BATCH_SIZE, tries_left)
+                tries_left -= batch_size
+                with profiler.phase('candidate_sampling'):
+                    candidates = rule_raster.sample_points(
+                        np_rng, batch_size,
+                        rand_x_min + canvas_offset_x, rand_x_max + canvas_offset_x,
+                        rand_y_min + canvas_offset_y, rand_y_max + canvas_offset_y,
+                        allowed_cells,
+                    )
+                    if candidates is None:
+                        break # The rules forbid this word everywhere it could fit
+                    xs, ys = candidates
+
+                    # 2. Region rule enforcement for the whole batch with one raster lookup
+                    allowed = rule_raster.allows(xs, ys, text_type, size, (MIN_FONT_SIZE, MAX_FONT_SIZE))
+                    xs, ys = xs[allowed], ys[allowed]
+
+                # 3. Canvas boundaries and collisions for the survivors; commit the first valid one
+                if try_place_word(placement_evaluator, new_sprites, word_bbox, xs, ys, all_sprites_to_draw):
                     used_fonts.append(f"{word} ({font_display_name}, {size}px)")
                     placed_words_count += 1
-                    placed_points_cache.append(test_pos_center)
-                    break 
+                    placed = True
+                    break
+            placement_evaluator.record_word(placed, budget - tries_left, budget, MAX_ATTEMPTS_PER_WORD)
         
         if not BATCH_PROCESSING_MODE:
             logger.info(f"Placement Report: Placed {placed_words_count} out of {num_words} attempted words in {total_attempts} tries.")
+            logger.info(format_placement_stats(placement_evaluator.stats()))
 
     # --- Store the newly generated layout in the cache ---
     placed_sprites_cache = all_sprites_to_draw
+    last_placement_stats = placement_evaluator.stats()
+    preview_cache.invalidate()
     
     # --- Drawing Phase ---
     # Call the dedicated redraw function to put the new layout on screen
@@ -1566,8 +1668,9 @@ def layout(auto_advance_image=False, skip_redraw=False):
         redraw_layout()
 
     # Performance monitoring - end
-    end_time = time.time()
+    end_time = time.perf_counter()
     last_layout_time = end_time - start_time
+    profiler.add('layout', last_layout_time)
     
     # Display used fonts information if enabled
     if SHOW_FONT_INFO and used_fonts and not BATCH_PROCESSING_MODE:
@@ -1576,59 +1679,104 @@ def layout(auto_advance_image=False, skip_redraw=False):
         for font_entry in used_fonts:
             font_text.append(f"  {font_entry}\n")
         font_text.append(f"Total fonts used: {len(set(f.split('(')[1].split(',')[0] for f in used_fonts))}\n")
+        if coverage_stats['picks']:
+            font_text.append(f"{format_coverage_stats()}\n")
         font_text.append(f"Layout generation time: {last_layout_time:.3f}s\n")
         font_text.append("=" * 35, style="bold magenta")
         logger.info(Panel(font_text, expand=False, border_style="magenta"))
 
     update_toggle_region_button_text()
 
-layout()                                            # draw once; call again if you want a new arrangement
-setup_ui_elements()
-controls_text = Text()
-controls_text.append("--- TEXT OVERLAY DEMO CONTROLS ---\n", style="bold cyan")
-controls_text.append("SPACE: Generate new layout + next image\n\n", style="green")
-controls_text.append("--- Font Controls ---\n", style="bold yellow")
-controls_text.append("F: Show font catalog\n")
-controls_text.append("C: Set custom font directory\n")
-controls_text.append("R: Reload fonts from default directory\n")
-controls_text.append("Y: Switch to system fonts\n\n")
-controls_text.append("--- Image Controls ---\n", style="bold yellow")
-controls_text.append("I: Set image directory (IMG_DIR)\n")
-controls_text.append("N: Next image (manual)\n")
-controls_text.append("P: Previous image (manual)\n")
-controls_text.append("X: Clear background image\n\n")
-controls_text.append("--- Debug Controls ---\n", style="bold yellow")
-controls_text.append("M: Toggle mask view (black/white masks on gray background)\n")
-controls_text.append("D: Toggle region debug view (shows rule-based zones)\n")
-controls_text.append("G: Toggle region constraint (force text only in zones)\n")
-controls_text.append("E: Edit region templates\n")
-controls_text.append("T: Switch between region templates\n\n")
-controls_text.append("--- General ---\n", style="bold yellow")
-controls_text.append("S: Save current layout and mask\n")
-controls_text.append("O: Batch save multiple layouts (parallel processing)\n")
-controls_text.append("ESC: Quit\n\n")
-controls_text.append(f"Font source: {'Custom fonts' if custom_font_paths else 'System fonts'}\n")
-if current_background_image:
-    if current_image_directory:
-        current_name = os.path.basename(current_image_directory[current_image_index])
-        controls_text.append(f"Image: {current_name} ({current_image_index + 1}/{len(current_image_directory)})\n")
+def export_scale_factors(megapixels=None):
+    """
+    Preview-to-output scale factors the next exports will likely use: the current image's,
+    and for a batch resized to `megapixels`, the factor that target implies.
+    """
+    canvas_width, canvas_height = get_canvas_dimensions()
+    factors = set()
+    if original_pil_image is not None:
+        factors.add(original_pil_image.size[0] / canvas_width)
+    if megapixels:
+        factors.add(math.sqrt(megapixels * 1_000_000 / (canvas_width * canvas_height)))
+    return sorted(factors)
+
+def start_font_warmup(scale_factors=()):
+    """Preloads the layout fonts for MIN_FONT_SIZE..MAX_FONT_SIZE (and the export sizes) in the background."""
+    global font_warmup, font_warmup_reported
+    if not config.fonts.prewarm:
+        return
+    if font_warmup is not None:
+        font_warmup.cancel()
+        font_warmup.wait()
+    font_identifiers = custom_font_paths or get_system_fonts()
+    size_stages = warmup_size_stages(MIN_FONT_SIZE, MAX_FONT_SIZE, scale_factors)
+    font_warmup = FontWarmup(font_identifiers, size_stages, config.fonts.prewarm_memory_mb * 1_000_000).start()
+    font_warmup_reported = False
+
+def poll_font_warmup():
+    """Logs the warm-up summary once it has finished."""
+    global font_warmup_reported
+    if font_warmup is None or font_warmup_reported or not font_warmup.finished:
+        return
+    font_warmup_reported = True
+    profiler.add('font_warmup', font_warmup.elapsed)
+    skipped = f", {font_warmup.skipped} skipped over the {config.fonts.prewarm_memory_mb} MB budget" if font_warmup.skipped else ""
+    logger.info(f"🔥 Font warm-up: {font_warmup.progress_text()} preloaded in {font_warmup.elapsed:.1f}s{skipped}")
+
+def log_controls():
+    """Logs the keyboard controls and the current font, image and template status."""
+    controls_text = Text()
+    controls_text.append("--- TEXT OVERLAY DEMO CONTROLS ---\n", style="bold cyan")
+    controls_text.append("SPACE: Generate new layout + next image\n\n", style="green")
+    controls_text.append("--- Font Controls ---\n", style="bold yellow")
+    controls_text.append("F: Show font catalog\n")
+    controls_text.append("C: Set custom font directory\n")
+    controls_text.append("R: Reload fonts from default directory\n")
+    controls_text.append("Y: Switch to system fonts\n\n")
+    controls_text.append("--- Image Controls ---\n", style="bold yellow")
+    controls_text.append("I: Set image directory (IMG_DIR)\n")
+    controls_text.append("N: Next image (manual)\n")
+    controls_text.append("P: Previous image (manual)\n")
+    controls_text.append("X: Clear background image\n\n")
+    controls_text.append("--- Debug Controls ---\n", style="bold yellow")
+    controls_text.append("M: Toggle mask view (black/white masks on gray background)\n")
+    controls_text.append("D: Toggle region debug view (shows rule-based zones)\n")
+    controls_text.append("G: Toggle region constraint (force text only in zones)\n")
+    controls_text.append("E: Edit region templates\n")
+    controls_text.append("T: Switch between region templates\n\n")
+    controls_text.append("--- General ---\n", style="bold yellow")
+    controls_text.append("S: Save current layout and mask\n")
+    controls_text.append("O: Batch save multiple layouts (parallel processing)\n")
+    controls_text.append("ESC: Quit\n\n")
+    controls_text.append(f"Font source: {'Custom fonts' if custom_font_paths else 'System fonts'}\n")
+    if current_background_image:
+        if current_image_directory:
+            current_name = os.path.basename(current_image_directory[current_image_index])
+            controls_text.append(f"Image: {current_name} ({current_image_index + 1}/{len(current_image_directory)})\n")
+        else:
+            controls_text.append("Image: Single image loaded\n")
+    else:
+        controls_text.append("Background: Solid color\n")
+    if IMG_DIR:
+        controls_text.append(f"IMG_DIR: {IMG_DIR}\n")
     else:
-        controls_text.append("Image: Single image loaded\n")
-else:
-    controls_text.append("Background: Solid color\n")
-if IMG_DIR:
-    controls_text.append(f"IMG_DIR: {IMG_DIR}\n")
-else:
-    controls_text.append("IMG_DIR: Not set (edit script to add image directory)\n")
-controls_text.append(f"Active Templates: {', '.join(ACTIVE_TEMPLATE_NAMES)}\n")
-controls_text.append("Canvas: Using actual image dimensions for text placement")
-logger.info(Panel(controls_text, expand=False, border_style="cyan"))
+        controls_text.append("IMG_DIR: Not set (edit script to add image directory)\n")
+    controls_text.append(f"Active Templates: {', '.join(ACTIVE_TEMPLATE_NAMES)}\n")
+    controls_text.append("Canvas: Using actual image dimensions for text placement")
+    logger.info(Panel(controls_text, expand=False, border_style="cyan"))
+
+startup_tasks = start_startup_tasks()
 
 # Ensure first click that focuses the window is also delivered as a normal click (requires SDL ≥2.0.22)
 os.environ.setdefault("SDL_MOUSE_FOCUS_CLICKTHROUGH", "1")
 
 while True:
     time_delta = clock.tick(config.display.fps) / 1000.0
+    if not startup_complete:
+        finish_startup()
+    poll_font_warmup()
+    poll_word_reload()
+    poll_file_changes()
     
     for e in pygame.event.get():
         if e.type == pygame.QUIT: 
@@ -1691,6 +1839,9 @@ while True:
                 handle_zoom(mouse_pos, zoom_direction)
             
             if e.type == pygame.KEYDOWN:
+                # Shortcuts act on the loaded fonts, words and images; wait for startup to finish first
+                if not startup_complete:
+                    finish_startup(block=True)
                 if e.key == pygame.K_SPACE:
                     logger.debug("SPACE key pressed - generating new layout with auto-advance")
                     logger.debug(f"Before layout - current_image_index: {current_image_index}, directory length: {len(current_image_directory) if current_image_directory else 0}")
@@ -1705,7 +1856,8 @@ while True:
                     else:
                         logger.debug("Current image status: Background: Solid color")
                 elif e.key == pygame.K_s:
-                    save_output(placed_sprites_cache, SCRIPT_DIR, current_background_image, current_image_index, current_image_directory, original_pil_image, get_canvas_dimensions, get_canvas_offsets, pil_to_pygame_surface, MASK_GROW_PIXELS, grow_binary_mask_pil, create_final_mask_surface, get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION, screen, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT)
+                    with profiler.phase('save'):
+                        save_output(placed_sprites_cache, SCRIPT_DIR, current_background_image, current_image_index, current_image_directory, original_pil_image, get_canvas_dimensions, get_canvas_offsets, pil_to_pygame_surface, MASK_GROW_PIXELS, grow_binary_mask_pil, create_final_mask_surface, get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION, screen, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT, export_config=config.export)
                 elif e.key == pygame.K_o:
                     batch_save()
                 elif e.key == pygame.K_f:
@@ -1716,7 +1868,7 @@ while True:
                     else:
                         font_list = get_system_fonts()
                         title = f"System Fonts ({len(font_list)} total)"
-                    show_modern_font_catalog(ui_manager, (W, H), font_list, title)
+                    show_modern_font_catalog(ui_manager, (W, H), font_list, title, os.path.join(SCRIPT_DIR, config.paths.cache_dir, "font_thumbnails"))
                 elif e.key == pygame.K_h:
                     # Use modern controls help
                     show_modern_controls(ui_manager, (W, H))
@@ -1740,7 +1892,6 @@ while True:
                         )
                 elif e.key == pygame.K_r and pygame.key.get_pressed()[pygame.K_LSHIFT]:
                     reload_configuration()
-                    logger.success("Configuration reloaded!")
                     layout()
                 elif e.key == pygame.K_r:
                     logger.info("💡 [cyan]INFO:[/] Resetting to default font directory.")
@@ -1766,7 +1917,7 @@ while True:
                     layout()
                 elif e.key == pygame.K_e:
                     # Open region editor
-                    editor = RegionEditor(screen, region_manager, pygame.font.Font(None, 24), ACTIVE_TEMPLATE_NAMES[0])
+                    editor = RegionEditor(screen, region_manager, get_cached_font(None, 24), ACTIVE_TEMPLATE_NAMES[0])
                     editor.run()
                     # After editor exits, reload the template and redraw
                     # ACTIVE_TEMPLATE_NAMES = editor.get_active_template_name() # Get the latest template name
@@ -1780,7 +1931,6 @@ while True:
 
                 elif e.key == pygame.K_w:
                     reload_words()
-                    layout()
                 elif e.key == pygame.K_i:
                     logger.info("\n=== SET IMAGE DIRECTORY ===")
                     logger.info("Enter path to folder containing images (jpg, jpeg, png, bmp, tiff, tif, webp)")
@@ -1838,3 +1988,8 @@ while True:
     ui_manager.draw(screen)
     
     pygame.display.flip()
+    if not first_frame_reported:
+        first_frame_reported = True
+        first_frame_time = time.perf_counter() - startup_started_at
+        profiler.add('startup_first_frame', first_frame_time)
+        logger.info(f"⏱️  First frame after {first_frame_time * 1000:.0f} ms")
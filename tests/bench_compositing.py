@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the before/debug compositing step.
+
+Compares the fixed-point kernels in utils/compositing.py against the two
+implementations they replace:
+  - the float64 NumPy blend previously used by utils/save_utils.save_output
+  - the pygame copy + blit sequence previously used by gui_mask_generator.save_output
+
+Usage: python tests/bench_compositing.py [megapixels ...]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+
+from utils.compositing import composite_over, tint_with_mask, DEBUG_MASK_ALPHA
+
+pygame.init()
+
+REPEATS = 5
+
+
+def make_inputs(megapixels, seed=0):
+    """Random background, a sparse text-like overlay and its mask."""
+    rng = np.random.default_rng(seed)
+    width = int((megapixels * 1_000_000 * 4 / 3) ** 0.5)
+    height = int(width * 3 / 4)
+    base = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    overlay = np.zeros((height, width, 4), dtype=np.uint8)
+    mask = np.zeros((height, width), dtype=np.uint8)
+    # ~10% of the rows carry "text"
+    for y in rng.integers(0, height - 40, size=max(1, height // 400)):
+        overlay[y:y + 40, :, :3] = rng.integers(0, 256, 3, dtype=np.uint8)
+        overlay[y:y + 40, :, 3] = rng.integers(0, 256, (40, width), dtype=np.uint8)
+        mask[y:y + 40] = np.where(overlay[y:y + 40, :, 3] > 0, 255, 0)
+    return base, overlay, mask
+
+
+def legacy_float(base, overlay, mask):
+    alpha = overlay[:, :, 3:] / 255.0
+    before = (base * (1 - alpha) + overlay[:, :, :3] * alpha).astype(np.uint8)
+    debug = before.copy()
+    mask_area = mask > 0
+    debug[mask_area] = debug[mask_area] * (1.0 - 0.7)
+    return before, debug.astype(np.uint8)
+
+
+def legacy_pygame(base_surf, overlay_surf, mask_surf):
+    before = base_surf.copy()
+    before.blit(overlay_surf, (0, 0))
+    debug = before.copy()
+    debug_mask_overlay = mask_surf.copy()
+    debug_mask_overlay.set_alpha(DEBUG_MASK_ALPHA)
+    debug.blit(debug_mask_overlay, (0, 0))
+    return before, debug
+
+
+def fixed_point(base, overlay, mask):
+    image = base.copy()  # the real pipeline owns this buffer already; copied here to keep runs identical
+    composite_over(image, overlay)
+    tint_with_mask(image, mask)
+    return image
+
+
+def best_of(func, *args):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    sizes = [float(arg) for arg in sys.argv[1:]] or [1, 4, 12]
+    print(f"{'MP':>6} {'float64 (ms)':>14} {'pygame (ms)':>13} {'fixed-point (ms)':>18} {'vs float':>10} {'vs pygame':>10}")
+    for megapixels in sizes:
+        base, overlay, mask = make_inputs(megapixels)
+        height, width = mask.shape
+        base_surf = pygame.image.frombytes(base.tobytes(), (width, height), 'RGB')
+        overlay_surf = pygame.image.frombytes(overlay.tobytes(), (width, height), 'RGBA')
+        mask_surf = pygame.image.frombytes(np.repeat(mask[:, :, None], 3, axis=2).tobytes(), (width, height), 'RGB')
+
+        t_float = best_of(legacy_float, base, overlay, mask)
+        t_pygame = best_of(legacy_pygame, base_surf, overlay_surf, mask_surf)
+        t_fixed = best_of(fixed_point, base, overlay, mask)
+        print(f"{megapixels:>6.1f} {t_float * 1000:>14.1f} {t_pygame * 1000:>13.1f} {t_fixed * 1000:>18.1f} {t_float / t_fixed:>9.1f}x {t_pygame / t_fixed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Per-backend throughput benchmark for the export engine.
+
+Exports the golden test layout at several output sizes with every available
+backend (and with the tiled renderer) and reports the time per export and the
+throughput in megapixels per second.
+
+Usage: python tests/bench_export.py [megapixels ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pygame
+from PIL import Image
+
+from utils.font_utils import get_cached_font
+from utils.save_utils import export_layout, get_available_backends, get_export_backend
+from test_export_engine import make_golden_layout, PREVIEW_SIZE, PREVIEW_OFFSETS
+
+pygame.init()
+
+REPEATS = 3
+
+
+def make_background(megapixels, seed=0):
+    aspect = PREVIEW_SIZE[0] / PREVIEW_SIZE[1]
+    height = int((megapixels * 1_000_000 / aspect) ** 0.5)
+    width = int(height * aspect)
+    rng = np.random.default_rng(seed)
+    return Image.fromarray(rng.integers(0, 256, (height, width, 3), dtype=np.uint8), 'RGB')
+
+
+def time_export(background, sprites, backend_name, out_dir, tiled):
+    paths = [os.path.join(out_dir, f"{name}.png") for name in ("before", "after", "debug")]
+    backend = get_export_backend(backend_name)
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        export_layout(background, sprites, PREVIEW_SIZE, PREVIEW_OFFSETS, *paths, get_cached_font, True, 45, 3, backend,
+                      tiled_min_megapixels=0 if tiled else None, tile_height=1024)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    sizes = [float(arg) for arg in sys.argv[1:]] or [2, 8]
+    sprites = make_golden_layout()
+    configurations = [(name, False) for name in get_available_backends()] + [(name, True) for name in get_available_backends()]
+
+    print(f"{'MP':>6} {'backend':>10} {'mode':>6} {'time (s)':>10} {'MP/s':>8}")
+    with tempfile.TemporaryDirectory() as out_dir:
+        for megapixels in sizes:
+            background = make_background(megapixels)
+            actual_mp = background.size[0] * background.size[1] / 1_000_000
+            for backend_name, tiled in configurations:
+                elapsed = time_export(background, sprites, backend_name, out_dir, tiled)
+                mode = "tiled" if tiled else "full"
+                print(f"{actual_mp:>6.1f} {backend_name:>10} {mode:>6} {elapsed:>10.3f} {actual_mp / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
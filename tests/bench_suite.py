@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Headless benchmark suite for the layout and export hot paths.
+
+Times sprite creation (straight and arc words), freeform and region layout(),
+render_high_quality_layout, grow_binary_mask_pil and a full save_output at
+several output sizes. Every run uses fixed seeds, synthetic backgrounds and the
+font bundled with pygame, so results from different commits are comparable.
+
+Results are written as JSON; pass a previous result file to --compare to print
+the change per benchmark (and exit with status 1 past --threshold).
+
+Usage:
+    python tests/bench_suite.py [--output results.json] [--compare baseline.json]
+                                [--threshold 0.1] [--repeats 5] [--megapixels 1 4 12]
+                                [--only NAME ...]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# config.yaml is loaded relative to the working directory, like when running the GUI
+LAUNCH_DIR = os.getcwd()
+os.chdir(REPO_ROOT)
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pygame
+from PIL import Image
+
+from utils.font_utils import get_cached_font
+from utils.image_utils import grow_binary_mask_pil
+from utils.save_utils import render_high_quality_layout, save_output
+from utils.sprite_utils import create_arc_sprites, create_normal_sprites
+from utils.word_index import WordIndex
+from test_export_engine import make_golden_layout, PREVIEW_SIZE, PREVIEW_OFFSETS
+
+pygame.init()
+
+SEED = 1234
+BUNDLED_FONT = os.path.join(os.path.dirname(pygame.__file__), "freesansbold.ttf")
+WORDS = ["LAYOUT", "MASK", "REGION", "BENCHMARK", "ARC", "GLYPH", "PYGAME", "EXPORT"]
+DEFAULT_MEGAPIXELS = [1, 4, 12]
+MASK_GROW_PIXELS = 3
+# The GUI script runs its main loop at import; only the part before it is executed
+GUI_SCRIPT = os.path.join(REPO_ROOT, "gui_mask_generator.py")
+GUI_MAIN_LOOP = "\nwhile True:"
+# Benchmark names per suite (export ones get a _<megapixels>mp suffix), for --only
+SPRITE_BENCHMARKS = ('create_normal_sprites', 'create_arc_sprites')
+LAYOUT_BENCHMARKS = ('layout_freeform', 'layout_regions')
+EXPORT_BENCHMARKS = ('render_high_quality_layout', 'grow_binary_mask_pil', 'save_output')
+
+
+def make_background(megapixels, seed=SEED):
+    """Random RGB noise with the preview's aspect ratio, about `megapixels` in size."""
+    aspect = PREVIEW_SIZE[0] / PREVIEW_SIZE[1]
+    height = int((megapixels * 1_000_000 / aspect) ** 0.5)
+    width = int(height * aspect)
+    rng = np.random.default_rng(seed)
+    return Image.fromarray(rng.integers(0, 256, (height, width, 3), dtype=np.uint8), 'RGB')
+
+
+def measure(func, repeats, setup=None):
+    """Calls `func` `repeats` times (after `setup`, untimed) and returns timing statistics in seconds."""
+    times = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {'best': min(times), 'median': statistics.median(times), 'mean': statistics.fmean(times), 'repeats': repeats}
+
+
+def load_gui_namespace(megapixels=1):
+    """
+    Executes the GUI script up to its main loop with dummy SDL drivers and returns its
+    globals, set up for reproducible headless layouts on a synthetic background.
+    """
+    with open(GUI_SCRIPT, encoding="utf-8") as f:
+        source = f.read()
+    namespace = {'__name__': 'bench_suite_gui', '__file__': GUI_SCRIPT}
+    with contextlib.redirect_stdout(io.StringIO()):
+        exec(compile(source[:source.index(GUI_MAIN_LOOP)], GUI_SCRIPT, 'exec'), namespace)
+        # No font warm-up or file watcher thread competing with the timed layouts
+        namespace['config'].fonts.prewarm = False
+        namespace['config'].performance.hot_reload = False
+        # Wait for the background startup tasks (fonts, words, images) instead of the main loop
+        namespace['finish_startup'](block=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "background.png")
+            make_background(megapixels).save(path)
+            namespace['load_background_image'](path)
+    namespace['custom_font_paths'] = [BUNDLED_FONT]
+    namespace['WORDS'] = WORDS
+    namespace['WORD_INDEX'] = WordIndex(WORDS)
+    # Batch mode skips console reports and screen redraws
+    namespace['BATCH_PROCESSING_MODE'] = True
+    return namespace
+
+
+def bench_sprites(repeats):
+    padding_kernel = pygame.mask.Mask((5, 5), fill=True)
+    font = get_cached_font(BUNDLED_FONT, 48)
+
+    def normal():
+        for word in WORDS:
+            create_normal_sprites(word, font, (255, 255, 255), BUNDLED_FONT, 48, 2, padding_kernel, True, 45)
+
+    def arc():
+        for word in WORDS:
+            create_arc_sprites(word, font, (255, 255, 255), BUNDLED_FONT, 48, 100, 300, True, 45, padding_kernel)
+
+    seed = lambda: random.seed(SEED)
+    return {
+        'create_normal_sprites': dict(measure(normal, repeats, seed), words=len(WORDS)),
+        'create_arc_sprites': dict(measure(arc, repeats, seed), words=len(WORDS)),
+    }
+
+
+def bench_layout(repeats):
+    try:
+        gui = load_gui_namespace()
+    except Exception as e:  # pygame_gui and a display backend are needed to build the GUI state
+        print(f"Warning: Skipping layout benchmarks, the GUI script could not be loaded: {e}")
+        return {}
+
+    def run(regions_only):
+        def setup():
+            random.seed(SEED)
+            gui['FORCE_REGIONS_ONLY'] = regions_only
+        return measure(lambda: gui['layout'](skip_redraw=True), repeats, setup)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return {'layout_freeform': run(False), 'layout_regions': run(True)}
+
+
+def bench_export(repeats, megapixel_targets):
+    results = {}
+    sprites = make_golden_layout()
+    for megapixels in megapixel_targets:
+        background = make_background(megapixels)
+        actual_mp = round(background.size[0] * background.size[1] / 1_000_000, 2)
+
+        def render():
+            return render_high_quality_layout(background, sprites, PREVIEW_SIZE, PREVIEW_OFFSETS, get_cached_font, True, 45)
+        results[f'render_high_quality_layout_{megapixels}mp'] = dict(measure(render, repeats), megapixels=actual_mp)
+
+        mask_surface = render()[1]
+        results[f'grow_binary_mask_pil_{megapixels}mp'] = dict(
+            measure(lambda: grow_binary_mask_pil(mask_surface, MASK_GROW_PIXELS), repeats), megapixels=actual_mp
+        )
+
+        with tempfile.TemporaryDirectory() as out_dir:
+            def save():
+                save_output(
+                    sprites, out_dir, None, -1, [], background,
+                    lambda: PREVIEW_SIZE, lambda size: PREVIEW_OFFSETS, None, MASK_GROW_PIXELS, grow_binary_mask_pil, None,
+                    get_cached_font, True, 45, None, PREVIEW_SIZE[0], PREVIEW_SIZE[1],
+                )
+            results[f'save_output_{megapixels}mp'] = dict(measure(save, repeats), megapixels=actual_mp)
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(repeats, megapixel_targets, only=None):
+    def selected(name):
+        return not only or any(pattern in name for pattern in only)
+
+    # Only the suites (and export sizes) with a selected benchmark are run
+    export_names = {megapixels: [f'{name}_{megapixels}mp' for name in EXPORT_BENCHMARKS] for megapixels in megapixel_targets}
+    export_targets = [megapixels for megapixels, names in export_names.items() if any(map(selected, names))]
+    suites = [
+        (SPRITE_BENCHMARKS, lambda: bench_sprites(repeats)),
+        (LAYOUT_BENCHMARKS, lambda: bench_layout(repeats)),
+        ([name for megapixels in export_targets for name in export_names[megapixels]], lambda: bench_export(repeats, export_targets)),
+    ]
+    results = {}
+    for names, suite in suites:
+        if any(selected(name) for name in names):
+            results.update(suite())
+    results = {name: result for name, result in results.items() if selected(name)}
+    return {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'pygame': pygame.version.ver,
+            'numpy': np.__version__,
+            'seed': SEED,
+            'repeats': repeats,
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Prints the change in best time per benchmark and returns the names that regressed past `threshold`."""
+    regressions = []
+    print(f"{'benchmark':<40} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for name, result in current['results'].items():
+        previous = baseline.get('results', {}).get(name)
+        if previous is None:
+            print(f"{name:<40} {'-':>12} {result['best'] * 1000:>12.2f} {'new':>8}")
+            continue
+        change = result['best'] / previous['best'] - 1 if previous['best'] > 0 else 0.0
+        flag = " !" if change > threshold else ""
+        print(f"{name:<40} {previous['best'] * 1000:>12.2f} {result['best'] * 1000:>12.2f} {change:>+8.1%}{flag}")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the layout and export hot paths.")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown ratio reported as a regression (default 0.1)")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--megapixels", type=float, nargs="+", default=DEFAULT_MEGAPIXELS)
+    parser.add_argument("--only", nargs="+", help="only run benchmarks whose name contains one of these")
+    args = parser.parse_args()
+
+    results = run_suite(args.repeats, [int(mp) if mp == int(mp) else mp for mp in args.megapixels], args.only)
+
+    if args.output:
+        with open(os.path.join(LAUNCH_DIR, args.output), "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(os.path.join(LAUNCH_DIR, args.compare), encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Tests for the fixed-point compositing kernels.
+"""
+
+import numpy as np
+
+from utils.compositing import composite_over, tint_with_mask, DEBUG_MASK_ALPHA
+
+
+def test_composite_over_matches_rounded_float_blend():
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 256, (300, 41, 3), dtype=np.uint8)
+    overlay = rng.integers(0, 256, (300, 41, 4), dtype=np.uint8)
+    alpha = overlay[:, :, 3:] / 255.0
+    expected = np.rint(base * (1 - alpha) + overlay[:, :, :3] * alpha).astype(np.uint8)
+
+    result = composite_over(base, overlay, chunk_rows=64)
+
+    assert result is base
+    assert np.array_equal(base, expected)
+
+
+def test_composite_over_leaves_transparent_rows_untouched():
+    base = np.full((10, 10, 3), 77, dtype=np.uint8)
+    overlay = np.zeros((10, 10, 4), dtype=np.uint8)
+    overlay[5, 5] = (255, 0, 0, 255)
+
+    composite_over(base, overlay, chunk_rows=3)
+
+    assert tuple(base[5, 5]) == (255, 0, 0)
+    assert (base[:3] == 77).all()
+
+
+def test_tint_with_mask_blends_towards_mask():
+    rng = np.random.default_rng(1)
+    image = rng.integers(0, 256, (50, 20, 3), dtype=np.uint8)
+    mask = (rng.integers(0, 2, (50, 20)) * 255).astype(np.uint8)
+    a = DEBUG_MASK_ALPHA / 255.0
+    expected = np.rint(image * (1 - a) + mask[:, :, None] * a).astype(np.uint8)
+
+    tint_with_mask(image, mask)
+
+    assert np.array_equal(image, expected)
@@ -0,0 +1,55 @@
+import copy
+import json
+
+from utils.config_manager import ConfigManager, diff_configs
+from utils.region_manager import RegionManager
+
+
+def test_diff_configs_names_the_changed_settings():
+    manager = ConfigManager("missing-config.yaml")
+    old = manager.get_config()
+    new = copy.deepcopy(old)
+    assert diff_configs(old, new) == set()
+
+    new.mask.padding_size += 1
+    new.text.normal.padding += 1
+    new.zoom.speed *= 2
+    assert diff_configs(old, new) == {"mask.padding_size", "text.normal", "zoom.speed"}
+
+
+def test_reload_keeps_the_current_config_when_the_file_is_broken(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(":\n  - [")
+    manager = ConfigManager(str(path))
+    current = manager.get_config()
+    assert manager.reload_config(keep_current_on_error=True) is False
+    assert manager.get_config() is current
+
+
+def write_templates(path, templates):
+    path.write_text(json.dumps(templates))
+
+
+def test_reload_templates_applies_only_real_changes(tmp_path):
+    path = tmp_path / "region_templates.json"
+    region = {"shape": [[0, 0], [1, 0], [1, 1]], "rules": {"placement_mode": "fit"}}
+    write_templates(path, {"Default": [region]})
+    manager = RegionManager(str(path))
+    assert manager.reload_templates() is False
+
+    write_templates(path, {"Default": [region], "Top": [region]})
+    assert manager.reload_templates() is True
+    assert manager.get_template_names() == ["Default", "Top"]
+
+
+def test_reload_templates_keeps_templates_of_a_broken_file(tmp_path):
+    path = tmp_path / "region_templates.json"
+    write_templates(path, {"Default": [{"shape": [[0, 0], [1, 0], [1, 1]], "rules": {}}]})
+    manager = RegionManager(str(path))
+    templates = manager.templates
+
+    path.write_text('{"Default": [')
+    assert manager.reload_templates() is False
+    assert manager.templates is templates
+    # The half-written file is left alone for the editor to finish
+    assert path.read_text() == '{"Default": ['
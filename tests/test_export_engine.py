@@ -0,0 +1,94 @@
+"""
+Golden-image tests for the export engine.
+
+Every available backend must produce the same pixels as the committed golden
+images. Regenerate them after an intentional rendering change with:
+
+    UPDATE_GOLDEN=1 python -m pytest tests/test_export_engine.py
+"""
+
+import os
+import random
+
+import numpy as np
+import pygame
+import pytest
+from PIL import Image
+
+from utils.font_utils import get_cached_font
+from utils.save_utils import export_layout, get_available_backends, get_export_backend
+from utils.sprite_utils import create_arc_sprites, create_normal_sprites
+
+pygame.init()
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+PREVIEW_SIZE = (120, 90)
+PREVIEW_OFFSETS = (0, 0)
+OUTPUT_SIZE = (360, 270)
+MASK_GROW_PIXELS = 2
+OUTPUTS = {"before": "RGB", "after": "L", "debug": "RGB"}
+
+
+def make_golden_layout():
+    """A fixed layout with a straight word and a rotated arc word."""
+    random.seed(1234)
+    padding_kernel = pygame.mask.Mask((5, 5), fill=True)
+    sprites = []
+
+    font = get_cached_font(None, 24)
+    normal, _ = create_normal_sprites("GOLD", font, (240, 200, 40), None, 24, 2, padding_kernel, True, 45)
+    for sprite in normal:
+        sprite.rect.move_ip(10, 8)
+    sprites.extend(normal)
+
+    font = get_cached_font(None, 18)
+    arc, _ = create_arc_sprites("ARC", font, (40, 120, 250), None, 18, 30, 40, True, 45, padding_kernel)
+    for sprite in arc:
+        sprite.rect.move_ip(55, 40)
+    sprites.extend(arc)
+    return sprites
+
+
+def make_golden_background():
+    y, x = np.mgrid[0:OUTPUT_SIZE[1], 0:OUTPUT_SIZE[0]]
+    pixels = np.stack([x * 255 // OUTPUT_SIZE[0], y * 255 // OUTPUT_SIZE[1], (x + y) % 256], axis=2)
+    return Image.fromarray(pixels.astype(np.uint8), 'RGB')
+
+
+def run_export(tmp_path, backend_name, tiled_min_megapixels=None):
+    paths = {name: str(tmp_path / f"{backend_name}_{name}.png") for name in OUTPUTS}
+    export_layout(
+        make_golden_background(), make_golden_layout(), PREVIEW_SIZE, PREVIEW_OFFSETS,
+        paths["before"], paths["after"], paths["debug"],
+        get_cached_font, True, 45, MASK_GROW_PIXELS, get_export_backend(backend_name),
+        tiled_min_megapixels=tiled_min_megapixels, tile_height=50,
+    )
+    return {name: np.array(Image.open(path).convert(OUTPUTS[name])) for name, path in paths.items()}
+
+
+@pytest.fixture(scope="module")
+def golden_images():
+    if os.environ.get("UPDATE_GOLDEN"):
+        os.makedirs(GOLDEN_DIR, exist_ok=True)
+        import pathlib, tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, pixels in run_export(pathlib.Path(tmp), "numpy").items():
+                Image.fromarray(pixels).save(os.path.join(GOLDEN_DIR, f"export_{name}.png"))
+    return {name: np.array(Image.open(os.path.join(GOLDEN_DIR, f"export_{name}.png")).convert(mode)) for name, mode in OUTPUTS.items()}
+
+
+@pytest.mark.parametrize("backend_name", get_available_backends())
+def test_backend_matches_golden_images(tmp_path, golden_images, backend_name):
+    outputs = run_export(tmp_path, backend_name)
+    for name, pixels in outputs.items():
+        assert np.array_equal(pixels, golden_images[name]), f"{backend_name} backend differs from golden '{name}' image"
+
+
+def test_tiled_export_matches_golden_images(tmp_path, golden_images):
+    outputs = run_export(tmp_path, "numpy", tiled_min_megapixels=0)
+    for name, pixels in outputs.items():
+        assert np.array_equal(pixels, golden_images[name]), f"tiled export differs from golden '{name}' image"
+
+
+def test_unknown_backend_falls_back_to_numpy():
+    assert get_export_backend("does-not-exist").name == "numpy"
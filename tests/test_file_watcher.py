@@ -0,0 +1,56 @@
+import os
+
+from utils.file_watcher import FileWatcher
+
+
+def touch(path, text):
+    path.write_text(text)
+    # Make every write visible to the (mtime, size) stamp, even on coarse clocks
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_change_is_reported_once_it_has_settled(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("a: 1")
+    watcher = FileWatcher([str(path)])
+    pending = {}
+    assert watcher.check(pending) == []
+
+    touch(path, "a: 2")
+    assert watcher.check(pending) == []  # Still possibly being written
+    assert watcher.check(pending) == [str(path)]
+    assert watcher.check(pending) == []
+
+
+def test_writes_in_several_steps_yield_one_change(tmp_path):
+    path = tmp_path / "words.json"
+    path.write_text("{}")
+    watcher = FileWatcher([str(path)])
+    pending = {}
+    touch(path, '{"a"')
+    assert watcher.check(pending) == []
+    touch(path, '{"a": ["B"]}')
+    assert watcher.check(pending) == []
+    assert watcher.check(pending) == [str(path)]
+
+
+def test_created_and_deleted_files_count_as_changes(tmp_path):
+    path = tmp_path / "corpus.txt"
+    watcher = FileWatcher([str(path)])
+    pending = {}
+    path.write_text("word\n")
+    assert watcher.check(pending) == []
+    assert watcher.check(pending) == [str(path)]
+    path.unlink()
+    watcher.check(pending)
+    assert watcher.check(pending) == [str(path)]
+
+
+def test_poll_reports_each_path_once(tmp_path):
+    path = tmp_path / "config.yaml"
+    watcher = FileWatcher([str(path)])
+    watcher._changes.put(str(path))
+    watcher._changes.put(str(path))
+    assert watcher.poll() == [str(path)]
+    assert watcher.poll() == []
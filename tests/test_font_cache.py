@@ -0,0 +1,52 @@
+import os
+import threading
+import time
+
+import pygame
+
+from utils import font_utils
+
+BUNDLED_FONT = os.path.join(os.path.dirname(pygame.__file__), "freesansbold.ttf")
+
+
+def setup_function():
+    pygame.font.init()
+    font_utils.clear_font_cache()
+    font_utils.reset_font_cache_stats()
+
+
+def test_hits_and_misses_are_counted():
+    first = font_utils.get_cached_font(BUNDLED_FONT, 20)
+    assert font_utils.get_cached_font(BUNDLED_FONT, 20) is first
+    font_utils.get_cached_font(BUNDLED_FONT, 21)
+
+    assert font_utils.font_cache_stats['misses'] == 2
+    assert font_utils.font_cache_stats['hits'] == 1
+    assert font_utils.font_cache_stats['lock_waits'] == 0
+
+
+def test_cache_hits_do_not_wait_for_the_lock():
+    font = font_utils.get_cached_font(BUNDLED_FONT, 20)
+    result = []
+    with font_utils.font_cache_lock:
+        reader = threading.Thread(target=lambda: result.append(font_utils.get_cached_font(BUNDLED_FONT, 20)))
+        reader.start()
+        reader.join(2)
+        # The lookup finished while another thread held the lock
+        assert not reader.is_alive()
+    assert result == [font]
+    assert font_utils.font_cache_stats['lock_waits'] == 0
+
+
+def test_misses_behind_a_held_lock_are_counted_as_waits():
+    result = []
+    loader = threading.Thread(target=lambda: result.append(font_utils.get_cached_font(BUNDLED_FONT, 22)))
+    with font_utils.font_cache_lock:
+        loader.start()
+        time.sleep(0.05)
+        assert not result
+    loader.join(2)
+
+    assert result and (BUNDLED_FONT, 22) in font_utils.font_cache
+    assert font_utils.font_cache_stats['lock_waits'] == 1
+    assert font_utils.font_cache_stats['lock_wait_seconds'] >= 0.04
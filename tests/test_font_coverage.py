@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from utils import font_utils
+from utils.font_utils import _choose_covering_font, coverage_stats, reset_coverage_stats, set_font_coverage
+
+
+@pytest.fixture(autouse=True)
+def coverage_table():
+    set_font_coverage({'latin': frozenset("ABC"), 'symbols': frozenset("★"), 'partial': frozenset("AB")})
+    reset_coverage_stats()
+    yield
+    set_font_coverage({})
+    reset_coverage_stats()
+
+
+def test_only_covering_fonts_are_chosen():
+    random.seed(3)
+    picks = {_choose_covering_font(['latin', 'symbols', 'partial'], "CAB") for _ in range(200)}
+    assert picks == {'latin'}
+    assert coverage_stats['picks'] == 200 and coverage_stats['misses_avoided'] > 0
+
+
+def test_choice_stays_uniform_over_covering_fonts():
+    random.seed(5)
+    counts = {'latin': 0, 'partial': 0}
+    for _ in range(3000):
+        counts[_choose_covering_font(['latin', 'symbols', 'partial'], "BA")] += 1
+    assert abs(counts['latin'] - counts['partial']) < 300
+
+
+def test_unindexed_fonts_and_uncovered_words():
+    random.seed(7)
+    # Fonts without coverage data (e.g. system fonts) are assumed to cover everything
+    assert _choose_covering_font(['arial'], "Ω") == 'arial'
+    # Without a covering font the word is reported rather than rendered as missing glyphs
+    assert _choose_covering_font(['latin', 'partial'], "Ω") is None
+    assert coverage_stats['uncovered_words'] == 1
+
+
+def test_get_font_without_word_ignores_coverage(monkeypatch):
+    monkeypatch.setattr(font_utils, 'get_cached_font', lambda identifier, size: identifier)
+    monkeypatch.setattr(font_utils.os.path, 'isfile', lambda path: True)
+    random.seed(1)
+    assert {font_utils.get_font(12, ['latin', 'symbols'])[1] for _ in range(50)} == {'latin', 'symbols'}
+    assert {font_utils.get_font(12, ['latin', 'symbols'], "AB")[1] for _ in range(50)} == {'latin'}
+    assert coverage_stats['picks'] == 50
+    assert font_utils.get_font(12, ['latin', 'symbols'], "Ω") == (None, None, None)
+    assert coverage_stats['uncovered_words'] == 1
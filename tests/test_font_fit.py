@@ -0,0 +1,24 @@
+import pygame
+import pytest
+
+from utils.font_utils import max_fitting_font_size
+from utils.sprite_utils import create_normal_sprites
+
+PADDING_KERNEL = pygame.mask.Mask((5, 5), fill=True)
+
+
+@pytest.mark.parametrize("word", ["layout", "Mask generator", "W"])
+@pytest.mark.parametrize("max_width", [60, 150, 400])
+def test_fitting_size_estimate_is_close(word, max_width):
+    pygame.font.init()
+    size = max_fitting_font_size(pygame.font.Font(None, 40), word, 40, max_width, letter_spacing=2)
+    assert size > 0
+
+    _, bbox = create_normal_sprites(word, pygame.font.Font(None, size), (255, 255, 255), None, size, 2, PADDING_KERNEL, False, 0)
+    # An estimate from one size's metrics; hinting may add a few pixels at small sizes
+    assert bbox.width <= max_width * 1.1
+
+
+def test_no_size_fits_when_spacing_alone_is_too_wide():
+    pygame.font.init()
+    assert max_fitting_font_size(pygame.font.Font(None, 40), "spacing", 40, 30, letter_spacing=10) == 0
@@ -0,0 +1,87 @@
+import os
+import threading
+
+import pygame
+
+from utils.font_index import FontIndex
+
+BUNDLED_FONT = os.path.join(os.path.dirname(pygame.__file__), "freesansbold.ttf")
+
+
+def _fonts(tmp_path):
+    good = tmp_path / "good.ttf"
+    good.write_bytes(open(BUNDLED_FONT, "rb").read())
+    broken = tmp_path / "broken.ttf"
+    broken.write_bytes(b"not a font")
+    return str(good), str(broken)
+
+
+def test_index_validates_fonts_and_records_metrics(tmp_path):
+    good, broken = _fonts(tmp_path)
+    index = FontIndex(str(tmp_path / "cache" / "font_index.json"))
+
+    assert index.update([good, broken], "ABC")
+    assert (index.validated, index.failed, index.reused) == (1, 1, 0)
+    entry = index.get(good)
+    assert entry['family'] and entry['ascent'] > 0 > entry['descent'] and entry['avg_advance'] > 0
+    assert entry['chars'] == "ABC"
+    assert index.valid_fonts() == [good] and list(index.broken_fonts()) == [broken]
+
+
+def test_index_is_reused_until_fonts_change(tmp_path):
+    good, broken = _fonts(tmp_path)
+    path = str(tmp_path / "font_index.json")
+    index = FontIndex(path)
+    index.update([good, broken], "ABC")
+    index.save()
+
+    reloaded = FontIndex(path)
+    assert not reloaded.update([good, broken], "AB")
+    assert (reloaded.validated, reloaded.failed, reloaded.reused) == (0, 0, 2)
+
+    # New characters in the word set or a modified file trigger another check
+    assert reloaded.update([good, broken], "ABCD")
+    assert reloaded.validated == 1 and reloaded.get(good)['chars'] == "ABCD"
+    os.utime(good, (1, 1))
+    reloaded.update([good, broken], "ABCD")
+    assert reloaded.validated == 1
+
+    # Removed fonts are dropped
+    assert reloaded.update([good], "ABCD") and reloaded.get(broken) is None
+
+
+def test_coverage_filters_fonts(tmp_path):
+    good, _ = _fonts(tmp_path)
+    index = FontIndex(str(tmp_path / "font_index.json"))
+    index.update([good], "AB一")
+
+    assert index.get(good)['chars'] == "AB"
+    assert index.fonts_covering("BA A") == [good]
+    assert index.fonts_covering("A一") == []
+    assert index.coverage_table() == {good: frozenset("AB")}
+
+
+def test_concurrent_updates_and_saves_do_not_interfere(tmp_path):
+    good, broken = _fonts(tmp_path)
+    path = tmp_path / "cache" / "font_index.json"
+    index = FontIndex(str(path))
+    errors = []
+
+    def worker(paths):
+        try:
+            for _ in range(20):
+                index.update(paths, "AB")
+                index.save()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(paths,)) for paths in ([good], [good, broken], [broken])]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+
+    assert not errors
+    # Every save went through a temporary file of its own, and none is left behind
+    assert os.listdir(path.parent) == ["font_index.json"]
+    assert FontIndex(str(path)).fonts == index.fonts
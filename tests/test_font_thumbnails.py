@@ -0,0 +1,75 @@
+import os
+import threading
+import time
+
+import pygame
+
+from utils.font_thumbnails import FontThumbnails, render_font_sample, thumbnail_key
+from utils.font_utils import freetype_lock
+
+BUNDLED_FONT = os.path.join(os.path.dirname(pygame.__file__), "freesansbold.ttf")
+SAMPLE = "The quick brown fox"
+
+
+def wait_for(thumbnails, count, timeout=10):
+    finished = []
+    deadline = time.monotonic() + timeout
+    while len(finished) < count and time.monotonic() < deadline:
+        finished += thumbnails.poll()
+        time.sleep(0.01)
+    return finished
+
+
+def test_sample_is_scaled_to_the_requested_size():
+    surface = render_font_sample(BUNDLED_FONT, SAMPLE * 5, 200, 40)
+    assert surface.get_size() == (200, 40)
+
+
+def test_key_changes_with_text_size_and_mtime(tmp_path):
+    font = tmp_path / "font.ttf"
+    font.write_bytes(open(BUNDLED_FONT, "rb").read())
+    key = thumbnail_key(str(font), SAMPLE, 200, 40)
+    assert key == thumbnail_key(str(font), SAMPLE, 200, 40)
+    assert key != thumbnail_key(str(font), SAMPLE + "!", 200, 40)
+    assert key != thumbnail_key(str(font), SAMPLE, 300, 40)
+    os.utime(font, (0, 12345))
+    assert key != thumbnail_key(str(font), SAMPLE, 200, 40)
+
+
+def test_samples_are_rendered_once_then_read_from_disk(tmp_path):
+    first = FontThumbnails(str(tmp_path))
+    assert first.request([BUNDLED_FONT, "missing-font.ttf"], SAMPLE, 200, 40) == {}
+    finished = wait_for(first, 2)
+    assert sorted(font for font, _ in finished) == sorted([BUNDLED_FONT, "missing-font.ttf"])
+    assert first.rendered == 2 and len(os.listdir(tmp_path)) == 2
+
+    # Already in memory: returned right away, nothing queued
+    assert set(first.request([BUNDLED_FONT], SAMPLE, 200, 40)) == {BUNDLED_FONT}
+
+    second = FontThumbnails(str(tmp_path))
+    second.request([BUNDLED_FONT], SAMPLE, 200, 40)
+    assert wait_for(second, 1)[0][1].get_size() == (200, 40)
+    assert second.disk_hits == 1 and second.rendered == 0
+
+
+def test_new_request_replaces_the_queue(tmp_path):
+    thumbnails = FontThumbnails(str(tmp_path))
+    thumbnails.request([BUNDLED_FONT], SAMPLE, 100, 40)
+    thumbnails.request([BUNDLED_FONT], SAMPLE, 300, 40)
+    finished = wait_for(thumbnails, 1)
+    time.sleep(0.2)
+    finished += thumbnails.poll()
+    # The first request may already have been picked up, but the last one always arrives
+    assert (300, 40) in [surface.get_size() for _, surface in finished]
+    assert len(finished) <= 2
+
+
+def test_samples_wait_for_the_shared_freetype_lock():
+    done = threading.Event()
+    with freetype_lock:
+        worker = threading.Thread(target=lambda: render_font_sample(BUNDLED_FONT, SAMPLE, 200, 60) and done.set())
+        worker.start()
+        # The font index worker holds the lock: no face is opened meanwhile
+        assert not done.wait(0.2)
+    worker.join(10)
+    assert done.is_set()
@@ -0,0 +1,62 @@
+import os
+
+import pygame
+
+from utils import font_utils, font_warmup
+from utils.font_warmup import FontWarmup, estimate_font_bytes, warmup_size_stages
+
+BUNDLED_FONT = os.path.join(os.path.dirname(pygame.__file__), "freesansbold.ttf")
+
+
+def test_size_stages_add_export_sizes_after_layout_sizes():
+    layout_sizes, high_res_sizes = warmup_size_stages(10, 12, [2.0, 2.5])
+    assert layout_sizes == [10, 11, 12]
+    assert high_res_sizes == [20, 22, 24, 25, 27, 30]
+
+
+def test_warmup_loads_fonts_within_budget():
+    pygame.font.init()
+    font_utils.clear_font_cache()
+    per_font = estimate_font_bytes(BUNDLED_FONT, 20)
+    warmup = FontWarmup([BUNDLED_FONT], [[20, 21, 22], [40]], memory_budget_bytes=per_font * 2.5, seed=1)
+    warmup.start().wait(10)
+
+    assert warmup.finished and warmup.done == warmup.total == 2
+    # The export-size stage and one layout size do not fit the budget
+    assert warmup.skipped == 2
+    assert sum((BUNDLED_FONT, size) in font_utils.font_cache for size in (20, 21, 22)) == 2
+    assert (BUNDLED_FONT, 40) not in font_utils.font_cache
+
+
+def test_already_cached_fonts_are_not_planned_again():
+    pygame.font.init()
+    font_utils.clear_font_cache()
+    font_utils.get_cached_font(BUNDLED_FONT, 30)
+    warmup = FontWarmup([BUNDLED_FONT], [[30, 31]], memory_budget_bytes=10**9)
+    assert [(size, cost > 0) for _, size, cost in warmup.plan()] == [(31, True)]
+
+
+def _counting_file_lookups(monkeypatch):
+    lookups = []
+    monkeypatch.setattr(font_warmup, "font_file_bytes", lambda font: lookups.append(font) or 1000)
+    return lookups
+
+
+def test_each_font_file_is_looked_up_once(monkeypatch):
+    font_utils.clear_font_cache()
+    lookups = _counting_file_lookups(monkeypatch)
+    warmup = FontWarmup(["a.ttf", "b.ttf", "c.ttf"], [list(range(10, 20)), [40]], memory_budget_bytes=10**9)
+    assert len(warmup.plan()) == 33
+    assert sorted(lookups) == ["a.ttf", "b.ttf", "c.ttf"]
+
+
+def test_planning_stops_once_the_budget_is_spent(monkeypatch):
+    font_utils.clear_font_cache()
+    lookups = _counting_file_lookups(monkeypatch)
+    fonts = [f"font{i}.ttf" for i in range(200)]
+    cost = estimate_font_bytes(fonts[0], 10, file_bytes=1000)
+    warmup = FontWarmup(fonts, [[10], [20, 30]], memory_budget_bytes=cost * 3 + 100)
+    assert len(warmup.plan()) == 3
+    # Nothing fits in the 100 bytes left, so the remaining fonts are never looked up
+    assert len(lookups) == 3
+    assert warmup.skipped == 3 * len(fonts) - 3
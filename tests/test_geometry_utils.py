@@ -0,0 +1,38 @@
+import random
+
+import numpy as np
+import pytest
+
+from utils.geometry_utils import point_in_polygon, points_in_polygon, points_in_polygons
+
+POLYGONS = [
+    [(0.1, 0.1), (0.5, 0.1), (0.5, 0.5), (0.9, 0.5), (0.9, 0.9), (0.1, 0.9)],  # concave L
+    [(0.5, 0.3), (0.7, 0.4), (0.7, 0.6), (0.5, 0.7), (0.3, 0.6), (0.3, 0.4)],  # hexagon
+    [(0.0, 0.0), (0.4, 0.0), (0.0, 0.4)],  # triangle with axis-aligned edges
+    [(0, 0), (1, 1), (1, 0), (0, 1)],  # self-intersecting bow-tie
+]
+
+
+@pytest.mark.parametrize("poly", POLYGONS)
+def test_matches_scalar_ray_casting(poly):
+    rng = random.Random(3)
+    # Random points plus points exactly on vertices and edges
+    points = [(rng.uniform(-0.1, 1.1), rng.uniform(-0.1, 1.1)) for _ in range(2000)]
+    points += [tuple(p) for p in poly] + [(0.3, 0.1), (0.1, 0.5), (0.5, 0.5)]
+    xs, ys = np.array(points).T
+
+    expected = [point_in_polygon(x, y, poly) for x, y in points]
+    assert points_in_polygon(xs, ys, poly).tolist() == expected
+
+
+def test_many_polygons_at_once():
+    xs = np.array([0.2, 0.5, 0.05, 2.0])
+    ys = np.array([0.8, 0.5, 0.05, 2.0])
+    result = points_in_polygons(xs, ys, POLYGONS[:3])
+    assert result.shape == (3, 4)
+    assert result[:, 3].tolist() == [False, False, False]
+    assert result[0, 0] and result[1, 1] and result[2, 2]
+
+
+def test_degenerate_polygon_contains_nothing():
+    assert not points_in_polygon([0.0, 1.0], [0.0, 1.0], [(0, 0), (1, 1)]).any()
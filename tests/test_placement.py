@@ -0,0 +1,124 @@
+import random
+
+import numpy as np
+import pygame
+
+from utils.collision_utils import check_padded_collision, is_within_canvas
+from utils.placement import PlacementEvaluator
+
+PADDING_KERNEL = pygame.mask.Mask((5, 5), fill=True)
+
+
+class _Letter(pygame.sprite.Sprite):
+    def __init__(self, x, y, width, height):
+        super().__init__()
+        self.mask = pygame.mask.Mask((width, height), fill=True)
+        self.padded_mask = self.mask.convolve(PADDING_KERNEL)
+        self.rect = pygame.Rect(x, y, width, height)
+
+
+def _word():
+    """Two letters side by side, positioned relative to the word's top-left, and the word bbox."""
+    return [_Letter(0, 0, 8, 12), _Letter(10, 2, 6, 10)], pygame.Rect(0, 0, 16, 12)
+
+
+def test_bounds_filter_matches_is_within_canvas():
+    evaluator = PlacementEvaluator(200, 150, 30, 20, 10)
+    rng = random.Random(5)
+    word_bbox = pygame.Rect(0, 0, 17, 9)
+    xs = np.array([rng.randint(0, 260) for _ in range(500)])
+    ys = np.array([rng.randint(0, 200) for _ in range(500)])
+
+    kept = set(zip(*(a.tolist() for a in evaluator.filter_in_bounds(xs, ys, word_bbox))))
+    for x, y in zip(xs.tolist(), ys.tolist()):
+        rect = word_bbox.copy()
+        rect.center = (x, y)
+        assert ((x, y) in kept) == is_within_canvas(rect, 200, 150, 10, 30, 20)
+
+
+def test_first_free_candidate_is_committed():
+    evaluator = PlacementEvaluator(200, 150, 30, 20, 10)
+    first, bbox = _word()
+    assert evaluator.place(first, bbox, [100], [80]) == (100, 80)
+    assert first[0].rect.topleft == (92, 74)
+
+    second, bbox = _word()
+    # Overlapping, out of bounds, then free
+    assert evaluator.place(second, bbox, [102, 5, 160], [81, 5, 80]) == (160, 80)
+    assert evaluator.candidates_tested == 3 and evaluator.overlap_tests == 3
+
+
+def test_occupancy_catches_every_padded_sprite_collision():
+    evaluator = PlacementEvaluator(200, 150, 0, 0, 0)
+    placed, bbox = _word()
+    evaluator.place(placed, bbox, [100], [75])
+    group = pygame.sprite.Group(placed)
+
+    for x in range(70, 130):
+        for y in range(55, 95, 3):
+            word, word_bbox = _word()
+            rect = word_bbox.copy()
+            rect.center = (x, y)
+            collides = False
+            for sprite in word:
+                sprite.rect = sprite.rect.move(rect.topleft)
+                collides |= bool(pygame.sprite.spritecollide(sprite, group, False, check_padded_collision))
+                sprite.rect = sprite.rect.move(-rect.left, -rect.top)
+            if collides:
+                assert evaluator.find_free_position(word, word_bbox, [x], [y]) is None
+
+
+def test_attempt_budget_shrinks_as_words_fail():
+    evaluator = PlacementEvaluator(200, 150, 0, 0, 0, stop_after_failures=3)
+    assert evaluator.attempt_budget(100) == 100
+
+    for _ in range(3):
+        assert not evaluator.should_stop()
+        budget = evaluator.attempt_budget(100)
+        evaluator.record_word(False, budget, budget, 100)
+    assert evaluator.saturated
+    assert evaluator.attempt_budget(100) < 50
+    assert evaluator.should_stop()
+
+    stats = evaluator.stats()
+    assert stats['words_failed'] == 3 and stats['early_stops'] == 1
+    assert stats['wasted_attempts'] == stats['attempts_used']
+    assert stats['attempts_saved'] == 300 - stats['attempts_used']
+
+    # A new group (region) starts with the full budget again
+    evaluator.begin_group()
+    assert evaluator.attempt_budget(100) == 100 and not evaluator.should_stop()
+
+
+def test_non_adaptive_evaluator_keeps_full_budget():
+    evaluator = PlacementEvaluator(200, 150, 0, 0, 0, adaptive=False, stop_after_failures=1)
+    for _ in range(5):
+        evaluator.record_word(False, 40, 40, 40)
+    assert evaluator.attempt_budget(40) == 40
+    assert not evaluator.saturated and not evaluator.should_stop()
+
+
+def test_full_canvas_stops_layout():
+    evaluator = PlacementEvaluator(20, 20, 0, 0, 0)
+    evaluator.occupancy.fill()
+    word, bbox = _word()
+    evaluator.commit(word, (10, 10), bbox)
+    assert evaluator.free_area_ratio == 0.0
+    assert evaluator.attempt_budget(100) == 10
+    assert evaluator.should_stop()
+
+
+def test_occupancy_grows_to_hold_wide_padding():
+    evaluator = PlacementEvaluator(100, 100, 0, 0, 0)
+    wide_kernel = pygame.mask.Mask((81, 81), fill=True)
+    placed, bbox = _word()
+    for letter in placed:
+        letter.padded_mask = letter.mask.convolve(wide_kernel)
+    evaluator.commit(placed, (90, 90), bbox)
+    assert evaluator.occupancy.get_size() == (178, 176)
+
+    # Entirely past the canvas, but inside the placed word's padding
+    probe = pygame.mask.Mask((4, 4), fill=True)
+    assert evaluator.occupancy.overlap(probe, (160, 150)) is not None
+    footprint, _ = PlacementEvaluator.word_footprint(placed)
+    assert evaluator.occupancy.count() == footprint.count()
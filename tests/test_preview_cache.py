@@ -0,0 +1,159 @@
+import copy
+
+import pygame
+
+from utils.config_manager import ConfigManager, diff_configs
+from utils.preview_cache import PreviewCache, RegionLayerCache, ZoomPyramid, region_image_points
+
+
+def _surface(width=200, height=120):
+    surface = pygame.Surface((width, height))
+    surface.fill((200, 40, 40))
+    return surface
+
+
+def test_zoom_one_returns_base_surface():
+    base = _surface()
+    pyramid = ZoomPyramid(base)
+    assert pyramid.get_scaled(1.0) is base
+
+
+def test_scaled_sizes_are_cached_and_bounded():
+    pyramid = ZoomPyramid(_surface(), max_cached_sizes=2)
+
+    first = pyramid.get_scaled(0.3)
+    assert first.get_size() == (60, 36)
+    assert pyramid.get_scaled(0.3) is first
+    assert (pyramid.hits, pyramid.misses) == (1, 1)
+
+    pyramid.get_scaled(2.0)
+    pyramid.get_scaled(1.5)
+    # 0.3 was evicted as the least recently used size
+    assert pyramid.get_scaled(0.3) is not first
+    assert pyramid.misses == 4
+
+
+def test_pyramid_levels_stop_at_min_size():
+    pyramid = ZoomPyramid(_surface(64, 64))
+    pyramid.get_scaled(0.01)
+    assert [level.get_width() for level in pyramid.levels] == [64, 32, 16]
+
+
+def test_preview_cache_builds_once_until_invalidated():
+    cache = PreviewCache()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return _surface()
+
+    cache.get_scaled('preview', build, 0.5)
+    cache.get_scaled('preview', build, 2.0)
+    assert len(builds) == 1
+
+    cache.invalidate('preview')
+    cache.get_scaled('preview', build, 0.5)
+    assert len(builds) == 2
+
+
+
+def test_changed_settings_drop_only_the_layers_built_from_them():
+    cache = PreviewCache()
+    builds = []
+
+    def build(name):
+        builds.append(name)
+        return _surface()
+
+    for name in ('preview', 'mask'):
+        cache.get_scaled(name, lambda: build(name), 1.0)
+    old = ConfigManager("missing-config.yaml").get_config()
+    new = copy.deepcopy(old)
+    new.mask.grow_pixels += 2
+    new.zoom.speed *= 2
+
+    assert cache.invalidate_settings(diff_configs(old, new)) == ['mask']
+    for name in ('preview', 'mask'):
+        cache.get_scaled(name, lambda: build(name), 1.0)
+    assert builds == ['preview', 'mask', 'mask']
+
+
+def _checkerboard(width, height):
+    surface = pygame.Surface((width, height))
+    for y in range(height):
+        for x in range(width):
+            surface.set_at((x, y), ((x * 37) % 256, (y * 53) % 256, ((x + y) * 11) % 256))
+    return surface
+
+
+def test_clipped_view_matches_full_zoom_inside_viewport():
+    base = _checkerboard(40, 30)
+    pyramid = ZoomPyramid(base)
+    zoom, origin = 4.0, (-37, -22)
+    viewport = pygame.Rect(0, 0, 50, 40)
+
+    clipped, position = pyramid.get_clipped(zoom, origin, viewport)
+    # Only the visible window is scaled, not the full 160x120 image
+    assert clipped.get_width() <= viewport.width + 2 * zoom
+    assert clipped.get_height() <= viewport.height + 2 * zoom
+
+    full = pygame.transform.scale(base, (160, 120))
+    expected = pygame.Surface(viewport.size)
+    expected.blit(full, origin)
+    actual = pygame.Surface(viewport.size)
+    actual.blit(clipped, position)
+    assert pygame.image.tobytes(actual, 'RGB') == pygame.image.tobytes(expected, 'RGB')
+
+
+def test_clipped_view_reused_for_subpixel_pans():
+    pyramid = ZoomPyramid(_checkerboard(40, 30))
+    viewport = pygame.Rect(0, 0, 50, 40)
+    first, _ = pyramid.get_clipped(4.0, (-40, -20), viewport)
+    second, position = pyramid.get_clipped(4.0, (-41, -20), viewport)
+    assert second is first and position == (-41 + 40, -20 + 20)
+    assert pyramid.get_clipped(4.0, (500, 500), viewport)[0] is None
+
+
+def _regions():
+    return [
+        {'name': 'left', 'shape': [[0.0, 0.0], [0.5, 0.0], [0.5, 1.0]], 'rules': {'placement_mode': 'stretch'}},
+        {'name': 'square', 'shape': [[0.1, 0.1], [0.9, 0.1], [0.9, 0.9], [0.1, 0.9]], 'rules': {'placement_mode': 'fit'}},
+    ]
+
+
+def test_region_points_follow_placement_mode():
+    regions = _regions()
+    assert region_image_points(regions[0], (200, 100)) == [(0, 0), (100, 0), (100, 100)]
+    # 'fit' uses the centered 100x100 design canvas
+    assert region_image_points(regions[1], (200, 100))[0] == (60, 10)
+
+
+def test_region_layer_rebuilt_only_on_change():
+    pygame.font.init()
+    cache = RegionLayerCache()
+    regions = _regions()
+    viewport = pygame.Rect(0, 0, 400, 300)
+
+    layer, position = cache.get_layer(regions, (200, 100), 1.0, (100, 100), viewport)
+    # Panning moves the layer without rebuilding it
+    same, moved = cache.get_layer(regions, (200, 100), 1.0, (110, 90), viewport)
+    assert same is layer and moved == (position[0] + 10, position[1] - 10)
+    assert cache.builds == 1
+
+    cache.get_layer(regions, (200, 100), 2.0, (100, 100), viewport)
+    assert cache.builds == 2
+
+    regions[0]['shape'][1] = [0.6, 0.0]
+    cache.get_layer(regions, (200, 100), 2.0, (100, 100), viewport)
+    assert cache.builds == 3
+
+
+def test_large_region_layer_is_clipped_to_viewport():
+    pygame.font.init()
+    cache = RegionLayerCache()
+    viewport = pygame.Rect(0, 0, 100, 80)
+
+    layer, position = cache.get_layer(_regions(), (200, 100), 5.0, (-50, -50), viewport)
+    assert layer.get_size() == viewport.size and position == (0, 0)
+    cache.get_layer(_regions(), (200, 100), 5.0, (-60, -50), viewport)
+    assert cache.builds == 2
@@ -0,0 +1,54 @@
+from utils.profiler import PhaseProfiler
+
+
+def test_phases_count_calls_and_time():
+    profiler = PhaseProfiler()
+    for _ in range(3):
+        with profiler.phase('sampling'):
+            pass
+    profiler.add('layout', 0.5)
+
+    sampling = profiler.get('sampling')
+    assert sampling['count'] == 3 and sampling['total'] >= 0
+    assert list(profiler.summary()) == ['sampling', 'layout']
+    assert profiler.get('missing') is None
+
+
+def test_phase_is_recorded_when_block_raises():
+    profiler = PhaseProfiler()
+    try:
+        with profiler.phase('encode'):
+            raise ValueError
+    except ValueError:
+        pass
+    assert profiler.get('encode')['count'] == 1
+
+
+def test_rolling_window_percentiles():
+    profiler = PhaseProfiler(window=10)
+    for ms in range(1, 21):
+        profiler.add('layout', ms / 1000)
+
+    stats = profiler.get('layout')
+    # Totals cover every call, averages and percentiles only the last 10
+    assert stats['count'] == 20 and abs(stats['total'] - 0.21) < 1e-9
+    assert abs(stats['mean'] - 0.0155) < 1e-9
+    assert stats['p50'] in (0.015, 0.016) and stats['p95'] == 0.02 and stats['max'] == 0.02
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = PhaseProfiler(enabled=False)
+    with profiler.phase('layout'):
+        pass
+    profiler.add('save', 1.0)
+    assert profiler.summary() == {}
+
+
+def test_reset_and_restore_keep_earlier_phases():
+    profiler = PhaseProfiler()
+    profiler.add('layout', 0.2)
+    earlier = profiler.reset()
+    profiler.add('encode', 0.1)
+    assert list(profiler.summary()) == ['encode']
+    profiler.restore(earlier)
+    assert list(profiler.summary()) == ['layout'] and profiler.get('layout')['total'] == 0.2
@@ -0,0 +1,138 @@
+import random
+
+import numpy as np
+import pytest
+
+from utils.geometry_utils import points_in_polygon, polygon_signed_area, triangulate_polygon
+from utils.region_compiler import CompiledRegion, RegionRuleRaster, compile_regions, get_region_rule_raster, rules_allow
+
+# Concave "L" shape in relative coordinates
+L_SHAPE = [[0.1, 0.1], [0.5, 0.1], [0.5, 0.5], [0.9, 0.5], [0.9, 0.9], [0.1, 0.9]]
+
+
+@pytest.mark.parametrize("poly", [L_SHAPE, L_SHAPE[::-1], [[0, 0], [1, 0], [1, 1], [0.5, 1], [0, 1]]])
+def test_triangulation_covers_polygon_area(poly):
+    triangles = triangulate_polygon(poly)
+    total = sum(abs(polygon_signed_area(t)) for t in triangles)
+    assert total == pytest.approx(abs(polygon_signed_area(poly)))
+
+
+def test_triangulation_of_degenerate_and_self_intersecting_polygons():
+    assert triangulate_polygon([[0, 0], [1, 1]]) == []
+    assert triangulate_polygon([[0, 0], [1, 1], [2, 2]]) == []
+    # A symmetric bow-tie has zero signed area; an asymmetric one is not simple
+    assert triangulate_polygon([[0, 0], [2, 2], [2, 0], [0, 2]]) == []
+    assert triangulate_polygon([[0, 0], [3, 3], [3, 0], [0, 1]]) is None
+
+
+def test_fit_and_stretch_resolve_to_canvas_pixels():
+    stretch = CompiledRegion({'name': 's', 'shape': L_SHAPE, 'rules': {}}, 200, 100, 10, 20)
+    assert stretch.points[0] == pytest.approx((30, 30))
+    assert stretch.bbox.topleft == (30, 30)
+
+    fit = CompiledRegion({'name': 'f', 'shape': L_SHAPE, 'rules': {'placement_mode': 'fit'}}, 200, 100, 10, 20)
+    # 100x100 design canvas centered horizontally
+    assert fit.points[0] == pytest.approx((70, 30))
+    assert fit.area == pytest.approx(0.48 * 100 * 100)
+
+
+def test_samples_are_inside_and_uniform():
+    region = CompiledRegion({'name': 'l', 'shape': L_SHAPE, 'rules': {}}, 1000, 1000, 0, 0)
+    rng = random.Random(7)
+    samples = [region.sample_point(rng) for _ in range(4000)]
+    # Points are truncated to pixels and the vertices are whole pixels, so pixel centers stay inside
+    assert all(region.contains(x + 0.5, y + 0.5) for x, y in samples)
+
+    # The L covers three of the four quadrants of its bounding box, each a third of its area
+    quadrants = {(False, False): 0, (True, False): 0, (False, True): 0, (True, True): 0}
+    for x, y in samples:
+        quadrants[(x >= 500, y >= 500)] += 1
+    assert quadrants[(True, False)] == 0
+    for quadrant in ((False, False), (False, True), (True, True)):
+        assert quadrants[quadrant] / len(samples) == pytest.approx(1 / 3, abs=0.03)
+
+
+def test_bow_tie_regions():
+    rng = random.Random(3)
+    # Zero signed area: treated as an empty region, like a degenerate one
+    symmetric = CompiledRegion({'name': 'b', 'shape': [[0.1, 0.1], [0.9, 0.9], [0.9, 0.1], [0.1, 0.9]]}, 1000, 1000, 0, 0)
+    assert symmetric.area == 0 and symmetric.sample_point(rng) is None
+
+    # Not simple: sampled by rejection against the polygon itself
+    asymmetric = CompiledRegion({'name': 'b', 'shape': [[0.1, 0.1], [0.9, 0.9], [0.9, 0.3], [0.1, 0.5]]}, 1000, 1000, 0, 0)
+    assert asymmetric.triangles is None
+    samples = [asymmetric.sample_point(rng) for _ in range(200)]
+    assert any(samples)
+    assert all(asymmetric.contains(x, y) for x, y in filter(None, samples))
+
+
+def test_compile_regions_keeps_order():
+    regions = [{'name': 'a', 'shape': L_SHAPE}, {'name': 'b', 'shape': []}]
+    compiled = compile_regions(regions, 100, 100, 0, 0)
+    assert [c.name for c in compiled] == ['a', 'b']
+    assert compiled[1].area == 0 and compiled[1].sample_point() is None
+
+
+def _rule_regions():
+    return [
+        {'name': 'no-arcs', 'shape': L_SHAPE, 'rules': {'text_types': ['normal']}},
+        {'name': 'small', 'shape': [[0.3, 0.2], [0.8, 0.3], [0.6, 0.8]], 'rules': {'font_size_range': [10, 20]}},
+        {'name': 'open', 'shape': [[0.0, 0.0], [0.2, 0.0], [0.0, 0.2]], 'rules': {}},
+    ]
+
+
+@pytest.mark.parametrize("cell_size", [1, 4, 7])
+@pytest.mark.parametrize("text_type,size", [("arc", 15), ("normal", 30), ("arc", 30), ("normal", 15)])
+def test_rule_raster_matches_exact_region_checks(cell_size, text_type, size):
+    compiled = compile_regions(_rule_regions(), 203, 151, 11, 5)
+    raster = RegionRuleRaster(compiled, 203, 151, 11, 5, cell_size)
+
+    ys, xs = np.mgrid[5:5 + 151, 11:11 + 203]
+    xs, ys = xs.ravel(), ys.ravel()
+    expected = np.ones(xs.shape, dtype=bool)
+    for region in compiled:
+        if not rules_allow(region.rules, text_type, size, (5, 80)):
+            expected &= ~points_in_polygon(xs, ys, region.points)
+
+    assert np.array_equal(raster.allows(xs, ys, text_type, size, (5, 80)), expected)
+
+
+def test_rule_raster_resolves_slivers_only_down_to_cell_size():
+    # A 1px-high strip at y 10.2-11.2: no integer row (and so no cell corner) lies inside it
+    sliver = [{'name': 'sliver', 'shape': [[0.01, 0.051], [0.99, 0.051], [0.99, 0.056], [0.01, 0.056]], 'rules': {'text_types': ['normal']}}]
+    compiled = compile_regions(sliver, 200, 200, 0, 0)
+    xs, ys = np.arange(3, 198), np.full(195, 10.7)
+    inside = points_in_polygon(xs, ys, compiled[0].points)
+    assert inside.all()
+
+    coarse = RegionRuleRaster(compiled, 200, 200, 0, 0, 8).allows(xs, ys, "arc", 30, (5, 80))
+    # Only the cells holding the strip's vertices fall back to exact checks
+    assert np.array_equal(~coarse, (xs < 8) | (xs >= 192))
+    # Corners one pixel apart land inside the strip, so a fine raster sees all of it
+    assert not RegionRuleRaster(compiled, 200, 200, 0, 0, 1).allows(xs, ys, "arc", 30, (5, 80)).any()
+
+
+def test_rule_raster_samples_only_allowed_cells():
+    compiled = compile_regions(_rule_regions(), 200, 200, 0, 0)
+    raster = RegionRuleRaster(compiled, 200, 200, 0, 0, 4)
+    rng = np.random.default_rng(1)
+
+    allowed_cells = raster.allowed_cells("arc", 30, (5, 80))
+    xs, ys = raster.sample_points(rng, 500, 10, 150, 10, 150, allowed_cells)
+    assert len(xs) > 0
+    assert xs.min() >= 10 and xs.max() <= 150 and ys.min() >= 10 and ys.max() <= 150
+    # Arcs of size 30 are rejected by the L and by the small-size triangle; every sample is
+    # either allowed or in a cell crossed by one of their edges
+    rejected = ~raster.allows(xs, ys, "arc", 30, (5, 80))
+    assert raster.boundary[ys[rejected] // 4, xs[rejected] // 4].all()
+
+    # A range entirely inside a forbidding region cannot be sampled at all
+    assert raster.sample_points(rng, 10, 40, 80, 120, 160, allowed_cells) is None
+
+
+def test_rule_raster_is_cached_per_canvas_and_template():
+    compiled = compile_regions(_rule_regions(), 200, 200, 0, 0)
+    first = get_region_rule_raster(compiled, 200, 200, 0, 0)
+    assert get_region_rule_raster(compile_regions(_rule_regions(), 200, 200, 0, 0), 200, 200, 0, 0) is first
+    assert get_region_rule_raster(compiled, 300, 200, 0, 0) is not first
+    assert RegionRuleRaster([], 50, 50, 0, 0).allows([1, 2], [3, 4], "arc", 30, (5, 80)).all()
@@ -0,0 +1,23 @@
+import threading
+
+from utils.startup import StartupTasks
+
+
+def test_tasks_run_in_background_and_report_results():
+    release = threading.Event()
+    tasks = StartupTasks([
+        ('quick', lambda: 42),
+        ('slow', lambda: release.wait(5) and 'done'),
+        ('broken', lambda: 1 / 0),
+    ]).start()
+
+    finished = {}
+    while len(finished) < 2:
+        finished.update((name, result) for name, result, _ in tasks.poll(block=False))
+    assert finished['quick'] == 42 and isinstance(finished['broken'], ZeroDivisionError)
+    assert not tasks.done and tasks.poll() == []
+
+    release.set()
+    (name, result, seconds), = tasks.poll(block=True)
+    assert (name, result) == ('slow', 'done') and seconds >= 0
+    assert tasks.done
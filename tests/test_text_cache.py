@@ -0,0 +1,28 @@
+import pygame
+
+from utils.text_cache import UITextCache
+
+
+def test_surfaces_rendered_once_per_text_color_and_size():
+    pygame.font.init()
+    cache = UITextCache()
+
+    first = cache.render("Mode: Regions Only", (200, 200, 200), 20)
+    assert cache.render("Mode: Regions Only", (200, 200, 200), 20) is first
+    assert cache.render("Mode: Regions Only", (255, 255, 0), 20) is not first
+    assert cache.render("Mode: Regions Only", (200, 200, 200), 18) is not first
+    assert (cache.hits, cache.misses) == (1, 3)
+    # One font per size
+    assert cache.get_font(20) is cache.get_font(20)
+
+
+def test_least_recently_used_surfaces_are_dropped():
+    pygame.font.init()
+    cache = UITextCache(max_surfaces=2)
+
+    kept = cache.render("a", (255, 255, 255), 20)
+    cache.render("b", (255, 255, 255), 20)
+    cache.render("a", (255, 255, 255), 20)
+    cache.render("c", (255, 255, 255), 20)
+    assert cache.render("a", (255, 255, 255), 20) is kept
+    assert cache.misses == 3
@@ -0,0 +1,85 @@
+"""
+Tests for the band-wise high-resolution renderer.
+"""
+
+import numpy as np
+import pygame
+import pytest
+from PIL import Image
+
+from utils.font_utils import get_cached_font
+from utils.image_utils import grow_binary_mask_pil
+from utils.compositing import composite_over, tint_with_mask
+from utils.sprite_utils import create_normal_sprites
+from utils.tiled_render import StreamingPNGWriter, prepare_glyphs, save_tiled_outputs
+
+pygame.init()
+
+PREVIEW_SIZE = (160, 120)
+PREVIEW_OFFSETS = (20, 10)
+
+
+def _make_layout():
+    padding_kernel = pygame.mask.Mask((5, 5), fill=True)
+    font = get_cached_font(None, 30)
+    sprites, bbox = create_normal_sprites("TILE", font, (200, 80, 40), None, 30, 2, padding_kernel, True, 45)
+    for sprite in sprites:
+        sprite.rect.move_ip(PREVIEW_OFFSETS[0] + 30, PREVIEW_OFFSETS[1] + 45)
+    return sprites
+
+
+def _make_background(size):
+    rng = np.random.default_rng(0)
+    return Image.fromarray(rng.integers(0, 256, (size[1], size[0], 3), dtype=np.uint8), 'RGB')
+
+
+def _reference_outputs(original_image, sprites, grow):
+    """Full-frame render, mirroring the non-tiled save path."""
+    glyphs = prepare_glyphs(original_image.size, sprites, PREVIEW_SIZE, PREVIEW_OFFSETS, get_cached_font, True, 45)
+    overlay = pygame.Surface(original_image.size, pygame.SRCALPHA)
+    mask = pygame.Surface(original_image.size)
+    mask.fill((0, 0, 0))
+    for glyph in glyphs:
+        overlay.blit(glyph.overlay_surf, glyph.rect)
+        mask.blit(glyph.mask_surf, glyph.rect)
+    mask = grow_binary_mask_pil(mask, grow)
+
+    to_array = lambda surf, mode: np.array(Image.frombytes(mode, surf.get_size(), pygame.image.tobytes(surf, mode)))
+    mask = to_array(mask, 'RGB')[:, :, 0]
+    before = composite_over(np.array(original_image), to_array(overlay, 'RGBA'))
+    debug = tint_with_mask(before.copy(), mask)
+    return before, mask, debug
+
+
+@pytest.mark.parametrize("band_height", [7, 64, 10_000])
+def test_tiled_outputs_match_full_frame_render(tmp_path, band_height):
+    original = _make_background((480, 360))
+    sprites = _make_layout()
+    paths = [str(tmp_path / f"{name}.png") for name in ("before", "after", "debug")]
+
+    save_tiled_outputs(original, sprites, PREVIEW_SIZE, PREVIEW_OFFSETS, *paths, get_cached_font, True, 45, 3, band_height=band_height)
+
+    before, mask, debug = _reference_outputs(original, sprites, 3)
+    assert np.array_equal(np.array(Image.open(paths[0])), before)
+    assert np.array_equal(np.array(Image.open(paths[1])), mask)
+    assert np.array_equal(np.array(Image.open(paths[2])), debug)
+    assert mask.max() == 255
+
+
+def test_streaming_png_writer_round_trip(tmp_path):
+    rng = np.random.default_rng(1)
+    pixels = rng.integers(0, 256, (37, 23, 3), dtype=np.uint8)
+    path = str(tmp_path / "rows.png")
+
+    with StreamingPNGWriter(path, 23, 37, 'RGB') as writer:
+        for start in range(0, 37, 5):
+            writer.write_rows(pixels[start:start + 5])
+
+    assert np.array_equal(np.array(Image.open(path)), pixels)
+
+
+def test_streaming_png_writer_rejects_missing_rows(tmp_path):
+    writer = StreamingPNGWriter(str(tmp_path / "short.png"), 4, 4, 'L')
+    writer.write_rows(np.zeros((2, 4), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        writer.close()
@@ -0,0 +1,41 @@
+from utils.virtual_list import VirtualListLayout
+
+
+def test_pool_covers_the_viewport_at_any_offset():
+    layout = VirtualListLayout(10_000, 80, 5, 500)
+    assert layout.pool_size == 7
+    for offset in (0, 1, 40, 84, 85, 123_456, layout.max_offset):
+        rows = layout.visible(offset)
+        assert len(rows) <= layout.pool_size
+        assert rows[0][2] <= 0 and rows[-1][2] + 80 >= 500
+        # Slots are distinct, so every visible item has its own widget
+        assert len({slot for _, slot, _ in rows}) == len(rows)
+
+
+def test_scrolling_one_row_keeps_the_other_slots():
+    layout = VirtualListLayout(100, 80, 5, 500)
+    before = {index: slot for index, slot, _ in layout.visible(0)}
+    after = {index: slot for index, slot, _ in layout.visible(85)}
+    shared = set(before) & set(after)
+    assert len(shared) == len(after) - 1
+    assert all(before[index] == after[index] for index in shared)
+
+
+def test_offsets_are_clamped_and_short_lists_fit():
+    layout = VirtualListLayout(3, 80, 5, 500)
+    assert layout.pool_size == 3 and layout.max_offset == 0
+    assert layout.visible_fraction == 1.0
+    assert [index for index, _, _ in layout.visible(1000)] == [0, 1, 2]
+    assert VirtualListLayout(0, 80, 5, 500).visible(0) == []
+
+
+def test_slots_left_over_at_the_end_of_the_list_are_idle():
+    layout = VirtualListLayout(100, 80, 5, 500)
+    assert layout.idle_slots(0) == []
+    end = layout.visible(layout.max_offset)
+    assert end[-1][0] == 99 and len(end) < layout.pool_size
+    idle = layout.idle_slots(layout.max_offset)
+    assert len(idle) == layout.pool_size - len(end)
+    assert not set(idle) & {slot for _, slot, _ in end}
+    # Scrolling back up uses every slot again
+    assert layout.idle_slots(layout.max_offset - 40) == []
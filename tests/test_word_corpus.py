@@ -0,0 +1,98 @@
+import os
+import random
+
+from utils import word_corpus
+from utils.startup import StartupTasks
+from utils.word_corpus import WordCorpus, load_word_corpus
+
+LINES = ["art", "design", "", "ai", "typography", "café", "code\r", "x" * (word_corpus.MAX_WORD_LENGTH + 1)]
+
+
+def make_corpus(tmp_path, lines=LINES, trailing_newline=False):
+    path = tmp_path / "corpus.txt"
+    path.write_bytes(("\n".join(lines) + ("\n" if trailing_newline else "")).encode("utf-8"))
+    return path
+
+
+def test_words_are_indexed_by_length(tmp_path):
+    corpus = WordCorpus(str(make_corpus(tmp_path)), str(tmp_path / "cache"))
+    # Empty and overlong lines are left out
+    assert len(corpus) == 6
+    assert sorted(corpus.word_at(i) for i in range(len(corpus))) == sorted(["ART", "DESIGN", "AI", "TYPOGRAPHY", "CAFÉ", "CODE"])
+    assert [len(corpus.word_at(i)) for i in range(len(corpus))] == sorted(len(w) for w in ["art", "design", "ai", "typography", "café", "code"])
+    assert corpus.count_fitting(4) == 4
+    assert {"É", "A", "Y"} <= corpus.charset
+
+
+def test_sample_respects_the_length_budget(tmp_path):
+    corpus = WordCorpus(str(make_corpus(tmp_path, trailing_newline=True)), str(tmp_path / "cache"))
+    rng = random.Random(2)
+    assert {corpus.sample(rng, max_chars=3) for _ in range(100)} == {"AI", "ART"}
+    assert corpus.sample(rng, max_chars=1) == "AI"
+    assert len({corpus.sample(rng) for _ in range(500)}) == 6
+
+
+def test_index_is_reused_until_the_corpus_changes(tmp_path):
+    path = make_corpus(tmp_path)
+    assert WordCorpus(str(path), str(tmp_path / "cache")).rebuilt
+    assert not WordCorpus(str(path), str(tmp_path / "cache")).rebuilt
+
+    path.write_text("one\ntwo\nthree\n", encoding="utf-8")
+    corpus = WordCorpus(str(path), str(tmp_path / "cache"))
+    assert corpus.rebuilt and len(corpus) == 3
+
+
+def test_chunked_scan_matches_a_single_pass(tmp_path, monkeypatch):
+    rng = random.Random(5)
+    lines = ["".join(rng.choice("ABCDEFGÜ") for _ in range(rng.randint(1, 12))) for _ in range(2000)]
+    path = make_corpus(tmp_path, lines)
+    monkeypatch.setattr(word_corpus, "SCAN_CHUNK_BYTES", 97)
+    corpus = WordCorpus(str(path), str(tmp_path / "cache"))
+    assert sorted(corpus.word_at(i) for i in range(len(corpus))) == sorted(lines)
+
+
+def test_empty_corpus(tmp_path):
+    corpus = load_word_corpus(str(make_corpus(tmp_path, [])), str(tmp_path / "cache"))
+    assert len(corpus) == 0 and corpus.sample() is None
+
+
+def test_reloading_a_changed_corpus_keeps_the_previous_instance_usable(tmp_path):
+    path = make_corpus(tmp_path, ["art", "design", "code"])
+    cache = str(tmp_path / "cache")
+    old = load_word_corpus(str(path), cache)
+
+    replacement = tmp_path / "corpus.new"
+    replacement.write_text("one\ntwo\n", encoding="utf-8")
+    os.replace(replacement, path)
+    new = load_word_corpus(str(path), cache)
+    assert new is not old and new.rebuilt and len(new) == 2
+    # The old index was not overwritten under the old instance's mapping
+    assert {old.sample() for _ in range(100)} == {"ART", "DESIGN", "CODE"}
+    # Only the current version's index is kept on disk, and only it is remembered
+    assert sorted(os.listdir(cache)) == sorted(os.path.basename(p) for p in (new.meta_path, new.offsets_path))
+    assert load_word_corpus(str(path), cache) is new
+
+    # Rewriting the file in place (shorter) gives stale words, not a crash
+    path.write_text("x\n", encoding="utf-8")
+    assert all(isinstance(new.sample(), str) for _ in range(20))
+
+
+def test_corpus_reloaded_in_the_background_while_the_old_one_is_sampled(tmp_path):
+    path = make_corpus(tmp_path, [f"w{i}" for i in range(50000)])
+    cache = str(tmp_path / "cache")
+    old = load_word_corpus(str(path), cache)
+    # Saved the way most editors do: written next to it, then renamed over it
+    replacement = tmp_path / "corpus.new"
+    replacement.write_text("".join(f"new{i}\n" for i in range(60000)), encoding="utf-8")
+    os.replace(replacement, path)
+
+    # As the GUI does on a hot reload: the index is rebuilt on a worker thread
+    reload = StartupTasks([("words", lambda: load_word_corpus(str(path), cache))]).start()
+    samples = 0
+    while not reload.done:
+        assert old.sample().startswith("W")  # The rebuild does not disturb the old instance
+        samples += 1
+        reload.poll()
+    new = load_word_corpus(str(path), cache)
+    assert len(new) == 60000 and new.sample().startswith("NEW")
+    assert old.sample().startswith("W") and samples
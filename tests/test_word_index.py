@@ -0,0 +1,55 @@
+import json
+import random
+
+from utils.word_index import WordIndex, estimated_width
+from utils.words_loader import WordsLoader
+
+WORDS = ["AI", "ART", "CODE", "BRAND", "DESIGN", "CREATIVE", "TYPOGRAPHY"]
+
+
+def test_sample_respects_the_length_budget():
+    index = WordIndex(WORDS)
+    rng = random.Random(3)
+    assert index.count_fitting(4) == 3
+    assert {index.sample(rng, max_chars=4) for _ in range(200)} == {"AI", "ART", "CODE"}
+    assert {index.sample(rng) for _ in range(500)} == set(WORDS)
+
+
+def test_too_tight_budget_falls_back_to_the_shortest_words():
+    index = WordIndex(WORDS)
+    assert index.sample(random.Random(0), max_chars=1) == "AI"
+    assert WordIndex([]).sample() is None
+
+
+def test_max_chars_matches_the_width_estimate():
+    index = WordIndex(WORDS)
+    max_chars = index.max_chars(300, 40, 0.6)
+    assert estimated_width("X" * max_chars, 40, 0.6) <= 300 < estimated_width("X" * (max_chars + 1), 40, 0.6)
+
+
+def test_weights_steer_the_draw():
+    index = WordIndex(["ONE", "TWO", "SIX"], weights=[0.0, 1.0, 3.0])
+    rng = random.Random(1)
+    draws = [index.sample(rng) for _ in range(4000)]
+    assert "ONE" not in draws
+    assert 2.5 < draws.count("SIX") / draws.count("TWO") < 3.5
+
+
+def test_zero_weight_fitting_words_are_not_drawn():
+    index = WordIndex(["ONE", "TWO", "LONGER"], weights=[0.0, 0.0, 1.0])
+    rng = random.Random(2)
+    # Only zero-weight words fit three characters: nothing to draw, like an empty index
+    assert {index.sample(rng, max_chars=3) for _ in range(50)} == {None}
+    assert index.sample(rng, max_chars=6) == "LONGER"
+
+
+def test_loader_applies_category_weights(tmp_path):
+    path = tmp_path / "words.json"
+    path.write_text(json.dumps({"design": ["bold", "style"], "tech": {"cloud": ["data", "bold"]}}))
+    loader = WordsLoader(str(path))
+    assert loader.words == ["BOLD", "STYLE", "DATA"]
+    assert loader.word_categories == {"BOLD": "design", "STYLE": "design", "DATA": "tech.cloud"}
+
+    # The nested category inherits its parent's weight
+    index = loader.build_index({"design": 0.0, "tech": 2.0})
+    assert {index.sample(random.Random(seed)) for seed in range(50)} == {"DATA"}
@@ -0,0 +1,72 @@
+import numpy as np
+
+DEBUG_MASK_ALPHA = int(255 * 0.7)
+
+# Rows processed per step. Bounds the size of the uint16 temporaries so the
+# kernels never allocate full-size intermediate arrays.
+COMPOSITE_CHUNK_ROWS = 64
+
+
+def _blend_into(dst, src, alpha, inv_alpha, scratch):
+    """
+    dst = round((src * alpha + dst * (255 - alpha)) / 255), in place.
+
+    Every product fits in uint16 (255 * 255 + 128 < 65536), and the division by
+    255 is done with the exact shift form (t + (t >> 8)) >> 8.
+    """
+    np.multiply(src, alpha, out=scratch, dtype=np.uint16)
+    scratch += np.multiply(dst, inv_alpha, dtype=np.uint16)
+    scratch += 128
+    scratch += scratch >> 8
+    scratch >>= 8
+    dst[...] = scratch
+
+
+def composite_over(base, overlay_rgba, chunk_rows=COMPOSITE_CHUNK_ROWS):
+    """
+    Alpha-composite a straight-alpha RGBA overlay onto an RGB image, in place.
+
+    Args:
+        base: uint8 array of shape (h, w, 3), modified in place
+        overlay_rgba: uint8 array of shape (h, w, 4)
+        chunk_rows: number of rows processed per step
+
+    Returns:
+        `base`, for convenience
+    """
+    height = base.shape[0]
+    for y0 in range(0, height, chunk_rows):
+        y1 = min(height, y0 + chunk_rows)
+        alpha = overlay_rgba[y0:y1, :, 3:]
+        # Text covers a small part of the image; skip fully transparent chunks
+        if not alpha.any():
+            continue
+        scratch = np.empty((y1 - y0,) + base.shape[1:], dtype=np.uint16)
+        _blend_into(base[y0:y1], overlay_rgba[y0:y1, :, :3], alpha, 255 - alpha, scratch)
+    return base
+
+
+def tint_with_mask(image, mask, alpha=DEBUG_MASK_ALPHA, chunk_rows=COMPOSITE_CHUNK_ROWS):
+    """
+    Blend a black and white mask over an RGB image at a uniform opacity, in place.
+
+    This is the "debug" view: the whole image is pulled towards the mask, so the
+    masked areas turn bright and everything else is darkened.
+
+    Args:
+        image: uint8 array of shape (h, w, 3), modified in place
+        mask: uint8 array of shape (h, w)
+        alpha: opacity of the mask in 0..255
+        chunk_rows: number of rows processed per step
+
+    Returns:
+        `image`, for convenience
+    """
+    height = image.shape[0]
+    alpha = np.uint16(alpha)
+    inv_alpha = np.uint16(255) - alpha
+    for y0 in range(0, height, chunk_rows):
+        y1 = min(height, y0 + chunk_rows)
+        scratch = np.empty((y1 - y0,) + image.shape[1:], dtype=np.uint16)
+        _blend_into(image[y0:y1], mask[y0:y1, :, None], alpha, inv_alpha, scratch)
+    return image
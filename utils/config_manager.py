@@ -1,6 +1,6 @@
 import yaml
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields, is_dataclass
 from typing import List, Tuple, Dict, Any
 
 @dataclass
@@ -23,6 +23,8 @@ class FontConfig:
     show_info: bool
     rotate_letters_on_arc: bool
     max_arc_letter_rotation: int
+    prewarm: bool = True
+    prewarm_memory_mb: int = 256
 
 @dataclass
 class NormalTextConfig:
@@ -40,6 +42,7 @@ class TextConfig:
     fallback_words: List[str]
     normal: NormalTextConfig
     arc: ArcTextConfig
+    category_weights: Dict[str, float] = field(default_factory=dict)
 
 @dataclass
 class MaskConfig:
@@ -51,6 +54,10 @@ class LayoutConfig:
     max_words: int
     max_attempts_per_word: int
     max_attempts_total: int
+    candidate_batch_size: int = 32
+    region_raster_cell_size: int = 4
+    adaptive_attempts: bool = True
+    saturation_stop_failures: int = 12
 
 @dataclass
 class PlacementRegionRules:
@@ -74,12 +81,23 @@ class ZoomConfig:
 @dataclass
 class PerformanceConfig:
     batch_processing_max_workers: int
+    profile_phases: bool = True
+    hot_reload: bool = True
+    hot_reload_interval: float = 1.0
+
+@dataclass
+class ExportConfig:
+    backend: str = "numpy"
+    tiled_min_megapixels: float = 24
+    tile_height: int = 1024
 
 @dataclass
 class PathsConfig:
     default_image_dir: str
     default_font_dir: str
     output_dir: str
+    cache_dir: str = ".cache"
+    word_corpus: str = ""
 
 @dataclass
 class DebugConfig:
@@ -107,6 +125,7 @@ class Config:
     placement_regions: List[PlacementRegion]
     zoom: ZoomConfig
     performance: PerformanceConfig
+    export: ExportConfig
     paths: PathsConfig
     debug: DebugConfig
     logging: LoggingConfig
@@ -120,8 +139,12 @@ class ConfigManager:
         self.config = None
         self.load_config()
     
-    def load_config(self):
-        """Load configuration from YAML file."""
+    def load_config(self, keep_current_on_error: bool = False) -> bool:
+        """
+        Load configuration from YAML file. Returns False if it could not be read; the
+        default configuration is used then, or with `keep_current_on_error` the
+        current one is kept (e.g. while the file is being edited).
+        """
         try:
             if not os.path.exists(self.config_path):
                 raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
@@ -131,11 +154,16 @@ class ConfigManager:
             
             self.config = self._parse_config(yaml_data)
             print(f"Configuration loaded successfully from {self.config_path}")
+            return True
             
         except Exception as e:
             print(f"Error loading configuration: {e}")
-            print("Using default configuration...")
-            self.config = self._get_default_config()
+            if keep_current_on_error and self.config is not None:
+                print("Keeping the current configuration...")
+            else:
+                print("Using default configuration...")
+                self.config = self._get_default_config()
+            return False
     
     def _parse_config(self, yaml_data: Dict[str, Any]) -> Config:
         """Parse YAML data into structured configuration objects."""
@@ -160,13 +188,15 @@ class ConfigManager:
                 type_weights=yaml_data['text']['type_weights'],
                 fallback_words=yaml_data['text']['fallback_words'],
                 normal=NormalTextConfig(**yaml_data['text']['normal']),
-                arc=ArcTextConfig(**yaml_data['text']['arc'])
+                arc=ArcTextConfig(**yaml_data['text']['arc']),
+                category_weights=yaml_data['text'].get('category_weights') or {}
             ),
             mask=MaskConfig(**yaml_data['mask']),
             layout=LayoutConfig(**yaml_data['layout']),
             placement_regions=placement_regions,
             zoom=ZoomConfig(**yaml_data['zoom']),
             performance=PerformanceConfig(**yaml_data['performance']),
+            export=ExportConfig(**yaml_data.get('export', {})),
             paths=PathsConfig(**yaml_data['paths']),
             debug=DebugConfig(**yaml_data['debug']),
             logging=LoggingConfig(**yaml_data.get('logging', {'level': 'INFO'})),
@@ -191,6 +221,7 @@ class ConfigManager:
             placement_regions=[],
             zoom=ZoomConfig(0.1, 5.0, 0.1),
             performance=PerformanceConfig(4),
+            export=ExportConfig(),
             paths=PathsConfig("input", "fonts", "out"),
             debug=DebugConfig(False, False, False),
             logging=LoggingConfig(level="INFO"),
@@ -204,10 +235,10 @@ class ConfigManager:
         """Get the current configuration."""
         return self.config
     
-    def reload_config(self):
+    def reload_config(self, keep_current_on_error: bool = False) -> bool:
         """Reload configuration from file."""
         print("Reloading configuration...")
-        self.load_config()
+        return self.load_config(keep_current_on_error)
     
     def save_config(self, config: Config):
         """Save configuration to YAML file."""
@@ -245,6 +276,22 @@ def get_config() -> Config:
     """Get the global configuration instance."""
     return config_manager.get_config()
 
-def reload_config():
+def diff_configs(old: Config, new: Config) -> set:
+    """Names of the settings that differ, as 'section.field' (or 'section' for lists such as placement_regions)."""
+    changed = set()
+    for section in fields(new):
+        old_value, new_value = getattr(old, section.name), getattr(new, section.name)
+        if old_value == new_value:
+            continue
+        if is_dataclass(new_value):
+            changed.update(
+                f"{section.name}.{setting.name}" for setting in fields(new_value)
+                if getattr(old_value, setting.name) != getattr(new_value, setting.name)
+            )
+        else:
+            changed.add(section.name)
+    return changed
+
+def reload_config(keep_current_on_error: bool = False) -> bool:
     """Reload the global configuration."""
-    config_manager.reload_config() 
\ No newline at end of file
+    return config_manager.reload_config(keep_current_on_error) 
\ No newline at end of file
@@ -0,0 +1,82 @@
+import os
+import queue
+import threading
+
+
+def _stamp(path):
+    """(mtime, size) of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class FileWatcher:
+    """
+    Polls a few files for changes on a background thread.
+
+    Every `interval` seconds each file's (mtime, size) is compared with the last
+    one seen. A change is reported once the file has stayed the same for one more
+    interval, so an editor writing in several steps yields a single, complete
+    change. Changed paths are handed to the main thread through `poll()`; what to
+    reload is left to the caller. Polling needs no extra dependency and a stat()
+    per file per interval costs next to nothing.
+    """
+
+    def __init__(self, paths, interval=1.0):
+        self.interval = interval
+        self._stamps = {path: _stamp(path) for path in paths}
+        self._changes = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def paths(self):
+        return list(self._stamps)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="file-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def check(self, pending=None):
+        """
+        One polling round: returns the paths whose change has settled, updating
+        `pending` ({path: stamp} of changes still being written).
+        """
+        pending = {} if pending is None else pending
+        settled = []
+        for path, known in list(self._stamps.items()):
+            stamp = _stamp(path)
+            if stamp == known:
+                pending.pop(path, None)
+                continue
+            if path in pending and pending[path] == stamp:
+                # Unchanged since the previous round: the write is complete
+                del pending[path]
+                self._stamps[path] = stamp
+                settled.append(path)
+            else:
+                pending[path] = stamp
+        return settled
+
+    def _run(self):
+        pending = {}
+        while not self._stop.wait(self.interval):
+            for path in self.check(pending):
+                self._changes.put(path)
+
+    def poll(self):
+        """Paths changed since the last call, each reported once."""
+        changed = []
+        while True:
+            try:
+                path = self._changes.get_nowait()
+            except queue.Empty:
+                return changed
+            if path not in changed:
+                changed.append(path)
@@ -0,0 +1,173 @@
+import json
+import os
+import tempfile
+import time
+import threading
+import pygame.freetype
+from utils.font_utils import freetype_lock
+
+# Index format; files with another version are rebuilt from scratch
+FONT_INDEX_VERSION = 1
+# Size (px) at which metrics are recorded
+REFERENCE_SIZE = 32
+
+
+def _file_key(path):
+    """(mtime, size) of a font file, or None if it cannot be read."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime, stat.st_size]
+
+
+def inspect_font(path, charset, size=REFERENCE_SIZE):
+    """
+    Opens a font with pygame.freetype and returns its index entry: family and style
+    names, ascent/descent and average advance at `size`, and which characters of
+    `charset` it has glyphs for. Raises if the font cannot be opened or rendered.
+
+    The face is opened, measured and freed under freetype_lock, as pygame.freetype
+    shares one FreeType library between threads.
+    """
+    start = time.perf_counter()
+    with freetype_lock:
+        if not pygame.freetype.get_init():
+            pygame.freetype.init()
+        font = pygame.freetype.Font(path, size)
+        covered = []
+        advances = []
+        for char in sorted(set(charset)):
+            metrics = font.get_metrics(char)
+            if metrics and metrics[0] is not None:
+                covered.append(char)
+                advances.append(metrics[0][4])
+        family, style = font.name, getattr(font, 'style_name', '')
+        ascent, descent = font.get_sized_ascender(), font.get_sized_descender()
+        del font  # Freed while the lock is held
+    return {
+        'family': family,
+        'style': style,
+        'ascent': ascent,
+        'descent': descent,
+        'avg_advance': round(sum(advances) / len(advances), 2) if advances else 0.0,
+        'checked': ''.join(sorted(set(charset))),
+        'chars': ''.join(covered),
+        'load_seconds': round(time.perf_counter() - start, 4),
+    }
+
+
+class FontIndex:
+    """
+    Persistent index of validated fonts with their metrics.
+
+    Entries are keyed by font path and stamped with the file's (mtime, size), so a
+    font is only opened again when it changes on disk or when characters it has not
+    been checked for show up in the word set. Fonts that fail to open are recorded
+    too (with the error), so broken files are skipped at startup instead of being
+    discovered mid-layout.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.fonts = {}
+        # Guards reads of `fonts` against update() swapping it
+        self._lock = threading.Lock()
+        # Serializes update() and save(), which may run on the startup, word reload and main threads
+        self._write_lock = threading.Lock()
+        # Outcome of the last update()
+        self.reused = 0
+        self.validated = 0
+        self.failed = 0
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == FONT_INDEX_VERSION and data.get('reference_size') == REFERENCE_SIZE:
+                self.fonts = data.get('fonts', {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Warning: Font index '{self.path}' could not be read, rebuilding it: {e}")
+
+    def save(self):
+        """Writes the index atomically: to a temporary file of its own, then moved into place."""
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        with self._write_lock:
+            with self._lock:
+                data = {'version': FONT_INDEX_VERSION, 'reference_size': REFERENCE_SIZE, 'fonts': self.fonts}
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, prefix=os.path.basename(self.path), suffix='.tmp', delete=False) as f:
+                json.dump(data, f)
+            try:
+                os.replace(f.name, self.path)
+            except OSError:
+                os.remove(f.name)
+                raise
+
+    def update(self, font_paths, charset):
+        """
+        Brings the index in line with `font_paths`: unchanged fonts are reused, new or
+        modified ones are inspected, and fonts no longer present are dropped. Returns
+        True if anything changed (and the index should be saved). Concurrent calls
+        run one after the other.
+        """
+        with self._write_lock:
+            return self._update(font_paths, set(charset))
+
+    def _update(self, font_paths, charset):
+        fonts = {}
+        self.reused = self.validated = self.failed = 0
+        for path in font_paths:
+            key = _file_key(path)
+            entry = self.fonts.get(path)
+            if entry is not None and entry.get('key') == key and (entry.get('error') or charset <= set(entry.get('checked', ''))):
+                self.reused += 1
+            else:
+                try:
+                    entry = inspect_font(path, charset)
+                    self.validated += 1
+                except Exception as e:
+                    entry = {'error': str(e) or type(e).__name__}
+                    self.failed += 1
+                entry['key'] = key
+            fonts[path] = entry
+        with self._lock:
+            changed = self.validated or self.failed or set(fonts) != set(self.fonts)
+            self.fonts = fonts
+        return bool(changed)
+
+    def get(self, path):
+        """Index entry of a font, or None if it is not indexed."""
+        return self.fonts.get(path)
+
+    def valid_fonts(self):
+        """Paths of the fonts that opened and rendered successfully."""
+        with self._lock:
+            return [path for path, entry in self.fonts.items() if not entry.get('error')]
+
+    def broken_fonts(self):
+        """{path: error} of the fonts that could not be opened."""
+        with self._lock:
+            return {path: entry['error'] for path, entry in self.fonts.items() if entry.get('error')}
+
+    def fonts_covering(self, text):
+        """Paths of the valid fonts that have a glyph for every character of `text` (whitespace aside)."""
+        needed = set(text) - set(' \t\n')
+        with self._lock:
+            return [path for path, entry in self.fonts.items() if not entry.get('error') and needed <= set(entry['chars'])]
+
+    def coverage_table(self):
+        """{path: frozenset of covered characters} of the valid fonts, for font_utils.set_font_coverage()."""
+        with self._lock:
+            return {path: frozenset(entry['chars']) for path, entry in self.fonts.items() if not entry.get('error')}
+
+    def char_width(self):
+        """Median average advance of the valid fonts as a fraction of the font size, or None without fonts."""
+        with self._lock:
+            advances = sorted(entry['avg_advance'] for entry in self.fonts.values() if not entry.get('error') and entry.get('avg_advance'))
+        if not advances:
+            return None
+        return advances[len(advances) // 2] / REFERENCE_SIZE
@@ -0,0 +1,186 @@
+import hashlib
+import os
+import queue
+import threading
+from collections import OrderedDict, deque
+import pygame
+import pygame.freetype
+from utils.font_utils import freetype_lock
+
+# Point size the catalog samples are rendered at before being scaled down to fit
+SAMPLE_FONT_SIZE = 32
+# Rendered thumbnails kept in memory
+MEMORY_CACHE_SIZE = 500
+
+
+def _font_file(font_identifier):
+    """Path of the font file behind a font path or system font name, or None."""
+    if os.path.isfile(font_identifier):
+        return font_identifier
+    return pygame.font.match_font(font_identifier)
+
+
+def thumbnail_key(font_identifier, sample_text, width, height):
+    """
+    Disk cache key of a sample: a hash of the font path, its file's mtime, the
+    sample text and the thumbnail size, so editing a font or changing the sample
+    renders it again.
+    """
+    path = _font_file(font_identifier)
+    try:
+        mtime = os.path.getmtime(path) if path else 0
+    except OSError:
+        mtime = 0
+    raw = f"{font_identifier}\0{path}\0{mtime}\0{sample_text}\0{width}x{height}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def render_font_sample(font_identifier, sample_text, width, height):
+    """
+    The catalog sample of a font: `sample_text` in black on white with a grey border,
+    scaled down to fit `width`. The face is opened, rendered and freed under
+    freetype_lock; the result is not converted to the display format.
+    """
+    surface = pygame.Surface((width, height))
+    surface.fill((255, 255, 255))
+    pygame.draw.rect(surface, (200, 200, 200), surface.get_rect(), 1)
+
+    path = _font_file(font_identifier)
+    with freetype_lock:
+        if not pygame.freetype.get_init():
+            pygame.freetype.init()
+        font = None
+        try:
+            if path is None:
+                raise FileNotFoundError(font_identifier)
+            font = pygame.freetype.Font(path, SAMPLE_FONT_SIZE)
+            text_surf, _ = font.render(sample_text, (0, 0, 0))
+        except Exception:
+            font = pygame.freetype.Font(None, 20)
+            text_surf, _ = font.render("Font Error", (200, 0, 0))
+        del font  # Freed while the lock is held
+
+    if text_surf.get_width() > width - 20:
+        scale = (width - 20) / text_surf.get_width()
+        new_size = (max(1, int(text_surf.get_width() * scale)), max(1, int(text_surf.get_height() * scale)))
+        text_surf = pygame.transform.smoothscale(text_surf, new_size)
+
+    surface.blit(text_surf, text_surf.get_rect(center=surface.get_rect().center))
+    return surface
+
+
+class FontThumbnails:
+    """
+    Font catalog samples rendered on a background thread and cached on disk.
+
+    `request()` queues the samples the visible catalog rows need, replacing
+    whatever was still queued for rows scrolled away, and returns the ones
+    already in memory. The
+    worker loads each missing sample from `cache_dir` (PNG named by
+    thumbnail_key) or renders and stores it; finished samples are handed back to
+    the main thread through `poll()`. The last MEMORY_CACHE_SIZE samples stay in
+    memory, so scrolling back and forth does not touch the disk.
+    """
+
+    def __init__(self, cache_dir, memory_size=MEMORY_CACHE_SIZE):
+        self.cache_dir = cache_dir
+        self.memory_size = memory_size
+        self._memory = OrderedDict()
+        self._pending = deque()
+        self._wakeup = threading.Condition()
+        self._results = queue.Queue()
+        self._thread = None
+        # Where requested samples came from
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.rendered = 0
+
+    def request(self, font_identifiers, sample_text, width, height):
+        """
+        {font: surface} of the samples already in memory; the others are queued
+        (in order) for the worker and arrive through poll().
+        """
+        ready = {}
+        missing = []
+        for font in font_identifiers:
+            key = (font, sample_text, width, height)
+            surface = self._memory.get(key)
+            if surface is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                ready[font] = surface
+            else:
+                missing.append(key)
+        with self._wakeup:
+            self._pending = deque(missing)
+            self._wakeup.notify()
+        if missing and self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="font-thumbnails", daemon=True)
+            self._thread.start()
+        return ready
+
+    def cancel(self):
+        """Drops the queued requests (the sample being rendered still arrives)."""
+        with self._wakeup:
+            self._pending.clear()
+
+    def poll(self, limit=None):
+        """(font, surface) pairs finished since the last call, at most `limit` of them."""
+        finished = []
+        while limit is None or len(finished) < limit:
+            try:
+                key, surface = self._results.get_nowait()
+            except queue.Empty:
+                break
+            # Blitting is faster in the display's pixel format (only possible on the main thread)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            self._remember(key, surface)
+            finished.append((key[0], surface))
+        return finished
+
+    def _remember(self, key, surface):
+        self._memory[key] = surface
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _run(self):
+        while True:
+            with self._wakeup:
+                while not self._pending:
+                    self._wakeup.wait()
+                key = self._pending.popleft()
+            self._results.put((key, self._load_or_render(*key)))
+
+    def _load_or_render(self, font, sample_text, width, height):
+        path = os.path.join(self.cache_dir, f"{thumbnail_key(font, sample_text, width, height)}.png")
+        if os.path.isfile(path):
+            try:
+                surface = pygame.image.load(path)
+                self.disk_hits += 1
+                return surface
+            except Exception:
+                pass  # Unreadable cache file, render it again
+
+        surface = render_font_sample(font, sample_text, width, height)
+        self.rendered += 1
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path[:-4]}.tmp.png"
+            pygame.image.save(surface, tmp_path)
+            os.replace(tmp_path, path)
+        except (OSError, pygame.error) as e:
+            print(f"Warning: Could not cache font sample for '{font}': {e}")
+        return surface
+
+
+# Global thumbnail cache instance
+_font_thumbnails = None
+
+def get_font_thumbnails(cache_dir):
+    """Get the shared font sample cache (created on first use with `cache_dir`)."""
+    global _font_thumbnails
+    if _font_thumbnails is None:
+        _font_thumbnails = FontThumbnails(cache_dir)
+    return _font_thumbnails
@@ -2,18 +2,56 @@ import pygame
 import os
 import random
 import threading
+import time
+from contextlib import contextmanager
 
-font_cache = {}  # Cache for loaded fonts to avoid repeated disk I/O
-font_cache_lock = threading.Lock()  # Thread-safe access to font cache
+# Loaded fonts by (font_path, size). Lookups read the dict without locking; a
+# font is only added under font_cache_lock, which also serializes font loading
+# because SDL_ttf/FreeType cannot open fonts on several threads at once.
+font_cache = {}
+font_cache_lock = threading.Lock()
+# pygame.freetype shares one FT_Library across the process, so creating and freeing
+# faces (font index and catalog sample workers) has to be serialized too
+freetype_lock = threading.Lock()
+# Lookup and lock contention counters (updated without locking, so approximate under concurrency)
+font_cache_stats = {'hits': 0, 'misses': 0, 'lock_waits': 0, 'lock_wait_seconds': 0.0}
+
+# Font identifier -> characters it has glyphs for (see set_font_coverage)
+font_coverage = {}
+# How often coverage-aware selection changed the outcome of get_font()
+coverage_stats = {'picks': 0, 'misses_avoided': 0, 'uncovered_words': 0}
+
+@contextmanager
+def font_loading_lock():
+    """Holds font_cache_lock, counting the times it had to be waited for and for how long."""
+    if not font_cache_lock.acquire(blocking=False):
+        start = time.perf_counter()
+        font_cache_lock.acquire()
+        font_cache_stats['lock_waits'] += 1
+        font_cache_stats['lock_wait_seconds'] += time.perf_counter() - start
+    try:
+        yield
+    finally:
+        font_cache_lock.release()
 
 def get_cached_font(font_path, font_size):
     """Get a font from cache or load it if not cached."""
     cache_key = (font_path, font_size)
-    
-    with font_cache_lock:
-        if cache_key in font_cache:
-            return font_cache[cache_key]
-        
+
+    # Cache hits never take the lock
+    font = font_cache.get(cache_key)
+    if font is not None:
+        font_cache_stats['hits'] += 1
+        return font
+
+    with font_loading_lock():
+        # Another thread may have loaded it while we waited
+        font = font_cache.get(cache_key)
+        if font is not None:
+            font_cache_stats['hits'] += 1
+            return font
+        font_cache_stats['misses'] += 1
+
         # Load the font
         try:
             if font_path and os.path.isfile(font_path):
@@ -22,29 +60,72 @@ def get_cached_font(font_path, font_size):
                 font = pygame.font.SysFont(font_path, font_size)
             else:  # It's the default font
                 font = pygame.font.Font(None, font_size)
-            
-            # Cache the font
-            font_cache[cache_key] = font
-            return font
         except Exception as e:
             print(f"Warning: Failed to load font '{font_path}' at size {font_size}: {str(e)}. Falling back to default.")
-            fallback_font = pygame.font.Font(None, font_size)
-            font_cache[cache_key] = fallback_font
-            return fallback_font
+            font = pygame.font.Font(None, font_size)
+
+        # Publish the font; readers see either no entry or the finished font
+        font_cache[cache_key] = font
+        return font
 
 def clear_font_cache():
     """Clear the font cache to free memory."""
-    global font_cache
     with font_cache_lock:
         font_cache.clear()
     print("Font cache cleared")
 
+def reset_font_cache_stats():
+    for key in font_cache_stats:
+        font_cache_stats[key] = 0
+
 def get_system_fonts():
     """Get available system fonts using Pygame"""
     return pygame.font.get_fonts()
 
-def get_font(size, custom_font_paths):
-    """Get a random font with specified size using Pygame and return its identifier and display name."""
+def scan_font_directory(font_dir, extensions):
+    """Paths of all font files under `font_dir` (recursively) with one of the given extensions."""
+    font_paths = []
+    for root, _, files in os.walk(font_dir):
+        for fname in files:
+            if any(fname.lower().endswith(ext) for ext in extensions):
+                font_paths.append(os.path.join(root, fname))
+    return font_paths
+
+def set_font_coverage(coverage):
+    """Sets the coverage table ({font identifier: set of characters}) used by get_font() for words."""
+    global font_coverage
+    font_coverage = coverage
+
+def reset_coverage_stats():
+    for key in coverage_stats:
+        coverage_stats[key] = 0
+
+def _choose_covering_font(candidates, word):
+    """
+    Random candidate with a glyph for every character of `word`, or None if no candidate
+    covers it. A plain random pick is kept when it covers the word, so the choice stays
+    uniform over the covering fonts; fonts missing from the coverage table are assumed
+    to cover everything.
+    """
+    coverage_stats['picks'] += 1
+    needed = set(word) - set(' \t\n')
+    covers = lambda font: font not in font_coverage or needed <= font_coverage[font]
+    chosen = random.choice(candidates)
+    if covers(chosen):
+        return chosen
+    covering = [font for font in candidates if covers(font)]
+    if not covering:
+        coverage_stats['uncovered_words'] += 1
+        return None
+    coverage_stats['misses_avoided'] += 1
+    return random.choice(covering)
+
+def get_font(size, custom_font_paths, word=None):
+    """
+    Get a random font with specified size using Pygame and return its identifier and display name.
+    With `word`, only fonts that have glyphs for all of its characters are chosen (see set_font_coverage);
+    (None, None, None) is returned when no font covers it, so the caller can skip the word.
+    """
     # Prioritize custom fonts from FONT_DIR if provided.
     if custom_font_paths:
         candidates = custom_font_paths
@@ -53,10 +134,12 @@ def get_font(size, custom_font_paths):
     
     if not candidates:
         print("Warning: No custom fonts in FONT_DIR and no system fonts found. Using default.")
-        font = pygame.font.Font(None, size)
+        font = get_cached_font(None, size)
         return font, None, "Default"
     
-    chosen = random.choice(candidates)
+    chosen = _choose_covering_font(candidates, word) if word and font_coverage else random.choice(candidates)
+    if chosen is None:
+        return None, None, None
     try:
         if os.path.isfile(chosen):
             # It's a path to a custom font
@@ -68,5 +151,23 @@ def get_font(size, custom_font_paths):
             return font, chosen, chosen
     except Exception as e:
         print(f"Warning: Failed to load font '{chosen}': {str(e)}. Falling back to default.")
-        font = pygame.font.Font(None, size)
-        return font, None, "Default" 
\ No newline at end of file
+        font = get_cached_font(None, size)
+        return font, None, "Default"
+
+def max_fitting_font_size(font, word, size, max_width, letter_spacing=0):
+    """
+    Largest font size at which `word`, rendered letter by letter with `letter_spacing` pixels
+    between letters (as create_normal_sprites does), is at most `max_width` wide.
+
+    `font` is the face loaded at `size`. Glyph widths scale roughly linearly with the point
+    size, so the width-per-point measured there estimates other sizes without rendering.
+    Hinting can make small sizes a few pixels wider, so callers should still check the
+    rendered bbox. Returns 0 if the word cannot fit at any size.
+    """
+    glyph_width = sum(font.size(char)[0] for char in word)
+    if glyph_width <= 0 or size <= 0:
+        return size
+    available_width = max_width - letter_spacing * (len(word) - 1)
+    if available_width <= 0:
+        return 0
+    return int(available_width * size / glyph_width)
@@ -0,0 +1,139 @@
+import os
+import random
+import threading
+import time
+import pygame
+from utils.font_utils import get_cached_font, font_cache
+
+# Rough size of SDL_ttf's glyph cache per font object, in glyphs of size x size bytes
+CACHED_GLYPHS_ESTIMATE = 32
+
+
+def font_file_bytes(font_identifier):
+    """Size of the file behind a font path or system font name (0 if it cannot be found)."""
+    path = None
+    if font_identifier and os.path.isfile(font_identifier):
+        path = font_identifier
+    elif font_identifier:
+        path = pygame.font.match_font(font_identifier)
+    try:
+        return os.path.getsize(path) if path else 0
+    except OSError:
+        return 0
+
+
+def estimate_font_bytes(font_identifier, size, file_bytes=None):
+    """
+    Estimated memory of one loaded font object: the font file plus its glyph cache at
+    `size`. Pass `file_bytes` (see font_file_bytes) to skip looking the file up again.
+    """
+    if file_bytes is None:
+        file_bytes = font_file_bytes(font_identifier)
+    return file_bytes + CACHED_GLYPHS_ESTIMATE * size * size
+
+
+def warmup_size_stages(min_size, max_size, scale_factors=()):
+    """
+    Sizes to preload: the layout range first, then the sizes the high-resolution
+    export asks for at each scale factor (int(size * scale), as in prepare_glyphs).
+    """
+    layout_sizes = list(range(min_size, max_size + 1))
+    high_res_sizes = sorted({max(1, int(size * scale)) for scale in scale_factors for size in layout_sizes} - set(layout_sizes))
+    return [layout_sizes, high_res_sizes]
+
+
+class FontWarmup:
+    """
+    Preloads (font, size) pairs into font_utils' font cache on a background thread.
+
+    Stages are loaded in order (layout sizes before export sizes); pairs within a
+    stage are shuffled so every font and size gets some coverage before the budget
+    runs out. Pairs whose estimated memory (see estimate_font_bytes) would exceed
+    `memory_budget_bytes` are skipped. Progress can be read at any time from
+    `done`, `total`, `bytes_loaded` and `skipped`.
+    """
+
+    def __init__(self, font_identifiers, size_stages, memory_budget_bytes, seed=0):
+        self.font_identifiers = list(font_identifiers)
+        self.size_stages = [list(stage) for stage in size_stages]
+        self.memory_budget_bytes = memory_budget_bytes
+        self.seed = seed
+        self.total = 0
+        self.done = 0
+        self.bytes_loaded = 0
+        self.skipped = 0
+        self.elapsed = 0.0
+        self.finished = False
+        self._cancelled = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="font-warmup", daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Stops after the font currently being loaded."""
+        self._cancelled.set()
+
+    def wait(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def plan(self):
+        """
+        The (font, size, estimated bytes) pairs to load, within the memory budget. Each
+        font's file is looked up once, and planning stops once the budget left is below
+        the cheapest pair seen (the pairs left then count as skipped).
+        """
+        rng = random.Random(self.seed)
+        planned = []
+        budget_left = self.memory_budget_bytes
+        file_bytes = {}
+        sizes = [size for stage in self.size_stages for size in stage]
+        # Cheapest pair expected: the smallest glyph cache plus the smallest font file seen
+        # so far (pairs are shuffled, so the fonts seen are a fair sample of the rest)
+        min_cost = CACHED_GLYPHS_ESTIMATE * min(sizes) ** 2 if sizes else 0
+        smallest_file = None
+        for stage_index, stage in enumerate(self.size_stages):
+            pairs = [(font, size) for size in stage for font in self.font_identifiers]
+            rng.shuffle(pairs)
+            for pair_index, (font, size) in enumerate(pairs):
+                if budget_left < min_cost + (smallest_file or 0):
+                    later = sum(len(later_stage) for later_stage in self.size_stages[stage_index + 1:])
+                    self.skipped += len(pairs) - pair_index + later * len(self.font_identifiers)
+                    return planned
+                if (font, size) in font_cache:
+                    continue
+                if font not in file_bytes:
+                    file_bytes[font] = font_file_bytes(font)
+                    smallest_file = file_bytes[font] if smallest_file is None else min(smallest_file, file_bytes[font])
+                cost = estimate_font_bytes(font, size, file_bytes[font])
+                if cost > budget_left:
+                    self.skipped += 1
+                    continue
+                budget_left -= cost
+                planned.append((font, size, cost))
+        return planned
+
+    def _run(self):
+        start = time.perf_counter()
+        try:
+            planned = self.plan()
+            self.total = len(planned)
+            for font, size, cost in planned:
+                if self._cancelled.is_set():
+                    break
+                get_cached_font(font, size)
+                self.done += 1
+                self.bytes_loaded += cost
+        finally:
+            self.elapsed = time.perf_counter() - start
+            self.finished = True
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def progress_text(self):
+        return f"{self.done}/{self.total} fonts, {self.bytes_loaded / 1_000_000:.0f} MB"
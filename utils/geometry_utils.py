@@ -1,3 +1,5 @@
+import numpy as np
+
 def point_in_polygon(x, y, poly):
     """
     Checks if a point (x, y) is inside a polygon `poly`.
@@ -20,4 +22,118 @@ def point_in_polygon(x, y, poly):
                     if p1x == p2x or x <= xinters:
                         inside = not inside
         p1x, p1y = p2x, p2y
-    return inside 
\ No newline at end of file
+    return inside
+
+
+def points_in_polygon(xs, ys, poly):
+    """
+    Vectorized point_in_polygon: tests arrays of x and y coordinates against `poly`.
+    Uses the same ray-casting rule, so results match point_in_polygon point for point.
+
+    Returns a boolean array with the broadcast shape of `xs` and `ys`.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    inside = np.zeros(np.broadcast(xs, ys).shape, dtype=bool)
+    n = len(poly)
+    if n < 3:
+        return inside
+
+    for i in range(n):
+        p1x, p1y = poly[i - 1]
+        p2x, p2y = poly[i]
+        if p1y == p2y:
+            continue  # Horizontal edges never satisfy min(y) < y <= max(y)
+        crosses = (ys > min(p1y, p2y)) & (ys <= max(p1y, p2y)) & (xs <= max(p1x, p2x))
+        if p1x != p2x:
+            xinters = (ys - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+            crosses &= xs <= xinters
+        inside ^= crosses
+    return inside
+
+
+def points_in_polygons(xs, ys, polys):
+    """Tests arrays of points against several polygons; returns a (len(polys), n_points) boolean array."""
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    result = np.zeros((len(polys),) + np.broadcast(xs, ys).shape, dtype=bool)
+    for i, poly in enumerate(polys):
+        result[i] = points_in_polygon(xs, ys, poly)
+    return result
+
+
+def polygon_signed_area(poly):
+    """Signed area of a polygon (shoelace formula); the sign gives the winding order."""
+    area = 0.0
+    n = len(poly)
+    for i in range(n):
+        x1, y1 = poly[i]
+        x2, y2 = poly[(i + 1) % n]
+        area += x1 * y2 - x2 * y1
+    return area / 2
+
+
+def _point_in_triangle(p, a, b, c):
+    """True if p lies inside or on the edges of the counter-clockwise triangle abc."""
+    def cross(o, u, v):
+        return (u[0] - o[0]) * (v[1] - o[1]) - (u[1] - o[1]) * (v[0] - o[0])
+    return cross(a, b, p) >= 0 and cross(b, c, p) >= 0 and cross(c, a, p) >= 0
+
+
+def _edges_cross(poly):
+    """True if two non-adjacent edges of the polygon properly cross each other."""
+    def cross(o, u, v):
+        return (u[0] - o[0]) * (v[1] - o[1]) - (u[1] - o[1]) * (v[0] - o[0])
+    n = len(poly)
+    edges = [(poly[i], poly[(i + 1) % n]) for i in range(n)]
+    for i in range(n):
+        a, b = edges[i]
+        for j in range(i + 2, n - (i == 0)):
+            c, d = edges[j]
+            if cross(a, b, c) * cross(a, b, d) < 0 and cross(c, d, a) * cross(c, d, b) < 0:
+                return True
+    return False
+
+
+def triangulate_polygon(poly):
+    """
+    Triangulates a simple polygon by ear clipping.
+    `poly` is a list of (x, y) vertices in either winding order.
+
+    Returns a list of (a, b, c) vertex tuples, or None if the polygon is not simple
+    (edges cross or no ear can be found), in which case callers should fall back to
+    ray casting.
+    Degenerate polygons (fewer than 3 vertices or zero area) give an empty list.
+    """
+    n = len(poly)
+    if n < 3:
+        return []
+    area = polygon_signed_area(poly)
+    if area == 0:
+        return []
+    if _edges_cross(poly):
+        return None
+
+    # Work counter-clockwise (positive area) so convex corners have a positive cross product
+    remaining = [tuple(p) for p in (poly if area > 0 else poly[::-1])]
+    triangles = []
+    while len(remaining) > 3:
+        for i in range(len(remaining)):
+            a, b, c = remaining[i - 1], remaining[i], remaining[(i + 1) % len(remaining)]
+            turn = (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+            if turn == 0:
+                # Collinear vertex, drop it without emitting a triangle
+                del remaining[i]
+                break
+            if turn < 0:
+                continue  # Reflex corner
+            if any(_point_in_triangle(p, a, b, c) for p in remaining if p not in (a, b, c)):
+                continue
+            triangles.append((a, b, c))
+            del remaining[i]
+            break
+        else:
+            return None
+    if len(remaining) == 3 and polygon_signed_area(remaining) != 0:
+        triangles.append(tuple(remaining))
+    return triangles
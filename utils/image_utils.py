@@ -63,6 +63,30 @@ def grow_binary_mask_pil(mask_surface, grow_pixels):
         print("Falling back to original surface")
         return mask_surface
 
+def grow_binary_mask_array(mask, grow_pixels):
+    """
+    NumPy equivalent of grow_binary_mask_pil for a uint8 (h, w) mask array.
+
+    Thresholding commutes with a max filter, so the mask is binarised first and
+    dilated as booleans with a separable square kernel of size grow_pixels * 2 + 1.
+    Pixels outside the image are treated as black, which matches PIL's edge handling.
+    """
+    if grow_pixels <= 0:
+        return mask
+
+    grown = mask > 128
+    for axis in (0, 1):
+        source = grown
+        grown = source.copy()
+        for shift in range(1, min(grow_pixels, source.shape[axis] - 1) + 1):
+            lead = [slice(None), slice(None)]
+            lag = [slice(None), slice(None)]
+            lead[axis], lag[axis] = slice(shift, None), slice(None, -shift)
+            grown[tuple(lead)] |= source[tuple(lag)]
+            grown[tuple(lag)] |= source[tuple(lead)]
+
+    return np.where(grown, 255, 0).astype(np.uint8)
+
 def create_final_mask_surface(placed_sprites, canvas_width, canvas_height, canvas_offset_x, canvas_offset_y):
     """Creates a clean, black and white surface of the mask, perfectly sized to the canvas."""
     mask_surface = pygame.Surface((canvas_width, canvas_height))
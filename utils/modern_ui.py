@@ -5,42 +5,18 @@ import sys
 import os
 import json
 from typing import List, Tuple, Optional, Dict, Any
-
-def create_font_sample_surface(width: int,
-                               height: int,
-                               font_path: str,
-                               sample_text: str) -> pygame.Surface:
-    """Return an opaque surface with the rendered sample text."""
-
-    # -------- Surface ----------------------------------------------
-    surface = pygame.Surface((width, height), flags=pygame.SRCALPHA)
-    surface = surface.convert_alpha()          # <- IMPORTANT
-    surface.fill((255, 255, 255, 255))         # solid white, opaque
-
+from utils.font_thumbnails import get_font_thumbnails
+from utils.font_utils import get_cached_font
+from utils.virtual_list import VirtualListLayout
+
+def create_sample_placeholder(width: int, height: int) -> pygame.Surface:
+    """Grey "Loading..." box shown in place of a font sample until it has been rendered."""
+    surface = pygame.Surface((width, height))
+    surface.fill((235, 235, 235))
     pygame.draw.rect(surface, (200, 200, 200), surface.get_rect(), 1)
-
-    # -------- Load Font --------------------------------------------
-    try:
-        font = pygame.font.Font(font_path, 32) if os.path.isfile(font_path) \
-               else pygame.font.SysFont(font_path, 32)
-
-        text_surf = font.render(sample_text, True, (0, 0, 0))  # black text
-    except Exception:
-        err_font = pygame.font.Font(None, 20)
-        text_surf = err_font.render("Font Error", True, (200, 0, 0))
-
-    # -------- Scale if wider than panel ----------------------------
-    if text_surf.get_width() > width - 20:
-        scale = (width - 20) / text_surf.get_width()
-        new_size = (max(1, int(text_surf.get_width()*scale)),
-                    max(1, int(text_surf.get_height()*scale)))
-        text_surf = pygame.transform.smoothscale(text_surf, new_size)
-
-    # -------- Center ------------------------------------------------
-    rect = text_surf.get_rect(center=surface.get_rect().center)
-    surface.blit(text_surf, rect)
-
-    return surface.convert()   # opaque RGB surface (no unexpected alpha)
+    text_surf = get_cached_font(None, 20).render("Loading...", True, (150, 150, 150))
+    surface.blit(text_surf, text_surf.get_rect(center=surface.get_rect().center))
+    return surface
 
 class ModernUIManager:
     """Modern UI manager using pygame_gui for professional-looking interfaces."""
@@ -416,18 +392,31 @@ class DirectoryDialog:
 # ---------------------------------------------------------------------------
 
 class FontCatalogWindow:
-    """Modern font catalog window using pygame_gui best practices with lazy loading."""
+    """
+    Modern font catalog window using pygame_gui best practices with lazy loading.
+
+    The list is virtualized: a fixed pool of row panels, just enough to fill the
+    viewport, is moved and refilled as the list scrolls, so opening or scrolling
+    the catalog costs the same for ten fonts or ten thousand. Font samples come
+    from the shared FontThumbnails cache: rows show a placeholder until the
+    background worker has loaded or rendered their sample, which update() then
+    swaps in.
+    """
+
+    # Samples swapped in per frame, so a screen full of cached samples does not stall one frame
+    SAMPLES_PER_UPDATE = 10
+    SAMPLE_TEXT = "The quick brown fox jumps over lazy dog 1234567890"
+    SAMPLE_HEIGHT = 40
+    ROW_HEIGHT = 80
+    ROW_GAP = 5
+    SCROLL_BAR_WIDTH = 20
     
     def __init__(self, ui_manager: pygame_gui.UIManager, screen_size: Tuple[int, int],
-                 font_list: List[str], title: str):
+                 font_list: List[str], title: str, thumbnail_dir: str = os.path.join('.cache', 'font_thumbnails')):
         self.ui_manager = ui_manager
         self.is_alive = True
         self.font_list = font_list
-        
-        # Pagination settings
-        self.fonts_per_page = 50  # Load fonts in batches for better performance
-        self.current_page = 0
-        self.total_pages = (len(font_list) + self.fonts_per_page - 1) // self.fonts_per_page
+        self.thumbnails = get_font_thumbnails(thumbnail_dir)
         
         # Window dimensions
         window_width = 900
@@ -443,48 +432,41 @@ class FontCatalogWindow:
             object_id='#font_catalog_window'
         )
         
-        # Navigation panel
-        nav_height = 40
-        self.nav_panel = pygame_gui.elements.UIPanel(
-            relative_rect=pygame.Rect(10, 10, window_width - 40, nav_height),
+        # Position info label
+        info_height = 30
+        self.info_label = pygame_gui.elements.UILabel(
+            relative_rect=pygame.Rect(10, 10, window_width - 40, info_height),
+            text="",
             manager=ui_manager,
             container=self.window
         )
         
-        # Navigation buttons
-        self.prev_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(10, 5, 80, 30),
-            text='Previous',
-            manager=ui_manager,
-            container=self.nav_panel
-        )
-        
-        self.next_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(100, 5, 80, 30),
-            text='Next',
+        # Viewport the row panels are clipped to, with the scroll bar next to it
+        viewport_y = 10 + info_height + 5
+        viewport_width = window_width - 40 - self.SCROLL_BAR_WIDTH
+        viewport_height = window_height - 80 - info_height - 5
+        self.viewport = pygame_gui.elements.UIPanel(
+            relative_rect=pygame.Rect(10, viewport_y, viewport_width, viewport_height),
             manager=ui_manager,
-            container=self.nav_panel
+            container=self.window
         )
-        
-        # Page info label
-        self.page_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(200, 5, 200, 30),
-            text=self._get_page_text(),
-            manager=ui_manager,
-            container=self.nav_panel
-        )
-        
-        # Create scrolling container for font samples
-        scroll_y = 10 + nav_height + 5
-        scroll_height = window_height - 80 - nav_height - 5
-        self.scroll_container = pygame_gui.elements.UIScrollingContainer(
-            relative_rect=pygame.Rect(10, scroll_y, window_width - 40, scroll_height),
+        self.layout = VirtualListLayout(len(font_list), self.ROW_HEIGHT, self.ROW_GAP, self.viewport.get_container().rect.height)
+        self.scroll_bar = pygame_gui.elements.UIVerticalScrollBar(
+            relative_rect=pygame.Rect(10 + viewport_width, viewport_y, self.SCROLL_BAR_WIDTH, viewport_height),
+            visible_percentage=self.layout.visible_fraction,
             manager=ui_manager,
             container=self.window
         )
+        # Scroll bar position the list last followed or set
+        self._bar_percentage = self.scroll_bar.start_percentage
         
-        # Create font sample panels for current page
-        self._create_current_page()
+        # Fixed pool of rows, refilled as the list scrolls
+        self.row_width = self.viewport.get_container().rect.width - 10
+        self.sample_width = self.row_width - 15
+        self.placeholder = create_sample_placeholder(self.sample_width, self.SAMPLE_HEIGHT)
+        self.rows = [self._create_row() for _ in range(self.layout.pool_size)]
+        self.scroll_offset = 0
+        self._show_rows()
         
         # Close button
         self.close_button = pygame_gui.elements.UIButton(
@@ -493,138 +475,108 @@ class FontCatalogWindow:
             manager=ui_manager,
             container=self.window
         )
-        
-        self._update_navigation_buttons()
-    
-    def _get_page_text(self) -> str:
-        """Get the current page information text."""
-        if self.total_pages == 0:
-            return "No fonts available"
-        return f"Page {self.current_page + 1} of {self.total_pages} ({len(self.font_list)} total fonts)"
     
-    def _update_navigation_buttons(self):
-        """Update the state of navigation buttons."""
-        # Enable/disable buttons based on current page
-        if self.current_page <= 0:
-            self.prev_button.disable()
-        else:
-            self.prev_button.enable()
-            
-        if self.current_page >= self.total_pages - 1:
-            self.next_button.disable()
+    def _create_row(self) -> Dict[str, Any]:
+        """Create one recyclable row: a light panel with index, name and sample image."""
+        panel = pygame_gui.elements.UIPanel(
+            relative_rect=pygame.Rect(5, 0, self.row_width, self.ROW_HEIGHT),
+            manager=self.ui_manager,
+            container=self.viewport,
+            object_id='#light_panel'
+        )
+        index_label = pygame_gui.elements.UILabel(
+            relative_rect=pygame.Rect(5, 5, 50, 25),
+            text="",
+            manager=self.ui_manager,
+            container=panel
+        )
+        name_label = pygame_gui.elements.UILabel(
+            relative_rect=pygame.Rect(60, 5, 300, 25),
+            text="",
+            manager=self.ui_manager,
+            container=panel
+        )
+        sample_image = pygame_gui.elements.UIImage(
+            relative_rect=pygame.Rect(5, 35, self.sample_width, self.SAMPLE_HEIGHT),
+            image_surface=self.placeholder,
+            manager=self.ui_manager,
+            container=panel
+        )
+        return {'panel': panel, 'index_label': index_label, 'name_label': name_label, 'sample_image': sample_image,
+                'index': None, 'waiting': False}
+    
+    def _fill_row(self, row: Dict[str, Any], font_idx: int, sample: Optional[pygame.Surface]):
+        """Point a pooled row at another font."""
+        font_path = self.font_list[font_idx]
+        # System font names have no directory part (no stat() while scrolling)
+        font_name = os.path.basename(font_path) if os.path.dirname(font_path) else font_path
+        if len(font_name) > 35:
+            font_name = font_name[:32] + "..."
+        row['index'] = font_idx
+        row['index_label'].set_text(f"{font_idx + 1:3d}.")
+        row['name_label'].set_text(font_name)
+        row['sample_image'].set_image(sample if sample is not None else self.placeholder)
+        row['waiting'] = sample is None
+    
+    def _show_rows(self):
+        """Move the pooled rows to the current scroll offset, refilling the ones whose font changed and hiding unused ones."""
+        visible = self.layout.visible(self.scroll_offset)
+        entering = [font_idx for font_idx, slot, _ in visible if self.rows[slot]['index'] != font_idx]
+        ready = {}
+        if entering:
+            # Samples already in memory are shown right away; the others (and those still
+            # waiting on screen) replace whatever was queued for rows scrolled out of view
+            waiting = [font_idx for font_idx, slot, _ in visible if font_idx in entering or self.rows[slot]['waiting']]
+            ready = self.thumbnails.request([self.font_list[i] for i in waiting], self.SAMPLE_TEXT, self.sample_width, self.SAMPLE_HEIGHT)
+        for font_idx, slot, y in visible:
+            row = self.rows[slot]
+            if row['index'] != font_idx:
+                self._fill_row(row, font_idx, ready.get(self.font_list[font_idx]))
+            row['panel'].set_relative_position((5, y))
+            if not row['panel'].visible:
+                row['panel'].show()
+        # Slots left over (end of the list) would otherwise keep an old font at an old position
+        for slot in self.layout.idle_slots(self.scroll_offset):
+            if self.rows[slot]['panel'].visible:
+                self.rows[slot]['panel'].hide()
+        
+        if visible:
+            self.info_label.set_text(f"Fonts {visible[0][0] + 1}-{visible[-1][0] + 1} of {len(self.font_list)}")
         else:
-            self.next_button.enable()
-            
-        self.page_label.set_text(self._get_page_text())
+            self.info_label.set_text("No fonts available")
     
-    def _clear_current_page(self):
-        """Clear all elements from the scroll container."""
-        # Kill all child elements
-        for element in list(self.scroll_container.get_container().elements):
-            element.kill()
-    
-    def _create_current_page(self):
-        """Create font sample panels for the current page only."""
-        self._clear_current_page()
-        
-        panel_height = 80
-        panel_width = self.scroll_container.rect.width - 40
-        y_offset = 0
-        sample_text = "The quick brown fox jumps over lazy dog 1234567890"
-        
-        # Calculate font range for current page
-        start_idx = self.current_page * self.fonts_per_page
-        end_idx = min(start_idx + self.fonts_per_page, len(self.font_list))
-        
-        for local_i, font_idx in enumerate(range(start_idx, end_idx)):
-            font_path = self.font_list[font_idx]
-            global_i = font_idx  # Global index for numbering
-            
-            # Create panel for this font with light background
-            panel = pygame_gui.elements.UIPanel(
-                relative_rect=pygame.Rect(10, y_offset, panel_width, panel_height),
-                manager=self.ui_manager,
-                container=self.scroll_container,
-                object_id='#light_panel'
-            )
-            
-            # Font name and index
-            font_name = os.path.basename(font_path) if os.path.isfile(font_path) else font_path
-            if len(font_name) > 35:
-                font_name = font_name[:32] + "..."
-            
-            # Font index and name
-            index_label = pygame_gui.elements.UILabel(
-                relative_rect=pygame.Rect(5, 5, 50, 25),
-                text=f"{global_i + 1:3d}.",
-                manager=self.ui_manager,
-                container=panel
-            )
-            
-            name_label = pygame_gui.elements.UILabel(
-                relative_rect=pygame.Rect(60, 5, 300, 25),
-                text=font_name,
-                manager=self.ui_manager,
-                container=panel
-            )
-            
-            # Create font sample surface and display via UIImage
-            try:
-                sample_surface = create_font_sample_surface(
-                    panel_width - 15,
-                    40,
-                    font_path,
-                    sample_text
-                )
-                pygame_gui.elements.UIImage(
-                    relative_rect=pygame.Rect(5, 35, panel_width - 15, 40),
-                    image_surface=sample_surface,
-                    manager=self.ui_manager,
-                    container=panel
-                )
-            except Exception as e:
-                # Fallback error label if any issue creating surface
-                pygame_gui.elements.UILabel(
-                    relative_rect=pygame.Rect(5, 35, panel_width - 15, 40),
-                    text=f"Failed to load font: {str(e)[:30]}...",
-                    manager=self.ui_manager,
-                    container=panel
-                )
-            
-            y_offset += panel_height + 5
-        
-        # Set the scrolling container's scrollable area
-        self.scroll_container.set_scrollable_area_dimensions((panel_width + 20, max(y_offset, self.scroll_container.rect.height)))
-    
-    def _next_page(self):
-        """Go to the next page of fonts."""
-        if self.current_page < self.total_pages - 1:
-            self.current_page += 1
-            self._create_current_page()
-            self._update_navigation_buttons()
-    
-    def _prev_page(self):
-        """Go to the previous page of fonts."""
-        if self.current_page > 0:
-            self.current_page -= 1
-            self._create_current_page()
-            self._update_navigation_buttons()
+    def _scroll_to(self, offset: float):
+        offset = self.layout.clamp(offset)
+        if offset != self.scroll_offset:
+            self.scroll_offset = offset
+            self._show_rows()
     
     def update(self, time_delta):
-        """Update the window - no need for manual rendering with custom elements."""
-        # Custom UIFontSample elements handle their own rendering
-        pass
+        """Follow the scroll bar and swap in the font samples finished since the last frame."""
+        if self.scroll_bar.start_percentage != self._bar_percentage:
+            self._bar_percentage = self.scroll_bar.start_percentage
+            self._scroll_to(self._bar_percentage * self.layout.content_height)
+        
+        for font_path, surface in self.thumbnails.poll(self.SAMPLES_PER_UPDATE):
+            if surface.get_size() != (self.sample_width, self.SAMPLE_HEIGHT):
+                continue
+            for row in self.rows:
+                if row['waiting'] and self.font_list[row['index']] == font_path:
+                    row['sample_image'].set_image(surface)
+                    row['waiting'] = False
     
     def handle_event(self, event: pygame.event.Event):
         """Handle UI events."""
-        if event.type == pygame.USEREVENT:
+        if event.type == pygame.MOUSEWHEEL and self.viewport.rect.collidepoint(pygame.mouse.get_pos()):
+            # One row per wheel step; the scroll bar follows
+            self._scroll_to(self.scroll_offset - event.y * self.layout.pitch)
+            if self.layout.content_height:
+                self.scroll_bar.set_scroll_from_start_percentage(self.scroll_offset / self.layout.content_height)
+                self._bar_percentage = self.scroll_bar.start_percentage
+        elif event.type == pygame.USEREVENT:
             if event.user_type == pygame_gui.UI_BUTTON_PRESSED:
                 if event.ui_element == self.close_button:
                     self.close()
-                elif event.ui_element == self.next_button:
-                    self._next_page()
-                elif event.ui_element == self.prev_button:
-                    self._prev_page()
             elif event.user_type == pygame_gui.UI_WINDOW_CLOSE:
                 if event.ui_element == self.window:
                     self.close()
@@ -632,6 +584,7 @@ class FontCatalogWindow:
     def close(self):
         """Close the window."""
         self.is_alive = False
+        self.thumbnails.cancel()
         self.window.kill()
 
 class ControlsHelpWindow:
@@ -854,9 +807,9 @@ def show_modern_batch_save_popup(ui_manager: ModernUIManager, screen_size: Tuple
     return dialog.get_result()
 
 def show_modern_font_catalog(ui_manager: ModernUIManager, screen_size: Tuple[int, int],
-                           font_list: List[str], title: str):
+                           font_list: List[str], title: str, thumbnail_dir: str = os.path.join('.cache', 'font_thumbnails')):
     """Show modern font catalog window."""
-    window = FontCatalogWindow(ui_manager.manager, screen_size, font_list, title)
+    window = FontCatalogWindow(ui_manager.manager, screen_size, font_list, title, thumbnail_dir)
     
     # Store the window for updates
     ui_manager.active_windows.append(window)
@@ -0,0 +1,192 @@
+import numpy as np
+import pygame
+
+# Weight of the latest word in the running failure rate
+FAILURE_RATE_SMOOTHING = 0.25
+# Failure rate above which the canvas (or region) is treated as saturated
+SATURATION_FAILURE_RATE = 0.5
+# Adaptive budgets never drop below this fraction of the configured one
+MIN_BUDGET_FRACTION = 0.1
+# Below this free-area ratio budgets shrink in proportion to the space left
+LOW_FREE_AREA_RATIO = 0.1
+# Below this free-area ratio no further word is attempted
+MIN_FREE_AREA_RATIO = 0.02
+
+
+class PlacementEvaluator:
+    """
+    Evaluates batches of candidate word positions against the current layout.
+
+    All placed letters are stamped into one canvas-sized occupancy mask (their padded
+    masks), so a candidate costs a single Mask.overlap call for the whole word instead
+    of a Rect copy, a bounds check and a spritecollide per letter. Bounds are filtered
+    for the whole batch with NumPy first, and candidates are tried in order until the
+    first free one.
+
+    With `adaptive=True` it also tracks how full the canvas is and how often recent
+    words failed, and uses that to shrink per-word attempt budgets, to signal
+    saturation (so callers can fall back to smaller sizes or shorter words) and to
+    stop a layout early once `stop_after_failures` words in a row could not be placed.
+    """
+
+    def __init__(self, canvas_width, canvas_height, canvas_offset_x, canvas_offset_y, canvas_padding, adaptive=True, stop_after_failures=12):
+        self.canvas_width = canvas_width
+        self.canvas_height = canvas_height
+        self.origin = (canvas_offset_x, canvas_offset_y)
+        self.canvas_padding = canvas_padding
+        # Grows past the canvas as placed letters' padded masks reach beyond it (see commit)
+        self.occupancy = pygame.mask.Mask((max(1, canvas_width), max(1, canvas_height)))
+        self.adaptive = adaptive
+        self.stop_after_failures = stop_after_failures
+        self.candidates_tested = 0
+        self.overlap_tests = 0
+
+        # Saturation tracking, reset per group of words (e.g. per region)
+        self.failure_rate = 0.0
+        self.consecutive_failures = 0
+        self.occupied_pixels = 0
+
+        # Per-layout statistics
+        self.words_placed = 0
+        self.words_failed = 0
+        self.attempts_used = 0
+        self.wasted_attempts = 0
+        self.attempts_saved = 0
+        self.early_stops = 0
+
+    @staticmethod
+    def word_footprint(new_sprites):
+        """
+        Union of the letters' padded masks, positioned relative to the word's top-left.
+        Returns (mask, (dx, dy)) where (dx, dy) is the mask's offset from the word top-left.
+        """
+        left = min(s.rect.x for s in new_sprites)
+        top = min(s.rect.y for s in new_sprites)
+        right = max(s.rect.x + s.padded_mask.get_size()[0] for s in new_sprites)
+        bottom = max(s.rect.y + s.padded_mask.get_size()[1] for s in new_sprites)
+        footprint = pygame.mask.Mask((right - left, bottom - top))
+        for sprite in new_sprites:
+            footprint.draw(sprite.padded_mask, (sprite.rect.x - left, sprite.rect.y - top))
+        return footprint, (left, top)
+
+    def filter_in_bounds(self, xs, ys, word_bbox):
+        """Keeps the candidate centers whose word rect lies inside the padded canvas."""
+        xs = np.asarray(xs)
+        ys = np.asarray(ys)
+        # Same rounding as assigning Rect.center
+        lefts = xs - word_bbox.width // 2 - self.origin[0]
+        tops = ys - word_bbox.height // 2 - self.origin[1]
+        inside = (
+            (lefts >= self.canvas_padding) & (lefts + word_bbox.width <= self.canvas_width - self.canvas_padding) &
+            (tops >= self.canvas_padding) & (tops + word_bbox.height <= self.canvas_height - self.canvas_padding)
+        )
+        return xs[inside], ys[inside]
+
+    def find_free_position(self, new_sprites, word_bbox, xs, ys):
+        """Returns the first candidate center (in order) where the word fits without collisions, or None."""
+        xs, ys = self.filter_in_bounds(xs, ys, word_bbox)
+        self.candidates_tested += len(xs)
+        if len(xs) == 0:
+            return None
+
+        footprint, (dx, dy) = self.word_footprint(new_sprites)
+        half_w, half_h = word_bbox.width // 2, word_bbox.height // 2
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            self.overlap_tests += 1
+            offset = (x - half_w + dx - self.origin[0], y - half_h + dy - self.origin[1])
+            if self.occupancy.overlap(footprint, offset) is None:
+                return (x, y)
+        return None
+
+    def commit(self, new_sprites, center, word_bbox):
+        """Moves the word's letters to `center` and stamps them into the occupancy mask."""
+        word_rect = word_bbox.copy()
+        word_rect.center = center
+        for sprite in new_sprites:
+            sprite.rect = sprite.rect.move(word_rect.topleft)
+        self._fit_occupancy(new_sprites)
+        for sprite in new_sprites:
+            self.occupancy.draw(sprite.padded_mask, (sprite.rect.x - self.origin[0], sprite.rect.y - self.origin[1]))
+        self.occupied_pixels = self.occupancy.count()
+
+    def _fit_occupancy(self, sprites):
+        """
+        Enlarges the occupancy mask so the sprites' padded masks, which grow right and down
+        past their letters, are stamped whole; a clipped stamp would miss collisions there.
+        """
+        width, height = self.occupancy.get_size()
+        right = max(sprite.rect.x - self.origin[0] + sprite.padded_mask.get_size()[0] for sprite in sprites)
+        bottom = max(sprite.rect.y - self.origin[1] + sprite.padded_mask.get_size()[1] for sprite in sprites)
+        if right > width or bottom > height:
+            occupancy = pygame.mask.Mask((max(width, right), max(height, bottom)))
+            occupancy.draw(self.occupancy, (0, 0))
+            self.occupancy = occupancy
+
+    def place(self, new_sprites, word_bbox, xs, ys):
+        """Finds the first free candidate and commits the word there. Returns the center or None."""
+        center = self.find_free_position(new_sprites, word_bbox, xs, ys)
+        if center is not None:
+            self.commit(new_sprites, center, word_bbox)
+        return center
+
+    # --- Adaptive budgets and saturation ---
+
+    @property
+    def free_area_ratio(self):
+        """Fraction of the canvas not yet covered by placed letters (including their padding)."""
+        canvas_area = max(1, self.canvas_width * self.canvas_height)
+        return max(0.0, 1.0 - self.occupied_pixels / canvas_area)
+
+    @property
+    def saturated(self):
+        """True when most recent words failed, so smaller sizes or shorter words should be preferred."""
+        return self.adaptive and self.failure_rate >= SATURATION_FAILURE_RATE
+
+    def begin_group(self):
+        """Starts a new group of words (e.g. the next region) with fresh failure tracking."""
+        self.failure_rate = 0.0
+        self.consecutive_failures = 0
+
+    def attempt_budget(self, base_budget):
+        """Number of tries for the next word: the full budget while words keep fitting, less as they start failing."""
+        if not self.adaptive:
+            return base_budget
+        fraction = (1.0 - self.failure_rate) * min(1.0, self.free_area_ratio / LOW_FREE_AREA_RATIO)
+        return max(1, int(base_budget * max(MIN_BUDGET_FRACTION, fraction)))
+
+    def record_word(self, placed, attempts, budget, base_budget):
+        """Records the outcome of one word that used `attempts` of its `budget` tries."""
+        self.attempts_used += attempts
+        outcome = 0.0 if placed else 1.0
+        self.failure_rate += FAILURE_RATE_SMOOTHING * (outcome - self.failure_rate)
+        if placed:
+            self.words_placed += 1
+            self.consecutive_failures = 0
+        else:
+            self.words_failed += 1
+            self.consecutive_failures += 1
+            self.wasted_attempts += attempts
+            self.attempts_saved += base_budget - budget
+
+    def should_stop(self):
+        """True when the current group is saturated enough that further words are not worth trying."""
+        if not self.adaptive:
+            return False
+        if self.consecutive_failures >= self.stop_after_failures or self.free_area_ratio < MIN_FREE_AREA_RATIO:
+            self.early_stops += 1
+            return True
+        return False
+
+    def stats(self):
+        """Per-layout placement statistics."""
+        return {
+            'words_placed': self.words_placed,
+            'words_failed': self.words_failed,
+            'attempts_used': self.attempts_used,
+            'wasted_attempts': self.wasted_attempts,
+            'attempts_saved': self.attempts_saved,
+            'candidates_tested': self.candidates_tested,
+            'overlap_tests': self.overlap_tests,
+            'free_area_ratio': round(self.free_area_ratio, 4),
+            'early_stops': self.early_stops,
+        }
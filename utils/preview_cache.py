@@ -0,0 +1,258 @@
+import math
+import pygame
+from collections import OrderedDict
+from utils.font_utils import get_cached_font
+
+# Smallest edge a pyramid level may have; below this there is nothing left to gain
+MIN_LEVEL_SIZE = 16
+# Settings (as named by diff_configs) each cached preview layer is built from
+LAYER_SETTINGS = {
+    'mask': {'mask.grow_pixels'},
+}
+
+
+class ZoomPyramid:
+    """
+    A surface plus a lazily built mipmap pyramid (1, 1/2, 1/4, ...) of it.
+
+    Zoomed-out views are scaled from the nearest level that is still at least as
+    large as the target, which keeps the downscale cheap and avoids the aliasing
+    of a single large nearest-neighbour step. Scaled results are kept in a small
+    LRU keyed by target size, so panning, or zooming back to a recently used level,
+    never rescales.
+    """
+
+    def __init__(self, base_surface, max_cached_sizes=4):
+        self.base = base_surface
+        self.levels = [base_surface]
+        self.max_cached_sizes = max_cached_sizes
+        self._scaled = OrderedDict()
+        self._clipped_key = None
+        self._clipped = None
+        self.hits = 0
+        self.misses = 0
+
+    def _level_for(self, zoom):
+        """Smallest pyramid level whose scale is still >= zoom, building levels on demand."""
+        level_index = 0
+        scale = 1.0
+        while scale / 2 >= zoom:
+            if level_index + 1 >= len(self.levels):
+                previous = self.levels[-1]
+                width, height = previous.get_width() // 2, previous.get_height() // 2
+                if min(width, height) < MIN_LEVEL_SIZE:
+                    break
+                self.levels.append(pygame.transform.smoothscale(previous, (width, height)))
+            level_index += 1
+            scale /= 2
+        return self.levels[level_index]
+
+    def get_scaled(self, zoom):
+        """Return the surface scaled by `zoom` (served from cache when possible)."""
+        if abs(zoom - 1.0) <= 0.01:
+            return self.base
+
+        size = (max(1, int(self.base.get_width() * zoom)), max(1, int(self.base.get_height() * zoom)))
+        scaled = self._scaled.get(size)
+        if scaled is not None:
+            self._scaled.move_to_end(size)
+            self.hits += 1
+            return scaled
+
+        self.misses += 1
+        scaled = pygame.transform.scale(self._level_for(zoom), size)
+        self._scaled[size] = scaled
+        if len(self._scaled) > self.max_cached_sizes:
+            self._scaled.popitem(last=False)
+        return scaled
+
+    def get_clipped(self, zoom, origin, viewport):
+        """
+        Return (surface, position) for the part of the zoomed surface that is inside `viewport`.
+
+        `origin` is where the top-left of the full zoomed surface would be blitted and
+        `viewport` is the visible pygame.Rect in the same coordinates. When zoomed in,
+        only the source pixels under the viewport are scaled, so the cost depends on
+        the viewport size rather than on the zoom level. Returns (None, origin) when
+        nothing is visible.
+        """
+        if zoom <= 1.0 + 0.01:
+            return self.get_scaled(zoom), origin
+
+        base_width, base_height = self.base.get_size()
+        visible = pygame.Rect(origin, (int(base_width * zoom), int(base_height * zoom))).clip(viewport)
+        if visible.width == 0 or visible.height == 0:
+            return None, origin
+
+        # Source rectangle in base pixels, widened to whole pixels
+        x0 = max(0, math.floor((visible.left - origin[0]) / zoom))
+        y0 = max(0, math.floor((visible.top - origin[1]) / zoom))
+        x1 = min(base_width, math.ceil((visible.right - origin[0]) / zoom))
+        y1 = min(base_height, math.ceil((visible.bottom - origin[1]) / zoom))
+        position = (origin[0] + round(x0 * zoom), origin[1] + round(y0 * zoom))
+
+        # Pans smaller than one source pixel keep the same window, so only re-blit
+        key = (zoom, x0, y0, x1, y1)
+        if key == self._clipped_key:
+            self.hits += 1
+            return self._clipped, position
+
+        self.misses += 1
+        size = (max(1, round(x1 * zoom) - round(x0 * zoom)), max(1, round(y1 * zoom) - round(y0 * zoom)))
+        self._clipped = pygame.transform.scale(self.base.subsurface((x0, y0, x1 - x0, y1 - y0)), size)
+        self._clipped_key = key
+        return self._clipped, position
+
+
+class PreviewCache:
+    """
+    Named zoom pyramids for the composed preview layers (e.g. 'preview', 'mask').
+
+    Layers are built on first use with the given callback and reused until
+    `invalidate()` is called, typically when the layout or background changes.
+    """
+
+    def __init__(self):
+        self._pyramids = {}
+
+    def invalidate(self, name=None):
+        """Drop one layer, or every layer when `name` is None."""
+        if name is None:
+            self._pyramids.clear()
+        else:
+            self._pyramids.pop(name, None)
+
+    def invalidate_settings(self, changed, layer_settings=LAYER_SETTINGS):
+        """Drop the layers built from any of the `changed` settings; returns their names."""
+        stale = [name for name, settings in layer_settings.items() if settings & changed]
+        for name in stale:
+            self.invalidate(name)
+        return stale
+
+    def get_pyramid(self, name, build):
+        pyramid = self._pyramids.get(name)
+        if pyramid is None:
+            pyramid = ZoomPyramid(build())
+            self._pyramids[name] = pyramid
+        return pyramid
+
+    def get_scaled(self, name, build, zoom):
+        """Return layer `name` scaled by `zoom`, building it with `build()` if needed."""
+        return self.get_pyramid(name, build).get_scaled(zoom)
+
+    def get_clipped(self, name, build, zoom, origin, viewport):
+        """Return (surface, position) of layer `name` zoomed and clipped to `viewport`."""
+        return self.get_pyramid(name, build).get_clipped(zoom, origin, viewport)
+
+
+# Extra space around the zoomed image on the region layer so labels near the edges are not cut
+REGION_LABEL_MARGIN = 64
+
+# A region layer bigger than this many viewports is rasterized for the viewport only
+MAX_REGION_LAYER_VIEWPORTS = 4
+
+
+def region_image_points(region, image_size):
+    """Region polygon in preview-image pixels, honouring its 'fit' or 'stretch' placement mode."""
+    width, height = image_size
+    mode = region.get('rules', {}).get('placement_mode', 'stretch')
+
+    # 'fit' regions live on the centered square design canvas, 'stretch' ones on the full image
+    design_canvas_size = min(width, height)
+    design_canvas_offset_x = (width - design_canvas_size) // 2
+    design_canvas_offset_y = (height - design_canvas_size) // 2
+
+    points = []
+    for rel_x, rel_y in region['shape']:
+        if mode == 'fit':
+            points.append((int(rel_x * design_canvas_size + design_canvas_offset_x), int(rel_y * design_canvas_size + design_canvas_offset_y)))
+        else:
+            points.append((int(rel_x * width), int(rel_y * height)))
+    return points
+
+
+class RegionLayerCache:
+    """
+    The placement-region debug overlay (fills, outlines and labels) rasterized onto one layer.
+
+    The layer is rebuilt only when the regions, the preview size or the zoom change, so
+    a steady frame costs a single blit. When the zoomed layer would be much larger than
+    the viewport, only the viewport is rasterized and the pan becomes part of the key.
+    """
+
+    def __init__(self, fill_color=(255, 255, 0, 50), outline_color=(255, 255, 0, 200), label_color=(255, 255, 255), label_size=20):
+        self.fill_color = fill_color
+        self.outline_color = outline_color
+        self.label_color = label_color
+        self.label_size = label_size
+        self._font = None
+        self._key = None
+        self._layer = None
+        self._layer_offset = (0, 0)
+        self._follows_origin = True
+        self.builds = 0
+
+    def invalidate(self):
+        self._key = None
+        self._layer = None
+
+    @staticmethod
+    def _signature(regions):
+        return tuple(
+            (region['name'], region.get('rules', {}).get('placement_mode', 'stretch'), tuple(tuple(point) for point in region['shape']))
+            for region in regions
+        )
+
+    def get_layer(self, regions, image_size, zoom, origin, viewport):
+        """
+        Return (layer, position) for the overlay of `regions` on a preview image of
+        `image_size` drawn at `origin` with `zoom`, for the visible `viewport` rect.
+        """
+        zoomed_area = pygame.Rect(origin, (int(image_size[0] * zoom), int(image_size[1] * zoom)))
+        zoomed_area.inflate_ip(REGION_LABEL_MARGIN * 2, REGION_LABEL_MARGIN * 2)
+        follows_origin = zoomed_area.width * zoomed_area.height <= MAX_REGION_LAYER_VIEWPORTS * viewport.width * viewport.height
+
+        key = (self._signature(regions), tuple(image_size), zoom)
+        if not follows_origin:
+            key += (tuple(origin), tuple(viewport))
+
+        if key != self._key:
+            area = zoomed_area if follows_origin else pygame.Rect(viewport)
+            self._layer = self._rasterize(regions, image_size, zoom, (origin[0] - area.x, origin[1] - area.y), area.size)
+            self._layer_offset = (area.x - origin[0], area.y - origin[1]) if follows_origin else area.topleft
+            self._follows_origin = follows_origin
+            self._key = key
+            self.builds += 1
+
+        if self._follows_origin:
+            return self._layer, (origin[0] + self._layer_offset[0], origin[1] + self._layer_offset[1])
+        return self._layer, self._layer_offset
+
+    def _rasterize(self, regions, image_size, zoom, image_pos, size):
+        if self._font is None:
+            self._font = get_cached_font(None, self.label_size)
+
+        layer = pygame.Surface(size, pygame.SRCALPHA)
+        layer_rect = layer.get_rect()
+        for region in regions:
+            points = region_image_points(region, image_size)
+            if len(points) <= 2:
+                continue
+            layer_points = [(int(x * zoom) + image_pos[0], int(y * zoom) + image_pos[1]) for x, y in points]
+
+            # Each region is drawn on its own clipped surface and blended in, so overlaps stack like separate overlays
+            xs = [p[0] for p in layer_points]
+            ys = [p[1] for p in layer_points]
+            bounds = pygame.Rect(min(xs) - 2, min(ys) - 2, max(xs) - min(xs) + 5, max(ys) - min(ys) + 5).clip(layer_rect)
+            if bounds.width > 0 and bounds.height > 0:
+                local_points = [(x - bounds.x, y - bounds.y) for x, y in layer_points]
+                region_surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+                pygame.draw.polygon(region_surface, self.fill_color, local_points)
+                pygame.draw.polygon(region_surface, self.outline_color, local_points, 2)
+                layer.blit(region_surface, bounds.topleft)
+
+            # Label at the rough center of the polygon
+            label = self._font.render(region['name'], True, self.label_color)
+            center = (sum(xs) / len(xs), sum(ys) / len(ys))
+            layer.blit(label, label.get_rect(center=center))
+        return layer
@@ -0,0 +1,103 @@
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class PhaseStats:
+    """Call count, total time and a rolling window of recent durations for one phase."""
+
+    def __init__(self, window):
+        self.count = 0
+        self.total = 0.0
+        self.recent = deque(maxlen=window)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.recent.append(seconds)
+
+    def percentile(self, q):
+        """The q-th percentile (0-100) of the recent durations, nearest-rank."""
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        rank = max(0, min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1)))))
+        return ordered[rank]
+
+    def summary(self):
+        recent = len(self.recent)
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': sum(self.recent) / recent if recent else 0.0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'max': max(self.recent) if recent else 0.0,
+        }
+
+
+class PhaseProfiler:
+    """
+    Lightweight wall-clock instrumentation for named phases.
+
+    Wrap a block in `with profiler.phase('name'):` (or call `add` with a measured
+    duration) to count it and accumulate its time. Each phase keeps a rolling
+    window of its last `window` durations for averages and percentiles, so the
+    numbers follow recent behaviour rather than the whole session. The overhead
+    is two perf_counter calls per block, and nothing is recorded while disabled.
+    """
+
+    def __init__(self, window=200, enabled=True):
+        self.window = window
+        self.enabled = enabled
+        self._phases = {}
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name, seconds):
+        """Record one call of `name` that took `seconds`."""
+        if not self.enabled:
+            return
+        stats = self._phases.get(name)
+        if stats is None:
+            stats = PhaseStats(self.window)
+            self._phases[name] = stats
+        stats.add(seconds)
+
+    def get(self, name):
+        """Summary dict of one phase, or None if it has not run yet."""
+        stats = self._phases.get(name)
+        return stats.summary() if stats else None
+
+    def summary(self):
+        """Summary dicts of every phase, in the order they first ran."""
+        return {name: stats.summary() for name, stats in self._phases.items()}
+
+    def reset(self):
+        """Start over with no phases; returns the cleared ones for a later restore()."""
+        phases, self._phases = self._phases, {}
+        return phases
+
+    def restore(self, phases):
+        """Bring back the phases returned by reset(), dropping those recorded since."""
+        self._phases = phases
+
+
+# Global profiler instance
+_profiler = None
+
+def get_profiler():
+    """Get the shared phase profiler."""
+    global _profiler
+    if _profiler is None:
+        _profiler = PhaseProfiler()
+    return _profiler
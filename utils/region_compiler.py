@@ -0,0 +1,231 @@
+import math
+import random
+import numpy as np
+import pygame
+from collections import OrderedDict
+from .geometry_utils import point_in_polygon, points_in_polygon, points_in_polygons, polygon_signed_area, triangulate_polygon
+
+
+class CompiledRegion:
+    """
+    A placement region resolved to canvas pixels for one layout.
+
+    Holds the polygon in absolute canvas coordinates (honouring the region's
+    'fit' or 'stretch' placement mode), its bounding box and an area-weighted
+    triangulation, so uniform points inside the polygon can be drawn directly
+    instead of by rejection sampling in relative coordinates.
+    """
+
+    def __init__(self, region, canvas_width, canvas_height, canvas_offset_x, canvas_offset_y):
+        self.region = region
+        self.name = region['name']
+        self.rules = region.get('rules', {})
+        self.placement_mode = self.rules.get('placement_mode', 'stretch')
+
+        if self.placement_mode == 'fit':
+            # 'fit' regions live on the centered square design canvas
+            fit_canvas_size = min(canvas_width, canvas_height)
+            scale_x = scale_y = fit_canvas_size
+            origin_x = canvas_offset_x + (canvas_width - fit_canvas_size) // 2
+            origin_y = canvas_offset_y + (canvas_height - fit_canvas_size) // 2
+        else:  # stretch
+            scale_x, scale_y = canvas_width, canvas_height
+            origin_x, origin_y = canvas_offset_x, canvas_offset_y
+
+        self.points = [(rel_x * scale_x + origin_x, rel_y * scale_y + origin_y) for rel_x, rel_y in region['shape']]
+
+        if self.points:
+            xs = [p[0] for p in self.points]
+            ys = [p[1] for p in self.points]
+            self.bbox = pygame.Rect(int(min(xs)), int(min(ys)), int(max(xs)) - int(min(xs)), int(max(ys)) - int(min(ys)))
+        else:
+            self.bbox = pygame.Rect(0, 0, 0, 0)
+        self.area = abs(polygon_signed_area(self.points)) if len(self.points) >= 3 else 0.0
+
+        # Triangles with cumulative area weights for uniform sampling
+        self.triangles = triangulate_polygon(self.points)
+        self.cumulative_weights = []
+        if self.triangles:
+            total = 0.0
+            for a, b, c in self.triangles:
+                total += abs((b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])) / 2
+                self.cumulative_weights.append(total)
+
+    def contains(self, x, y):
+        """True if the canvas point (x, y) is inside the region's polygon."""
+        return point_in_polygon(x, y, self.points)
+
+    def contains_points(self, xs, ys):
+        """Vectorized contains() for arrays of canvas coordinates; returns a boolean array."""
+        return points_in_polygon(xs, ys, self.points)
+
+    def sample_point(self, rng=random, max_tries=10):
+        """
+        Returns a uniformly distributed integer canvas point inside the region, or None.
+
+        Non-simple (self-intersecting) polygons cannot be triangulated and fall back
+        to up to `max_tries` rejection samples in the bounding box.
+        """
+        if self.triangles:
+            a, b, c = rng.choices(self.triangles, cum_weights=self.cumulative_weights, k=1)[0]
+            r1, r2 = rng.random(), rng.random()
+            if r1 + r2 > 1:
+                r1, r2 = 1 - r1, 1 - r2
+            x = a[0] + r1 * (b[0] - a[0]) + r2 * (c[0] - a[0])
+            y = a[1] + r1 * (b[1] - a[1]) + r2 * (c[1] - a[1])
+            return (int(x), int(y))
+
+        if self.triangles is None and self.points:
+            xs = [p[0] for p in self.points]
+            ys = [p[1] for p in self.points]
+            for _ in range(max_tries):
+                x, y = rng.uniform(min(xs), max(xs)), rng.uniform(min(ys), max(ys))
+                if self.contains(x, y):
+                    return (int(x), int(y))
+        return None
+
+
+def compile_regions(regions, canvas_width, canvas_height, canvas_offset_x, canvas_offset_y):
+    """Compiles every placement region for the current canvas; call once per layout."""
+    return [CompiledRegion(region, canvas_width, canvas_height, canvas_offset_x, canvas_offset_y) for region in regions]
+
+
+def rules_allow(rules, text_type, size, default_size_range):
+    """True if a region's rules accept a word of this text type and font size."""
+    allowed_text_types = rules.get('text_types', ['any'])
+    if 'any' not in allowed_text_types and text_type not in allowed_text_types:
+        return False
+    min_size_rule, max_size_rule = rules.get('font_size_range', default_size_range)
+    return min_size_rule <= size <= max_size_rule
+
+
+class RegionRuleRaster:
+    """
+    A reduced-resolution lookup raster of which regions cover each part of the canvas.
+
+    The canvas is split into `cell_size` square cells. Every cell that lies fully
+    inside or outside each region gets a class id naming the set of regions covering
+    it, so the freeform rule check for a point becomes one array lookup. Cells crossed
+    by a polygon edge are flagged as boundary cells and fall back to exact ray casting,
+    so results are equivalent to testing every region directly up to raster resolution:
+    a sliver thinner than a cell that passes between cell corners is only seen in the
+    cells holding one of its vertices.
+    """
+
+    def __init__(self, compiled_regions, canvas_width, canvas_height, canvas_offset_x, canvas_offset_y, cell_size=4):
+        self.regions = compiled_regions
+        self.cell_size = cell_size
+        self.origin = (canvas_offset_x, canvas_offset_y)
+        self.grid_width = max(1, -(-canvas_width // cell_size))
+        self.grid_height = max(1, -(-canvas_height // cell_size))
+
+        # Classify the cell corners against every region at once
+        corner_xs = canvas_offset_x + np.arange(self.grid_width + 1) * cell_size
+        corner_ys = canvas_offset_y + np.arange(self.grid_height + 1) * cell_size
+        grid_xs, grid_ys = np.meshgrid(corner_xs, corner_ys)
+        corners = points_in_polygons(grid_xs, grid_ys, [region.points for region in compiled_regions])
+        all_in = corners[:, :-1, :-1] & corners[:, :-1, 1:] & corners[:, 1:, :-1] & corners[:, 1:, 1:]
+        any_in = corners[:, :-1, :-1] | corners[:, :-1, 1:] | corners[:, 1:, :-1] | corners[:, 1:, 1:]
+
+        # An edge crossing a cell either splits its corners or ends inside it, so corners
+        # that disagree plus cells holding a vertex cover every boundary cell
+        self.boundary = (any_in & ~all_in).any(axis=0)
+        for region in compiled_regions:
+            for x, y in region.points:
+                cell_x, cell_y = (x - canvas_offset_x) / cell_size, (y - canvas_offset_y) / cell_size
+                x0, x1 = max(0, math.floor(cell_x - 1e-9)), min(self.grid_width - 1, math.floor(cell_x + 1e-9))
+                y0, y1 = max(0, math.floor(cell_y - 1e-9)), min(self.grid_height - 1, math.floor(cell_y + 1e-9))
+                if x0 <= x1 and y0 <= y1:
+                    self.boundary[y0:y1 + 1, x0:x1 + 1] = True
+
+        # Each distinct set of covering regions becomes one class
+        if compiled_regions:
+            membership = all_in.reshape(len(compiled_regions), -1).T
+            self.class_members, class_ids = np.unique(membership, axis=0, return_inverse=True)
+            self.class_ids = class_ids.reshape(self.grid_height, self.grid_width)
+        else:
+            self.class_members = np.zeros((1, 0), dtype=bool)
+            self.class_ids = np.zeros((self.grid_height, self.grid_width), dtype=np.intp)
+
+    def _rejecting(self, text_type, size, default_size_range):
+        return np.array([not rules_allow(region.rules, text_type, size, default_size_range) for region in self.regions], dtype=bool)
+
+    def allowed_cells(self, text_type, size, default_size_range):
+        """Boolean (grid_height, grid_width) raster of cells where the word may be centered (boundary cells included)."""
+        rejecting = self._rejecting(text_type, size, default_size_range)
+        class_allowed = ~(self.class_members & rejecting).any(axis=1)
+        return class_allowed[self.class_ids] | self.boundary
+
+    def allows(self, xs, ys, text_type, size, default_size_range):
+        """
+        Vectorized rule check: for each canvas point, True unless it lies inside a region
+        whose rules reject a word of this text type and size.
+        """
+        xs = np.asarray(xs)
+        ys = np.asarray(ys)
+        rejecting = self._rejecting(text_type, size, default_size_range)
+        if not rejecting.any():
+            return np.ones(xs.shape, dtype=bool)
+
+        class_allowed = ~(self.class_members & rejecting).any(axis=1)
+        cell_xs = (xs - self.origin[0]) // self.cell_size
+        cell_ys = (ys - self.origin[1]) // self.cell_size
+        in_grid = (cell_xs >= 0) & (cell_xs < self.grid_width) & (cell_ys >= 0) & (cell_ys < self.grid_height)
+
+        allowed = np.zeros(xs.shape, dtype=bool)
+        exact = ~in_grid
+        cell_xs, cell_ys = cell_xs[in_grid].astype(np.intp), cell_ys[in_grid].astype(np.intp)
+        allowed[in_grid] = class_allowed[self.class_ids[cell_ys, cell_xs]]
+        exact[in_grid] = self.boundary[cell_ys, cell_xs]
+
+        if exact.any():
+            polys = [region.points for region, rejects in zip(self.regions, rejecting) if rejects]
+            allowed[exact] = ~points_in_polygons(xs[exact], ys[exact], polys).any(axis=0)
+        return allowed
+
+    def sample_points(self, rng, count, x_min, x_max, y_min, y_max, allowed_cells):
+        """
+        Draws up to `count` integer canvas points in [x_min, x_max] x [y_min, y_max], uniformly
+        over the cells marked in `allowed_cells`. Points falling outside the range are dropped,
+        so fewer than `count` may be returned. Returns (xs, ys) arrays, or None when no allowed
+        cell overlaps the range and sampling can never succeed.
+        """
+        cell_x0 = max(0, (x_min - self.origin[0]) // self.cell_size)
+        cell_x1 = min(self.grid_width - 1, (x_max - self.origin[0]) // self.cell_size)
+        cell_y0 = max(0, (y_min - self.origin[1]) // self.cell_size)
+        cell_y1 = min(self.grid_height - 1, (y_max - self.origin[1]) // self.cell_size)
+        if cell_x0 > cell_x1 or cell_y0 > cell_y1:
+            return None
+
+        window = allowed_cells[cell_y0:cell_y1 + 1, cell_x0:cell_x1 + 1]
+        cells = np.flatnonzero(window)
+        if len(cells) == 0:
+            return None
+
+        picked = rng.choice(cells, size=count)
+        xs = self.origin[0] + (cell_x0 + picked % window.shape[1]) * self.cell_size + rng.integers(0, self.cell_size, size=count)
+        ys = self.origin[1] + (cell_y0 + picked // window.shape[1]) * self.cell_size + rng.integers(0, self.cell_size, size=count)
+        in_range = (xs >= x_min) & (xs <= x_max) & (ys >= y_min) & (ys <= y_max)
+        return xs[in_range], ys[in_range]
+
+
+# Rasters are kept for the last few canvas/template combinations
+_rule_raster_cache = OrderedDict()
+MAX_CACHED_RULE_RASTERS = 4
+
+def get_region_rule_raster(compiled_regions, canvas_width, canvas_height, canvas_offset_x, canvas_offset_y, cell_size=4):
+    """Returns the rule raster for these regions and canvas, building it only once per canvas size and template."""
+    key = (
+        canvas_width, canvas_height, canvas_offset_x, canvas_offset_y, cell_size,
+        tuple((tuple(region.points), repr(region.rules)) for region in compiled_regions),
+    )
+    raster = _rule_raster_cache.get(key)
+    if raster is None:
+        raster = RegionRuleRaster(compiled_regions, canvas_width, canvas_height, canvas_offset_x, canvas_offset_y, cell_size)
+        _rule_raster_cache[key] = raster
+        if len(_rule_raster_cache) > MAX_CACHED_RULE_RASTERS:
+            _rule_raster_cache.popitem(last=False)
+    else:
+        raster.regions = compiled_regions
+        _rule_raster_cache.move_to_end(key)
+    return raster
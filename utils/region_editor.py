@@ -3,6 +3,7 @@ import pygame_gui
 import sys
 import math
 from .geometry_utils import point_in_polygon
+from .text_cache import get_text_cache
 from pygame_gui.elements import UIWindow, UIButton, UILabel, UITextEntryLine, UISelectionList, UIPanel, UIDropDownMenu
 from pygame_gui.windows import UIConfirmationDialog, UIMessageWindow
 
@@ -575,8 +576,6 @@ class RegionEditor:
 
     def draw_bottom_bar(self):
         """Draws the info bar at the bottom of the canvas area."""
-        info_font = pygame.font.Font(None, 20)
-        
         # Count fit mode regions
         fit_count = 0
         for region in self.regions:
@@ -593,7 +592,7 @@ class RegionEditor:
         if stretch_count > 0:
             info_text += f" | {stretch_count} stretch mode region(s)"
         
-        info_surf = info_font.render(info_text, True, self.colors['text'])
+        info_surf = get_text_cache().render(info_text, self.colors['text'], 20)
         info_x = self.bottom_toolbar.rect.x + 15
         info_y = self.bottom_toolbar.rect.y + (self.bottom_toolbar.rect.height - info_surf.get_height()) // 2
         self.screen.blit(info_surf, (info_x, info_y))
@@ -721,10 +720,9 @@ class RegionEditor:
                     center_y = sum(p[1] for p in points) / len(points)
                     
                     # Draw small mode indicator
-                    label_font = pygame.font.Font(None, 16)
                     mode_text = "FIT" if mode == 'fit' else "STR"
                     mode_color = (255, 255, 0) if mode == 'fit' else (200, 200, 200)
-                    mode_surf = label_font.render(mode_text, True, mode_color)
+                    mode_surf = get_text_cache().render(mode_text, mode_color, 16)
                     mode_rect = mode_surf.get_rect(center=(center_x, center_y))
                     
                     # Draw background for label
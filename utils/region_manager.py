@@ -100,42 +100,7 @@ class RegionManager:
             try:
                 with open(self.templates_file, 'r') as f:
                     templates = json.load(f)
-                    # Convert shape tuples to lists for consistency with JSON
-                    for template_name, regions in templates.items():
-                        for region in regions:
-                            region['shape'] = [list(p) for p in region['shape']]
-                            # Sanitize rules
-                            rules = region.get('rules', {})
-                            # Sanitize placement_mode
-                            mode = rules.get('placement_mode', 'stretch')
-                            if isinstance(mode, list) and mode:
-                                mode = mode[0]
-                            if not isinstance(mode, str) or mode not in ['stretch', 'fit']:
-                                mode = 'stretch'
-                            rules['placement_mode'] = mode
-                            # Sanitize text_type
-                            text_type_val = rules.get('text_type', 'any')
-                            if isinstance(text_type_val, list) and text_type_val:
-                                text_type_val = text_type_val[0]
-                            if not isinstance(text_type_val, str) or text_type_val not in ['any', 'normal', 'arc', 'asset']:
-                                text_type_val = 'any'
-                            rules['text_type'] = text_type_val
-                            # Sanitize size_range
-                            size_range = rules.get('size_range', [20, 50])
-                            if not isinstance(size_range, list) or len(size_range) != 2 or not all(isinstance(x, (int, float)) for x in size_range):
-                                size_range = [20, 50]
-                            else:
-                                min_val, max_val = map(int, size_range)
-                                size_range = [min(min_val, max_val), max(min_val, max_val)]
-                            rules['size_range'] = size_range
-                            # Sanitize word_count_range
-                            word_range = rules.get('word_count_range', [1, 3])
-                            if not isinstance(word_range, list) or len(word_range) != 2 or not all(isinstance(x, (int, float)) for x in word_range):
-                                word_range = [1, 3]
-                            else:
-                                min_val, max_val = map(int, word_range)
-                                word_range = [min(min_val, max_val), max(min_val, max_val)]
-                            rules['word_count_range'] = word_range
+                    self._sanitize_templates(templates)
                     console.log(f"Loaded {len(templates)} region templates from '{self.templates_file}'")
                     return templates
             except (json.JSONDecodeError, IOError) as e:
@@ -147,6 +112,64 @@ class RegionManager:
             self._save_default_templates()
             return DEFAULT_TEMPLATES
 
+    def _sanitize_templates(self, templates):
+        """Normalizes shapes and rules of templates read from JSON in place."""
+        # Convert shape tuples to lists for consistency with JSON
+        for template_name, regions in templates.items():
+            for region in regions:
+                region['shape'] = [list(p) for p in region['shape']]
+                # Sanitize rules
+                rules = region.get('rules', {})
+                # Sanitize placement_mode
+                mode = rules.get('placement_mode', 'stretch')
+                if isinstance(mode, list) and mode:
+                    mode = mode[0]
+                if not isinstance(mode, str) or mode not in ['stretch', 'fit']:
+                    mode = 'stretch'
+                rules['placement_mode'] = mode
+                # Sanitize text_type
+                text_type_val = rules.get('text_type', 'any')
+                if isinstance(text_type_val, list) and text_type_val:
+                    text_type_val = text_type_val[0]
+                if not isinstance(text_type_val, str) or text_type_val not in ['any', 'normal', 'arc', 'asset']:
+                    text_type_val = 'any'
+                rules['text_type'] = text_type_val
+                # Sanitize size_range
+                size_range = rules.get('size_range', [20, 50])
+                if not isinstance(size_range, list) or len(size_range) != 2 or not all(isinstance(x, (int, float)) for x in size_range):
+                    size_range = [20, 50]
+                else:
+                    min_val, max_val = map(int, size_range)
+                    size_range = [min(min_val, max_val), max(min_val, max_val)]
+                rules['size_range'] = size_range
+                # Sanitize word_count_range
+                word_range = rules.get('word_count_range', [1, 3])
+                if not isinstance(word_range, list) or len(word_range) != 2 or not all(isinstance(x, (int, float)) for x in word_range):
+                    word_range = [1, 3]
+                else:
+                    min_val, max_val = map(int, word_range)
+                    word_range = [min(min_val, max_val), max(min_val, max_val)]
+                rules['word_count_range'] = word_range
+
+    def reload_templates(self):
+        """
+        Re-reads the templates file after it changed on disk. Returns True if the
+        templates differ from the loaded ones; a missing or unreadable file (e.g. half
+        written) keeps the current templates and is never replaced by the defaults.
+        """
+        try:
+            with open(self.templates_file, 'r') as f:
+                templates = json.load(f)
+            self._sanitize_templates(templates)
+        except (json.JSONDecodeError, IOError, KeyError, TypeError, AttributeError) as e:
+            console.log(f"[red]Could not reload templates file: {e}. Keeping the current templates.[/red]")
+            return False
+        if templates == self.templates:
+            return False
+        self.templates = templates
+        console.log(f"Reloaded {len(templates)} region templates from '{self.templates_file}'")
+        return True
+
     def _save_default_templates(self):
         """Saves the hardcoded default templates to the JSON file."""
         try:
@@ -1,10 +1,18 @@
 import pygame
 import os
 import datetime
-import math
 from PIL import Image
-import cv2
 import numpy as np
+from utils.compositing import composite_over, tint_with_mask
+from utils.image_utils import grow_binary_mask_pil, grow_binary_mask_array
+from utils.tiled_render import prepare_glyphs, save_tiled_outputs
+from utils.config_manager import get_config
+from utils.profiler import get_profiler
+
+try:
+    import cv2
+except ImportError:  # OpenCV is optional; the 'opencv' backend falls back to 'numpy' without it
+    cv2 = None
 
 def pygame_surface_to_pil_image(surface):
     """
@@ -19,89 +27,159 @@ def pygame_surface_to_pil_image(surface):
     else:
         return Image.frombytes('RGB', surface.get_size(), pygame.image.tobytes(surface, 'RGB', mirrored=True))
 
-def render_high_quality_layout(original_image, placed_sprites, preview_canvas_size, preview_canvas_offsets, get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION):
-    """Renders the final layout at full resolution onto a new surface with font caching and word-level rendering."""
-    
-    original_width, original_height = original_image.size
-    preview_width, preview_height = preview_canvas_size
-    preview_offset_x, preview_offset_y = preview_canvas_offsets
+# ---------------------------------------------------------------------------
+# Export backends
+# ---------------------------------------------------------------------------
+# Every backend receives the same rendered glyphs and uses the same fixed-point
+# compositing kernels, so outputs are pixel-identical. Backends only differ in
+# how the mask is grown and how the images are encoded.
+
+class ExportBackend:
+    """Base class for export backends. Arrays are uint8, (h, w) for masks and (h, w, 3) RGB for images."""
+
+    name = None
+
+    def grow_mask(self, mask, grow_pixels):
+        raise NotImplementedError
+
+    def write_image(self, path, pixels):
+        raise NotImplementedError
+
+
+class PygameExportBackend(ExportBackend):
+    """Reference backend: PIL MaxFilter for mask growth and pygame's PNG encoder."""
+
+    name = 'pygame'
+
+    def grow_mask(self, mask, grow_pixels):
+        if grow_pixels <= 0:
+            return mask
+        height, width = mask.shape
+        mask_surface = pygame.image.frombytes(np.repeat(mask[:, :, None], 3, axis=2).tobytes(), (width, height), 'RGB')
+        grown = grow_binary_mask_pil(mask_surface, grow_pixels)
+        return np.frombuffer(pygame.image.tobytes(grown, 'RGB'), dtype=np.uint8).reshape(height, width, 3)[:, :, 0]
+
+    def write_image(self, path, pixels):
+        height, width = pixels.shape[:2]
+        if pixels.ndim == 2:
+            pixels = np.repeat(pixels[:, :, None], 3, axis=2)
+        pygame.image.save(pygame.image.frombuffer(np.ascontiguousarray(pixels).tobytes(), (width, height), 'RGB'), path)
+
+
+class NumpyExportBackend(ExportBackend):
+    """Separable NumPy dilation for mask growth and PIL's PNG encoder."""
+
+    name = 'numpy'
+
+    def grow_mask(self, mask, grow_pixels):
+        return grow_binary_mask_array(mask, grow_pixels)
+
+    def write_image(self, path, pixels):
+        Image.fromarray(pixels).save(path)
+
 
-    # Use width for scaling factor to handle different aspect ratios consistently
-    scale_factor = original_width / preview_width
+class OpenCVExportBackend(ExportBackend):
+    """cv2.dilate for mask growth and cv2.imwrite for encoding. Requires opencv-python."""
 
-    # Create new, large surfaces for drawing the high-res output
+    name = 'opencv'
+
+    def grow_mask(self, mask, grow_pixels):
+        if grow_pixels <= 0:
+            return mask
+        binary = np.where(mask > 128, 255, 0).astype(np.uint8)
+        kernel = np.ones((grow_pixels * 2 + 1, grow_pixels * 2 + 1), np.uint8)
+        return cv2.dilate(binary, kernel, iterations=1)
+
+    def write_image(self, path, pixels):
+        if pixels.ndim == 3:
+            pixels = cv2.cvtColor(pixels, cv2.COLOR_RGB2BGR)
+        cv2.imwrite(path, pixels)
+
+
+EXPORT_BACKENDS = {
+    PygameExportBackend.name: PygameExportBackend,
+    NumpyExportBackend.name: NumpyExportBackend,
+    OpenCVExportBackend.name: OpenCVExportBackend,
+}
+
+def get_available_backends():
+    """Names of the backends that can run in this environment."""
+    return [name for name in EXPORT_BACKENDS if name != 'opencv' or cv2 is not None]
+
+def get_export_backend(name):
+    """Return a backend instance by name, falling back to 'numpy' if it is unknown or unavailable."""
+    if name not in get_available_backends():
+        print(f"Warning: Export backend '{name}' is not available. Falling back to 'numpy'.")
+        name = 'numpy'
+    return EXPORT_BACKENDS[name]()
+
+# ---------------------------------------------------------------------------
+# Rendering and export
+# ---------------------------------------------------------------------------
+
+def render_high_quality_layout(original_image, placed_sprites, preview_canvas_size, preview_canvas_offsets, get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION):
+    """Renders the final layout at full resolution onto a new overlay surface and mask surface."""
     overlay_surface = pygame.Surface(original_image.size, pygame.SRCALPHA)
     mask_surface = pygame.Surface(original_image.size)
     mask_surface.fill((0, 0, 0))
 
-    # Group sprites by word for more efficient rendering
-    word_groups = {}
-    for sprite in placed_sprites:
-        # Create a word identifier based on position and properties
-        word_key = (sprite.font_path, sprite.font_size, sprite.color, sprite.text_type)
-        if word_key not in word_groups:
-            word_groups[word_key] = []
-        word_groups[word_key].append(sprite)
-
-    # Render each word group
-    for word_key, sprites in word_groups.items():
-        font_path, font_size, color, text_type = word_key
-        
-        # Load font once for the entire word
-        high_res_font_size = int(font_size * scale_factor)
-        if high_res_font_size < 1: 
-            high_res_font_size = 1
-        
-        high_res_font = get_cached_font(font_path, high_res_font_size)
-        
-        # Render each character in the word
-        for sprite in sprites:
-            try:
-                # 3. Render the character for both overlay and mask
-                overlay_char_surf = high_res_font.render(sprite.char, True, color)
-                mask_char_surf = high_res_font.render(sprite.char, True, (255, 255, 255))
-                
-                # 4. Scale position and apply rotation if it's an arc letter
-                relative_center_x = sprite.rect.centerx - preview_offset_x
-                relative_center_y = sprite.rect.centery - preview_offset_y
-                
-                high_res_center_x = int(relative_center_x * scale_factor)
-                high_res_center_y = int(relative_center_y * scale_factor)
-
-                # Get the rect of the newly rendered high-res character, centered on the new scaled position
-                high_res_rect = overlay_char_surf.get_rect(center=(high_res_center_x, high_res_center_y))
-
-                final_overlay_surf = overlay_char_surf
-                final_mask_surf = mask_char_surf
-
-                # Re-apply rotation for arc letters at high resolution
-                if sprite.text_type == 'arc' and ROTATE_LETTERS_ON_ARC:
-                    rotation_deg = -math.degrees(sprite.angle_rad) - 90
-                    normalized_rotation = (rotation_deg + 180) % 360 - 180
-                    clamped_rotation = max(-MAX_ARC_LETTER_ROTATION, min(MAX_ARC_LETTER_ROTATION, normalized_rotation))
-                    
-                    # Rotate the high-res surfaces
-                    final_overlay_surf = pygame.transform.rotate(overlay_char_surf, clamped_rotation)
-                    final_mask_surf = pygame.transform.rotate(mask_char_surf, clamped_rotation)
-                    
-                    # Update rect to keep it centered after rotation
-                    high_res_rect = final_overlay_surf.get_rect(center=high_res_rect.center)
-
-                # 5. Blit the final character onto the large surfaces
-                overlay_surface.blit(final_overlay_surf, high_res_rect)
-                mask_surface.blit(final_mask_surf, high_res_rect)
-
-            except Exception as e:
-                print(f"Warning: Could not render high-res char '{sprite.char}' from font {sprite.font_path}. Reason: {e}")
+    for glyph in prepare_glyphs(original_image.size, placed_sprites, preview_canvas_size, preview_canvas_offsets, get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION):
+        overlay_surface.blit(glyph.overlay_surf, glyph.rect)
+        mask_surface.blit(glyph.mask_surf, glyph.rect)
 
     return overlay_surface, mask_surface
 
-def save_output(placed_sprites_cache, SCRIPT_DIR, current_background_image, current_image_index, current_image_directory, original_pil_image, get_canvas_dimensions, get_canvas_offsets, pil_to_pygame_surface, MASK_GROW_PIXELS, grow_binary_mask_pil, create_final_mask_surface, get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION, screen, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT, image_index=None):
+def export_layout(original_image, placed_sprites, preview_canvas_size, preview_canvas_offsets, before_path, after_path, debug_path, get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION, mask_grow_pixels, backend, tiled_min_megapixels=None, tile_height=1024):
+    """
+    Render, composite and encode the before, after and debug images of a layout.
+
+    Outputs at or above `tiled_min_megapixels` are produced band by band by the
+    tiled renderer; everything else is rendered full-frame and encoded by `backend`.
+    """
+    profiler = get_profiler()
+    width, height = original_image.size
+    if tiled_min_megapixels is not None and (width * height) / 1_000_000 >= tiled_min_megapixels:
+        # Bands interleave rendering, growing and encoding, so the tiled path is timed as a whole
+        with profiler.phase('export_tiled'):
+            return save_tiled_outputs(original_image, placed_sprites, preview_canvas_size, preview_canvas_offsets, before_path, after_path, debug_path, get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION, mask_grow_pixels, band_height=tile_height, grow_mask=backend.grow_mask)
+
+    with profiler.phase('render_high_res'):
+        overlay_surf, mask_surf = render_high_quality_layout(original_image, placed_sprites, preview_canvas_size, preview_canvas_offsets, get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION)
+
+    # "after": the black and white mask
+    with profiler.phase('mask_grow'):
+        mask = np.ascontiguousarray(np.frombuffer(pygame.image.tobytes(mask_surf, 'RGB'), dtype=np.uint8).reshape(height, width, 3)[:, :, 0])
+        del mask_surf
+        mask = backend.grow_mask(mask, mask_grow_pixels)
+    with profiler.phase('encode'):
+        backend.write_image(after_path, mask)
+
+    # "before": original with the text overlay, composited in place on one uint8 buffer
+    with profiler.phase('composite'):
+        composite = np.array(original_image.convert('RGB'))
+        overlay_rgba = np.frombuffer(pygame.image.tobytes(overlay_surf, 'RGBA'), dtype=np.uint8).reshape(height, width, 4)
+        del overlay_surf
+        composite_over(composite, overlay_rgba)
+    with profiler.phase('encode'):
+        backend.write_image(before_path, composite)
+
+    # "debug": the same buffer with the mask blended on top at 70% opacity
+    with profiler.phase('composite'):
+        tint_with_mask(composite, mask)
+    with profiler.phase('encode'):
+        backend.write_image(debug_path, composite)
+
+    return True
+
+def save_output(placed_sprites_cache, SCRIPT_DIR, current_background_image, current_image_index, current_image_directory, original_pil_image, get_canvas_dimensions, get_canvas_offsets, pil_to_pygame_surface, MASK_GROW_PIXELS, grow_binary_mask_pil, create_final_mask_surface, get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION, screen, MAIN_AREA_WIDTH, MAIN_AREA_HEIGHT, image_index=None, export_config=None):
     """Saves the current text overlay, mask, and a debug overlay to the 'out' directory with optimizations."""
     if not placed_sprites_cache:
         # Don't save if there's nothing to save
         return False
 
+    if export_config is None:
+        export_config = get_config().export
+
     try:
         # 1. Define and create output directories
         out_dir = os.path.join(SCRIPT_DIR, "out")
@@ -118,72 +196,31 @@ def save_output(placed_sprites_cache, SCRIPT_DIR, current_background_image, curr
             image_part = os.path.splitext(os.path.basename(current_image_directory[current_image_index]))[0]
         else:
             image_part = "layout"
-        
+
         # Add image index if provided for batch processing
         if image_index is not None:
             base_name = f"{timestamp}_{image_part}_{image_index:03d}"
         else:
             base_name = f"{timestamp}_{image_part}"
 
-        # --- High-Resolution Saving with OpenCV ---
+        # --- High-Resolution Saving ---
         if original_pil_image:
-            # 1. Render the high-quality layout using the existing Pygame-based function
             preview_canvas_size = get_canvas_dimensions()
             if current_background_image:
                 canvas_offset_x, canvas_offset_y = get_canvas_offsets(current_background_image.size)
             else:
                 canvas_offset_x, canvas_offset_y = 0, 0
 
-            overlay_surf, mask_surf = render_high_quality_layout(original_pil_image, placed_sprites_cache, preview_canvas_size, (canvas_offset_x, canvas_offset_y), get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION)
-
-            # --- Convert all assets to OpenCV/NumPy format upfront ---
-            
-            # Original image (PIL to NumPy, RGB to BGR)
-            original_cv = cv2.cvtColor(np.array(original_pil_image), cv2.COLOR_RGB2BGR)
-
-            # Mask surface (Pygame to NumPy grayscale)
-            mask_bytes = pygame.image.tobytes(mask_surf, 'L')
-            mask_cv = np.frombuffer(mask_bytes, dtype=np.uint8).reshape(mask_surf.get_height(), mask_surf.get_width())
-
-            # Overlay surface (Pygame to NumPy RGBA, then to BGRA for OpenCV)
-            overlay_bytes = pygame.image.tobytes(overlay_surf, 'RGBA')
-            overlay_np_rgba = np.frombuffer(overlay_bytes, dtype=np.uint8).reshape(overlay_surf.get_height(), overlay_surf.get_width(), 4)
-            overlay_cv_bgra = cv2.cvtColor(overlay_np_rgba, cv2.COLOR_RGBA2BGRA)
-
-            # --- Grow the mask with OpenCV (replaces slow PIL filter) ---
-            if MASK_GROW_PIXELS > 0:
-                kernel = np.ones((MASK_GROW_PIXELS * 2 + 1, MASK_GROW_PIXELS * 2 + 1), np.uint8)
-                mask_cv = cv2.dilate(mask_cv, kernel, iterations=1)
-
-            # 2. Save the "after" mask using fast cv2.imwrite
-            after_path = os.path.join(after_dir, f"{base_name}.png")
-            cv2.imwrite(after_path, mask_cv)
-
-            # 3. Composite and save the "before" image using NumPy
-            # Extract BGR and alpha channels from overlay
-            overlay_bgr = overlay_cv_bgra[:, :, :3]
-            alpha = overlay_cv_bgra[:, :, 3:] / 255.0 # Normalize alpha to 0-1 range
-
-            # Perform alpha blending
-            before_cv = original_cv * (1 - alpha) + overlay_bgr * alpha
-            before_cv = before_cv.astype(np.uint8)
-            
-            before_path = os.path.join(before_dir, f"{base_name}.png")
-            cv2.imwrite(before_path, before_cv)
-
-            # 4. Composite and save the "debug" image
-            debug_cv = before_cv.copy()
-            tint_alpha = 0.7  # ~70% opacity for the mask overlay
-            mask_area = mask_cv > 0
-            
-            # Darken the areas under the mask
-            debug_cv[mask_area] = debug_cv[mask_area] * (1.0 - tint_alpha)
-            debug_cv = debug_cv.astype(np.uint8)
-            
-            debug_path = os.path.join(debug_dir, f"{base_name}.png")
-            cv2.imwrite(debug_path, debug_cv)
-
-            return True
+            return export_layout(
+                original_pil_image, placed_sprites_cache, preview_canvas_size, (canvas_offset_x, canvas_offset_y),
+                os.path.join(before_dir, f"{base_name}.png"),
+                os.path.join(after_dir, f"{base_name}.png"),
+                os.path.join(debug_dir, f"{base_name}.png"),
+                get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION, MASK_GROW_PIXELS,
+                get_export_backend(export_config.backend),
+                tiled_min_megapixels=export_config.tiled_min_megapixels,
+                tile_height=export_config.tile_height,
+            )
 
         # --- Fallback to Low-Resolution Saving (if no background image) ---
         # This part remains the same as it's already fast enough for screen-resolution images.
@@ -194,7 +231,7 @@ def save_output(placed_sprites_cache, SCRIPT_DIR, current_background_image, curr
         # 4. Save the "after" image (black and white mask)
         after_path = os.path.join(after_dir, f"{base_name}.png")
         canvas_width, canvas_height = get_canvas_dimensions()
-        
+
         # Use the helper function to get offsets
         if current_background_image:
             canvas_offset_x, canvas_offset_y = get_canvas_offsets(current_background_image.size)
@@ -203,9 +240,9 @@ def save_output(placed_sprites_cache, SCRIPT_DIR, current_background_image, curr
 
         mask_to_save = create_final_mask_surface(placed_sprites_cache, canvas_width, canvas_height, canvas_offset_x, canvas_offset_y)
         pygame.image.save(mask_to_save, after_path)
-        
+
         return True
 
     except Exception as e:
         print(f"ERROR: Failed to save output: {e}")
-        return False 
\ No newline at end of file
+        return False
@@ -0,0 +1,49 @@
+import queue
+import threading
+import time
+
+
+class StartupTasks:
+    """
+    Runs the slow parts of startup (directory scans, file loading, image decoding)
+    on background threads so the window can show its first frame immediately.
+
+    Each task is a named callable without arguments and gets its own daemon thread.
+    Results are handed back through `poll()` as (name, result, seconds), in the order
+    they finish; a task that raises yields its exception as the result. Applying a
+    result (globals, pygame surfaces, UI) is left to the caller on the main thread.
+    """
+
+    def __init__(self, tasks):
+        self.tasks = list(tasks)
+        self.pending = {name for name, _ in self.tasks}
+        self._results = queue.Queue()
+
+    def start(self):
+        for name, task in self.tasks:
+            threading.Thread(target=self._run, args=(name, task), name=f"startup-{name}", daemon=True).start()
+        return self
+
+    def _run(self, name, task):
+        start = time.perf_counter()
+        try:
+            result = task()
+        except Exception as e:
+            result = e
+        self._results.put((name, result, time.perf_counter() - start))
+
+    def poll(self, block=False):
+        """Tasks finished since the last call; with `block`, waits until every task has finished."""
+        finished = []
+        while self.pending:
+            try:
+                name, result, seconds = self._results.get(block=block)
+            except queue.Empty:
+                break
+            self.pending.discard(name)
+            finished.append((name, result, seconds))
+        return finished
+
+    @property
+    def done(self):
+        return not self.pending
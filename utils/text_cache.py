@@ -0,0 +1,62 @@
+import pygame
+from collections import OrderedDict
+from utils.font_utils import font_loading_lock
+
+
+class UITextCache:
+    """
+    Fonts and rendered text surfaces for UI labels drawn every frame.
+
+    Fonts are created once per size and rendered surfaces are memoized by
+    (text, color, size), so a label is only rasterized again when its string
+    changes. The least recently used surfaces are dropped past `max_surfaces`,
+    which keeps frequently changing strings (timers, counters) from growing the cache.
+    """
+
+    def __init__(self, font_path=None, max_surfaces=256):
+        self.font_path = font_path
+        self.max_surfaces = max_surfaces
+        self._fonts = {}
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, size):
+        font = self._fonts.get(size)
+        if font is None:
+            # Fonts may be opened on background threads too (font warm-up); SDL_ttf needs that serialized
+            with font_loading_lock():
+                font = pygame.font.Font(self.font_path, size)
+            self._fonts[size] = font
+        return font
+
+    def render(self, text, color, size):
+        """Return an antialiased surface of `text`, rendering it only on first use."""
+        key = (text, tuple(color), size)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.get_font(size).render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_surfaces:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._fonts.clear()
+        self._surfaces.clear()
+
+
+# Global text cache instance
+_text_cache = None
+
+def get_text_cache():
+    """Get the shared UI text cache."""
+    global _text_cache
+    if _text_cache is None:
+        _text_cache = UITextCache()
+    return _text_cache
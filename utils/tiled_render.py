@@ -0,0 +1,237 @@
+import pygame
+import math
+import zlib
+import struct
+import bisect
+from collections import namedtuple
+import numpy as np
+from utils.image_utils import grow_binary_mask_array
+from utils.compositing import composite_over, tint_with_mask
+
+# A single high-resolution glyph (or asset) ready to be blitted into any band.
+GlyphPlacement = namedtuple('GlyphPlacement', ['overlay_surf', 'mask_surf', 'rect'])
+
+
+class StreamingPNGWriter:
+    """
+    Minimal PNG encoder that accepts image rows in bands.
+
+    Only the current band and the zlib stream state are held in memory, so an
+    arbitrarily tall image can be written without materialising it. Rows are
+    written with the PNG 'Sub' filter, which is cheap to compute with NumPy and
+    compresses photographic content noticeably better than no filter at all.
+    """
+
+    _COLOR_TYPES = {'L': (0, 1), 'RGB': (2, 3), 'RGBA': (6, 4)}
+
+    def __init__(self, path, width, height, mode='RGB', compress_level=6):
+        if mode not in self._COLOR_TYPES:
+            raise ValueError(f"Unsupported PNG mode '{mode}'")
+        self.path = path
+        self.width = width
+        self.height = height
+        self.mode = mode
+        self.color_type, self.bytes_per_pixel = self._COLOR_TYPES[mode]
+        self.rows_written = 0
+        self._compressor = zlib.compressobj(compress_level)
+        self._file = open(path, 'wb')
+        self._file.write(b'\x89PNG\r\n\x1a\n')
+        self._write_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, self.color_type, 0, 0, 0))
+
+    def _write_chunk(self, chunk_type, data):
+        self._file.write(struct.pack('>I', len(data)))
+        self._file.write(chunk_type)
+        self._file.write(data)
+        self._file.write(struct.pack('>I', zlib.crc32(data, zlib.crc32(chunk_type)) & 0xFFFFFFFF))
+
+    def write_rows(self, rows):
+        """Append a band of rows, given as a uint8 array of shape (h, w) or (h, w, channels)."""
+        rows = np.asarray(rows, dtype=np.uint8)
+        band_height = rows.shape[0]
+        if band_height == 0:
+            return
+        if self.rows_written + band_height > self.height:
+            raise ValueError("More rows written than declared in the PNG header")
+
+        stride = self.width * self.bytes_per_pixel
+        rows = rows.reshape(band_height, stride)
+
+        # Filter byte (1 = Sub) followed by the byte-wise difference to the pixel on the left
+        filtered = np.empty((band_height, stride + 1), dtype=np.uint8)
+        filtered[:, 0] = 1
+        filtered[:, 1:self.bytes_per_pixel + 1] = rows[:, :self.bytes_per_pixel]
+        np.subtract(rows[:, self.bytes_per_pixel:], rows[:, :-self.bytes_per_pixel], out=filtered[:, self.bytes_per_pixel + 1:])
+
+        compressed = self._compressor.compress(filtered.tobytes())
+        if compressed:
+            self._write_chunk(b'IDAT', compressed)
+        self.rows_written += band_height
+
+    def close(self):
+        """Flush the compressed stream and finish the file."""
+        if self._file is None:
+            return
+        try:
+            if self.rows_written != self.height:
+                raise ValueError(f"PNG expects {self.height} rows but {self.rows_written} were written")
+            self._write_chunk(b'IDAT', self._compressor.flush())
+            self._write_chunk(b'IEND', b'')
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and self._file is not None:
+            # Don't try to validate a half-written image, just release the handle
+            self._file.close()
+            self._file = None
+            return False
+        self.close()
+        return False
+
+
+def _surface_rows(surface, mode):
+    """Return the pixels of a (band-sized) surface as a row-major uint8 array."""
+    width, height = surface.get_size()
+    data = pygame.image.tobytes(surface, 'RGB')
+    rows = np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+    if mode == 'L':
+        # Masks are pure greyscale, any channel holds the value
+        return rows[:, :, 0]
+    return rows
+
+
+def prepare_glyphs(original_size, placed_sprites, preview_canvas_size, preview_canvas_offsets, get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION):
+    """
+    Render every placed glyph and asset once at output resolution.
+
+    Returns a list of GlyphPlacement sorted by the top edge of their rect. The
+    glyph surfaces are small compared to the output image, so keeping them around
+    lets every band blit only the glyphs that intersect it.
+    """
+    original_width, original_height = original_size
+    preview_width, preview_height = preview_canvas_size
+    preview_offset_x, preview_offset_y = preview_canvas_offsets
+
+    # Use width for scaling factor to handle different aspect ratios consistently
+    scale_factor = original_width / preview_width
+
+    glyphs = []
+    for sprite in placed_sprites:
+        relative_center_x = sprite.rect.centerx - preview_offset_x
+        relative_center_y = sprite.rect.centery - preview_offset_y
+        high_res_center = (int(relative_center_x * scale_factor), int(relative_center_y * scale_factor))
+
+        if sprite.text_type == 'asset':
+            try:
+                asset_image = pygame.image.load(sprite.font_path).convert_alpha()
+                high_res_height = int(sprite.font_size * scale_factor)
+                original_asset_width, original_asset_height = asset_image.get_size()
+                if original_asset_height == 0:
+                    continue
+                high_res_width = int(original_asset_width * (high_res_height / original_asset_height))
+                scaled_asset = pygame.transform.smoothscale(asset_image, (high_res_width, high_res_height))
+
+                asset_mask = pygame.mask.from_surface(scaled_asset, 127)
+                mask_surf = asset_mask.to_surface(setcolor=(255, 255, 255), unsetcolor=(0, 0, 0, 0))
+                mask_surf.set_colorkey((0, 0, 0))
+                glyphs.append(GlyphPlacement(scaled_asset, mask_surf, scaled_asset.get_rect(center=high_res_center)))
+            except Exception as e:
+                print(f"Warning: Could not render high-res asset '{sprite.font_path}'. Reason: {e}")
+            continue
+
+        try:
+            high_res_font_size = max(1, int(sprite.font_size * scale_factor))
+            high_res_font = get_cached_font(sprite.font_path, high_res_font_size)
+
+            overlay_char_surf = high_res_font.render(sprite.char, True, sprite.color)
+            mask_char_surf = high_res_font.render(sprite.char, True, (255, 255, 255))
+
+            # Re-apply rotation for arc letters at high resolution
+            if sprite.text_type == 'arc' and ROTATE_LETTERS_ON_ARC:
+                rotation_deg = -math.degrees(sprite.angle_rad) - 90
+                normalized_rotation = (rotation_deg + 180) % 360 - 180
+                clamped_rotation = max(-MAX_ARC_LETTER_ROTATION, min(MAX_ARC_LETTER_ROTATION, normalized_rotation))
+                overlay_char_surf = pygame.transform.rotate(overlay_char_surf, clamped_rotation)
+                mask_char_surf = pygame.transform.rotate(mask_char_surf, clamped_rotation)
+
+            glyphs.append(GlyphPlacement(overlay_char_surf, mask_char_surf, overlay_char_surf.get_rect(center=high_res_center)))
+        except Exception as e:
+            print(f"Warning: Could not render high-res char '{sprite.char}' from font {sprite.font_path}. Reason: {e}")
+
+    glyphs.sort(key=lambda g: g.rect.top)
+    return glyphs
+
+
+class _GlyphIndex:
+    """Finds the glyphs that intersect a horizontal band without scanning all of them."""
+
+    def __init__(self, glyphs):
+        self.glyphs = glyphs
+        self.tops = [g.rect.top for g in glyphs]
+        self.max_height = max((g.rect.height for g in glyphs), default=0)
+
+    def intersecting(self, y0, y1):
+        start = bisect.bisect_left(self.tops, y0 - self.max_height)
+        end = bisect.bisect_left(self.tops, y1)
+        return [g for g in self.glyphs[start:end] if g.rect.bottom > y0]
+
+
+def _render_mask_band(glyph_index, width, y0, y1):
+    """Render the (ungrown) black and white mask for rows y0..y1."""
+    mask_band = pygame.Surface((width, y1 - y0))
+    mask_band.fill((0, 0, 0))
+    for glyph in glyph_index.intersecting(y0, y1):
+        mask_band.blit(glyph.mask_surf, glyph.rect.move(0, -y0))
+    return mask_band
+
+
+def save_tiled_outputs(original_image, placed_sprites, preview_canvas_size, preview_canvas_offsets, before_path, after_path, debug_path, get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION, mask_grow_pixels, band_height=1024, grow_mask=grow_binary_mask_array):
+    """
+    Compose and encode the before, after and debug images in horizontal bands.
+
+    Produces the same pixels as rendering the full-size overlay and mask, but
+    peak memory is bounded by the band size instead of the source resolution.
+    Mask growth is computed on the band plus a halo of `mask_grow_pixels` rows
+    on each side, so the dilation is exact across band seams. `grow_mask` takes
+    and returns a uint8 (h, w) mask array, so any export backend's dilation fits.
+    """
+    width, height = original_image.size
+    band_height = max(1, int(band_height))
+    grow = max(0, int(mask_grow_pixels))
+
+    glyph_index = _GlyphIndex(prepare_glyphs(original_image.size, placed_sprites, preview_canvas_size, preview_canvas_offsets, get_cached_font, ROTATE_LETTERS_ON_ARC, MAX_ARC_LETTER_ROTATION))
+
+    with StreamingPNGWriter(before_path, width, height, 'RGB') as before_writer, \
+         StreamingPNGWriter(after_path, width, height, 'L') as after_writer, \
+         StreamingPNGWriter(debug_path, width, height, 'RGB') as debug_writer:
+
+        for y0 in range(0, height, band_height):
+            y1 = min(height, y0 + band_height)
+            band_size = (width, y1 - y0)
+            band_glyphs = glyph_index.intersecting(y0, y1)
+
+            # --- "after": mask band, grown with a halo so seams stay exact ---
+            halo_y0 = max(0, y0 - grow)
+            halo_y1 = min(height, y1 + grow)
+            mask_rows = _surface_rows(_render_mask_band(glyph_index, width, halo_y0, halo_y1), 'L')
+            mask_rows = grow_mask(mask_rows, grow)[y0 - halo_y0:y1 - halo_y0]
+            after_writer.write_rows(mask_rows)
+
+            # --- "before": background rows with the text overlay composited on top ---
+            overlay_band = pygame.Surface(band_size, pygame.SRCALPHA)
+            for glyph in band_glyphs:
+                overlay_band.blit(glyph.overlay_surf, glyph.rect.move(0, -y0))
+            overlay_rows = np.frombuffer(pygame.image.tobytes(overlay_band, 'RGBA'), dtype=np.uint8).reshape(y1 - y0, width, 4)
+            base_rows = np.array(original_image.crop((0, y0, width, y1)).convert('RGB'))
+            composite_over(base_rows, overlay_rows)
+            before_writer.write_rows(base_rows)
+
+            # --- "debug": before band with the mask at 70% opacity ---
+            tint_with_mask(base_rows, mask_rows)
+            debug_writer.write_rows(base_rows)
+
+    return True
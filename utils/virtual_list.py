@@ -0,0 +1,47 @@
+class VirtualListLayout:
+    """
+    Geometry of a virtualized list: `item_count` rows of `row_height` pixels with
+    `row_gap` between them, scrolled inside a viewport of `viewport_height`.
+
+    Only `pool_size` row widgets are needed however long the list is: enough to
+    cover the viewport plus a partially visible row at each edge. Item i is always
+    shown by pool slot i % pool_size, so scrolling by one row only refills the
+    slot whose item scrolled in.
+    """
+
+    def __init__(self, item_count, row_height, row_gap, viewport_height):
+        self.item_count = item_count
+        self.row_height = row_height
+        self.pitch = row_height + row_gap
+        self.viewport_height = viewport_height
+        self.content_height = max(0, item_count * self.pitch - row_gap)
+        self.pool_size = min(item_count, viewport_height // self.pitch + 2)
+
+    @property
+    def max_offset(self):
+        return max(0, self.content_height - self.viewport_height)
+
+    @property
+    def visible_fraction(self):
+        """Share of the content the viewport shows, for sizing a scroll bar."""
+        if self.content_height <= self.viewport_height:
+            return 1.0
+        return self.viewport_height / self.content_height
+
+    def clamp(self, offset):
+        return max(0, min(int(offset), self.max_offset))
+
+    def visible(self, offset):
+        """(item index, pool slot, y relative to the viewport) of the rows showing at scroll `offset`."""
+        offset = self.clamp(offset)
+        first = offset // self.pitch
+        last = min(self.item_count, first + self.pool_size)
+        return [(index, index % self.pool_size, index * self.pitch - offset) for index in range(first, last)]
+
+    def idle_slots(self, offset):
+        """
+        Pool slots showing no item at scroll `offset` (near the end of the list fewer
+        rows than the pool may be visible); their widgets should be hidden.
+        """
+        used = {slot for _, slot, _ in self.visible(offset)}
+        return [slot for slot in range(self.pool_size) if slot not in used]
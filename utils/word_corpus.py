@@ -0,0 +1,217 @@
+import glob
+import hashlib
+import json
+import mmap
+import os
+import random
+import threading
+import numpy as np
+from utils.word_index import DEFAULT_CHAR_WIDTH
+
+# Index format; files with another version are rebuilt
+WORD_CORPUS_INDEX_VERSION = 1
+# Lines longer than this (in characters) are left out of the index
+MAX_WORD_LENGTH = 64
+# Bytes scanned at a time while building the index; bounds its memory use
+SCAN_CHUNK_BYTES = 4 * 1024 * 1024
+# Bytes read to look up one word: the longest indexed word in UTF-8 plus a '\r\n'
+MAX_LINE_BYTES = MAX_WORD_LENGTH * 4 + 2
+
+
+def _file_key(path):
+    stat = os.stat(path)
+    return [stat.st_mtime, stat.st_size]
+
+
+def _scan_chunks(data):
+    """
+    Yields (line start offsets, line lengths in characters, chunk bytes) for each
+    chunk of a newline-separated UTF-8 buffer, cutting chunks at line ends. Lengths
+    count UTF-8 lead bytes only and ignore a trailing '\\r'.
+    """
+    size = len(data)
+    start = 0
+    while start < size:
+        end = min(size, start + SCAN_CHUNK_BYTES)
+        if end < size:
+            cut = data.rfind(b'\n', start, end)
+            end = cut + 1 if cut >= start else data.find(b'\n', end) + 1 or size
+        chunk = np.frombuffer(data, dtype=np.uint8, count=end - start, offset=start)
+        newlines = np.flatnonzero(chunk == 10)
+        if not len(newlines) or newlines[-1] != len(chunk) - 1:
+            newlines = np.append(newlines, len(chunk))  # Last line without a newline
+        line_starts = np.concatenate(([0], newlines[:-1] + 1))
+        if chunk.max() < 0x80:
+            lengths = newlines - line_starts
+        else:
+            # Characters before each position, so a line's length is a difference of two lookups
+            chars = np.concatenate(([0], np.cumsum((chunk & 0xC0) != 0x80, dtype=np.int32)))
+            lengths = (chars[newlines] - chars[line_starts]).astype(np.int64)
+        carriage_return = chunk[np.maximum(newlines - 1, 0)] == 13
+        lengths -= carriage_return & (newlines > line_starts)
+        yield line_starts + start, lengths, data[start:end]
+        start = end
+
+
+class WordCorpus:
+    """
+    A large word list sampled straight from a text file, one word per line.
+
+    The words are never loaded as Python objects. A one-off scan of the mapped
+    file writes an index to the cache: the byte offsets of the lines, grouped by
+    word length, and the number of words up to each length, so
+    `sample(max_chars=n)` is a random offset lookup and a read of one line (the
+    same interface as WordIndex). The offsets are memory-mapped too, so startup
+    memory does not grow with the corpus.
+
+    Index files are named after the corpus file's mtime and size, so a changed
+    corpus gets a new index instead of overwriting one an older WordCorpus still
+    has mapped. Words are read with plain file reads rather than through the
+    mapping, so rewriting the corpus in place cannot crash (SIGBUS) an instance
+    still sampling it; it only returns stale words until it is replaced.
+
+    Words are uppercased when drawn; duplicates and weights are not supported.
+    """
+
+    def __init__(self, path, cache_dir):
+        self.path = path
+        self.key = _file_key(path)
+        self._prefix = os.path.join(cache_dir, hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest())
+        version = hashlib.sha1(json.dumps(self.key).encode('utf-8')).hexdigest()[:16]
+        self.meta_path = f"{self._prefix}-{version}.json"
+        self.offsets_path = f"{self._prefix}-{version}.npy"
+        self.rebuilt = False
+
+        self._file = open(path, 'rb')
+        self._read_lock = threading.Lock()
+        meta = self._load_meta()
+        if meta is None:
+            with mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.key[1] else memoryview(b'') as data:
+                meta = self._build_index(data)
+            self._remove_stale_indexes()
+            self.rebuilt = True
+        self._ends = meta['ends']
+        self.charset = frozenset(meta['charset'])
+        self.max_length = len(self._ends) - 1
+        self._offsets = np.load(self.offsets_path, mmap_mode='r') if self._ends[-1] else np.zeros(0, dtype=np.uint64)
+
+    def _load_meta(self):
+        try:
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get('version') != WORD_CORPUS_INDEX_VERSION or meta.get('key') != self.key:
+            return None
+        if meta['ends'][-1] and not os.path.isfile(self.offsets_path):
+            return None
+        return meta
+
+    def _build_index(self, data):
+        """Two streaming passes: count the words per length, then write their offsets grouped by length."""
+        counts = np.zeros(MAX_WORD_LENGTH + 1, dtype=np.int64)
+        charset = set()
+        for _, lengths, chunk in _scan_chunks(data):
+            counts += np.bincount(lengths[(lengths > 0) & (lengths <= MAX_WORD_LENGTH)], minlength=MAX_WORD_LENGTH + 1)
+            charset.update(chunk.decode('utf-8', errors='ignore').upper())
+        charset -= set('\r\n')
+        ends = np.cumsum(counts)
+
+        os.makedirs(os.path.dirname(self.meta_path) or '.', exist_ok=True)
+        if ends[-1]:
+            # Written under a temporary name so a reader never maps a half-written index
+            tmp_offsets_path = f"{self.offsets_path[:-4]}.tmp.npy"
+            offsets = np.lib.format.open_memmap(tmp_offsets_path, mode='w+', dtype=np.uint64, shape=(int(ends[-1]),))
+            # Next free slot per length
+            cursor = ends - counts
+            for starts, lengths, _ in _scan_chunks(data):
+                keep = (lengths > 0) & (lengths <= MAX_WORD_LENGTH)
+                starts, lengths = starts[keep], lengths[keep]
+                order = np.argsort(lengths, kind='stable')
+                starts, lengths = starts[order], lengths[order]
+                per_length = np.bincount(lengths, minlength=MAX_WORD_LENGTH + 1)
+                first = np.concatenate(([0], np.cumsum(per_length)[:-1]))
+                slots = cursor[lengths] + np.arange(len(lengths)) - first[lengths]
+                offsets[slots] = starts
+                cursor += per_length
+            offsets.flush()
+            del offsets
+            os.replace(tmp_offsets_path, self.offsets_path)
+
+        # Trailing lengths without words are dropped, so max_length is the longest word
+        last = int(np.flatnonzero(counts)[-1]) if ends[-1] else 0
+        meta = {
+            'version': WORD_CORPUS_INDEX_VERSION,
+            'key': self.key,
+            'ends': [int(end) for end in ends[:last + 1]],
+            'charset': ''.join(sorted(charset)),
+        }
+        tmp_path = f"{self.meta_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self.meta_path)
+        return meta
+
+    def _remove_stale_indexes(self):
+        """
+        Deletes the index files of earlier versions of the corpus. An older instance
+        still mapping them keeps its data (on POSIX the mapping outlives the file);
+        files that cannot be removed (e.g. still open on Windows) are left for later.
+        """
+        for stale in glob.glob(f"{glob.escape(self._prefix)}-*"):
+            if stale not in (self.meta_path, self.offsets_path):
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+
+    def __len__(self):
+        return self._ends[-1]
+
+    def word_at(self, i):
+        """The i-th indexed word (words are ordered by length)."""
+        start = int(self._offsets[i])
+        with self._read_lock:
+            self._file.seek(start)
+            line = self._file.read(MAX_LINE_BYTES)
+        return line.split(b'\n', 1)[0].decode('utf-8', errors='replace').strip().upper()
+
+    def max_chars(self, width, size, char_width=DEFAULT_CHAR_WIDTH):
+        """Longest word, in characters, estimated to fit `width` pixels at font `size`."""
+        return int(width / (size * char_width))
+
+    def count_fitting(self, max_chars):
+        """Number of words with at most `max_chars` characters."""
+        if max_chars < 0:
+            return 0
+        return self._ends[min(max_chars, self.max_length)]
+
+    def sample(self, rng=random, max_chars=None):
+        """
+        A random word of at most `max_chars` characters (any length if None), or one
+        of the shortest words if none is that short. Returns None for an empty corpus.
+        """
+        if not len(self):
+            return None
+        end = len(self) if max_chars is None else self.count_fitting(max_chars)
+        if end == 0:
+            end = next(count for count in self._ends if count)
+        return self.word_at(rng.randrange(end))
+
+
+_corpora = {}
+_corpora_lock = threading.Lock()
+
+def load_word_corpus(path, cache_dir):
+    """
+    The WordCorpus of `path`, opened once per file version; concurrent callers wait
+    for the first one to build the index instead of scanning the corpus twice.
+    Earlier versions are forgotten here (callers still holding one keep using it).
+    """
+    with _corpora_lock:
+        path_key = os.path.abspath(path)
+        corpus = _corpora.get(path_key)
+        if corpus is None or corpus.key != _file_key(path):
+            corpus = WordCorpus(path, cache_dir)
+            _corpora[path_key] = corpus
+        return corpus
@@ -0,0 +1,71 @@
+import random
+from bisect import bisect_right
+from itertools import accumulate
+
+# Average advance of an uppercase character as a fraction of the font size, used
+# when the fonts' own metrics are not known yet
+DEFAULT_CHAR_WIDTH = 0.65
+
+
+def estimated_width(word, size, char_width=DEFAULT_CHAR_WIDTH):
+    """Rough rendered width in pixels of `word` at font `size`."""
+    return len(word) * size * char_width
+
+
+class WordIndex:
+    """
+    Words ordered by character count, for drawing words that fit a width budget.
+
+    `sample(max_chars=n)` draws among the words of at most n characters without
+    scanning the list: the words are sorted by length once, and the number of
+    words up to each length is precomputed. Draws are uniform unless per-word
+    `weights` (category weights, see WordsLoader.build_index) are given, in which
+    case the draw is a binary search over the cumulative weights of the fitting
+    prefix.
+    """
+
+    def __init__(self, words, weights=None):
+        order = sorted(range(len(words)), key=lambda i: len(words[i]))
+        self.words = [words[i] for i in order]
+        self.max_length = len(self.words[-1]) if self.words else 0
+        # _ends[n] = number of words with at most n characters
+        self._ends = [0] * (self.max_length + 1)
+        for word in self.words:
+            self._ends[len(word)] += 1
+        self._ends = list(accumulate(self._ends))
+        self._cumulative = None
+        if weights is not None and len(set(weights)) > 1:
+            self._cumulative = list(accumulate(max(0.0, weights[i]) for i in order))
+
+    def __len__(self):
+        return len(self.words)
+
+    def max_chars(self, width, size, char_width=DEFAULT_CHAR_WIDTH):
+        """Longest word, in characters, estimated to fit `width` pixels at font `size`."""
+        return int(width / (size * char_width))
+
+    def count_fitting(self, max_chars):
+        """Number of words with at most `max_chars` characters."""
+        if max_chars < 0:
+            return 0
+        return self._ends[min(max_chars, self.max_length)]
+
+    def sample(self, rng=random, max_chars=None):
+        """
+        A random word of at most `max_chars` characters (any length if None). If no
+        word is that short, one of the shortest words is returned for the caller's
+        sizing to shrink. Returns None when the index is empty or every candidate
+        word has a zero weight.
+        """
+        if not self.words:
+            return None
+        end = len(self.words) if max_chars is None else self.count_fitting(max_chars)
+        if end == 0:
+            end = self._ends[len(self.words[0])]
+
+        if self._cumulative is not None:
+            if self._cumulative[end - 1] <= 0:
+                return None
+            i = bisect_right(self._cumulative, rng.random() * self._cumulative[end - 1], 0, end)
+            return self.words[min(i, end - 1)]
+        return self.words[rng.randrange(end)]
@@ -1,6 +1,7 @@
 import os
 import json
 from typing import List, Dict, Optional
+from utils.word_index import WordIndex
 
 class WordsLoader:
     """Handles loading words from a single JSON file with fallback to config."""
@@ -8,6 +9,8 @@ class WordsLoader:
     def __init__(self, filepath: str = "words.json"):
         self.filepath = filepath
         self.words = []
+        # Category of each word (the first one it appears in); nested categories are named "parent.child"
+        self.word_categories = {}
         self.load_words()
     
     def load_words(self, fallback_words: Optional[List[str]] = None):
@@ -20,6 +23,7 @@ class WordsLoader:
                     self.words = fallback_words
                 else:
                     self.words = []
+                self.word_categories = {word: 'fallback' for word in self.words}
                 return
 
             with open(self.filepath, 'r', encoding='utf-8') as file:
@@ -35,6 +39,7 @@ class WordsLoader:
                 self.words = fallback_words
             else:
                 self.words = []
+            self.word_categories = {word: 'fallback' for word in self.words}
     
     def _parse_words(self, data: Dict[str, List[str]]) -> List[str]:
         """Parse words from the JSON data, combining all categories."""
@@ -42,26 +47,27 @@ class WordsLoader:
         
         if not isinstance(data, dict):
             print("Warning: Invalid JSON structure. Root should be a dictionary.")
+            self.word_categories = {}
             return []
         
         for category, words in data.items():
             if isinstance(words, list):
-                all_words.extend([word.upper() for word in words])
+                all_words.extend([(word.upper(), category) for word in words])
             elif isinstance(words, dict):
                 # Handle nested categories
                 for sub_category, sub_words in words.items():
                     if isinstance(sub_words, list):
-                        all_words.extend([word.upper() for word in sub_words])
+                        all_words.extend([(word.upper(), f"{category}.{sub_category}") for word in sub_words])
             else:
                 print(f"Warning: Category '{category}' does not contain a list or dictionary")
         
-        # Remove duplicates while preserving order
+        # Remove duplicates while preserving order; a word keeps its first category
         unique_words = []
-        seen = set()
-        for word in all_words:
-            if word not in seen:
+        self.word_categories = {}
+        for word, category in all_words:
+            if word not in self.word_categories:
                 unique_words.append(word)
-                seen.add(word)
+                self.word_categories[word] = category
         
         return unique_words
     
@@ -69,6 +75,22 @@ class WordsLoader:
         """Get the loaded words."""
         return self.words
     
+    def category_weight(self, category: str, category_weights: Dict[str, float]) -> float:
+        """Weight of a category; nested categories fall back to their parent's weight, then 1.0."""
+        if category in category_weights:
+            return category_weights[category]
+        return category_weights.get(category.split('.', 1)[0], 1.0)
+    
+    def build_index(self, category_weights: Optional[Dict[str, float]] = None) -> WordIndex:
+        """
+        Index of the loaded words by length for width-aware sampling. Each word is
+        drawn with the weight of its category (1.0 unless given in `category_weights`).
+        """
+        weights = None
+        if category_weights:
+            weights = [self.category_weight(self.word_categories.get(word, ''), category_weights) for word in self.words]
+        return WordIndex(self.words, weights)
+    
     def reload_words(self, fallback_words: Optional[List[str]] = None):
         """Reload words from the JSON file."""
         print("Reloading words...")
@@ -81,6 +103,10 @@ def get_words() -> List[str]:
     """Get the global words list."""
     return words_loader.get_words()
 
+def get_word_index(category_weights: Optional[Dict[str, float]] = None) -> WordIndex:
+    """Build a sampling index over the global words list."""
+    return words_loader.build_index(category_weights)
+
 def reload_words(fallback_words: Optional[List[str]] = None):
     """Reload the global words list."""
     words_loader.reload_words(fallback_words) 
\ No newline at end of file